@@ -0,0 +1,128 @@
+"""
+Measure how long a wallpaper switch takes in the main window (offscreen QPA).
+
+Usage:
+    python benchmarks/bench_background_switch.py [--switches N] [--cards N]
+
+"stylesheet" replays the old approach, where the background-image was
+appended to STYLESHEET and set on the main window, restyling every child.
+"renderer" goes through MainWindow.update_background_image and the
+pre-scaled BackgroundRenderer, measured both cold (first scale at this
+size) and warm (frame cached). Each switch is timed until the window has
+been repainted. The mod browser is filled with --cards result cards so the
+restyle cost is realistic.
+
+Runs against a throwaway HOME so no real launcher data is touched.
+"""
+import argparse
+import os
+
+from harness import isolate, median_ms, qt_app, spin_until
+
+isolate()
+
+import time
+
+from PyQt6.QtGui import QColor, QImage
+
+
+def make_wallpapers(directory, count, width, height):
+    paths = []
+    for i in range(count):
+        image = QImage(width, height, QImage.Format.Format_RGB32)
+        image.fill(QColor.fromHsv(i * 360 // count, 160, 200))
+        path = os.path.join(directory, f"wallpaper_{i}.jpg")
+        image.save(path, quality=90)
+        paths.append(path)
+    return paths
+
+
+def legacy_css(path):
+    return f"""
+        QMainWindow {{
+            background-image: url('{path.replace(os.sep, "/")}');
+            background-position: center;
+            background-repeat: no-repeat;
+            background-attachment: fixed;
+        }} """
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--switches", type=int, default=10)
+    parser.add_argument("--cards", type=int, default=60)
+    parser.add_argument("--wallpaper-size", default="3840x2160")
+    args = parser.parse_args(argv)
+    width, height = (int(v) for v in args.wallpaper_size.split("x"))
+
+    app = qt_app()
+
+    from pymcl.main import check_dirs
+    from pymcl.constants import IMAGES_DIR
+    check_dirs()
+    wallpapers = make_wallpapers(IMAGES_DIR, 3, width, height)
+
+    from pymcl.main_window import MainWindow
+    from pymcl.stylesheet import STYLESHEET
+
+    window = MainWindow()
+    window.resize(1280, 720)
+    window.show()
+    window.mod_browser_page.search_results = [
+        {"project_id": str(i), "slug": f"mod-{i}", "title": f"Mod {i}", "downloads": i}
+        for i in range(args.cards)
+    ]
+    window.mod_browser_page.populate_results()
+    window.image_files = wallpapers
+    renderer = window.background
+
+    def frame_shown():
+        return (
+            renderer.pixmap is not None
+            and renderer.frames.get((renderer.path, renderer.size.width(), renderer.size.height(), renderer.ratio)) is renderer.pixmap
+        )
+
+    window.update_background_image()
+    spin_until(frame_shown)
+
+    # Old: rebuild and re-apply the whole stylesheet per switch
+    legacy = []
+    for i in range(args.switches):
+        start = time.perf_counter()
+        window.setStyleSheet(STYLESHEET + legacy_css(wallpapers[i % len(wallpapers)]))
+        app.processEvents()
+        window.grab()
+        legacy.append(time.perf_counter() - start)
+    window.apply_styles()
+    app.processEvents()
+
+    def renderer_switches(clear):
+        samples = []
+        for _ in range(args.switches):
+            if clear:
+                renderer.clear()
+            start = time.perf_counter()
+            window.update_background_image()
+            spin_until(frame_shown)
+            window.grab()
+            samples.append(time.perf_counter() - start)
+        return samples
+
+    cold = renderer_switches(clear=True)
+    warm = renderer_switches(clear=False)
+
+    results = {
+        "stylesheet_ms": median_ms(legacy),
+        "renderer_cold_ms": median_ms(cold),
+        "renderer_warm_ms": median_ms(warm),
+    }
+    print(f"wallpaper {width}x{height}, window 1280x720, {args.cards} mod cards, median of {args.switches}")
+    for name, value in results.items():
+        print(f"  {name:<18} {value:8.2f} ms")
+
+    window.close()
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Throughput for many small objects over the HTTP/1.1 pool vs the HTTP/2 transport.
+
+Usage:
+    python benchmarks/bench_http2.py [--objects N] [--threads N] [--latency S] [--rounds N]
+
+Imitates an icon grid or asset install: --objects small PNGs fetched from
+--threads threads against a local server with --latency seconds of server
+time per request. "http1" is the pooled requests transport against
+MockServer; "http2" is the httpx transport speaking h2c with prior
+knowledge to a local h2 server, so every thread's requests are
+multiplexed over one connection. Needs httpx and h2 (pip install
+httpx[http2]); without them the benchmark is skipped.
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from harness import isolate, median_ms
+
+isolate()
+
+import time
+
+from mock_server import MockServer
+
+
+def fetch_all(request, urls, threads):
+    def get(url):
+        response = request("GET", url)
+        response.raise_for_status()
+        return len(response.content)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return sum(pool.map(get, urls))
+
+
+def measure(server, request, objects, threads, rounds):
+    urls = [f"{server.url}/icons/{i}.png" for i in range(objects)]
+    fetch_all(request, urls[:threads], threads) # warm up connections
+    start_connections = server.connections
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fetch_all(request, urls, threads)
+        samples.append(time.perf_counter() - start)
+    elapsed_ms = median_ms(samples)
+    return {
+        "elapsed_ms": elapsed_ms,
+        "objects_per_s": objects / (elapsed_ms / 1000),
+        "new_connections": server.connections - start_connections,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.02, help="server time per request, seconds")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    from pymcl.net import Http11Transport, Http2Transport, http2_available
+    from pymcl.net.http import USER_AGENT, POOL_HOSTS, POOL_CONNECTIONS_PER_HOST
+
+    if not http2_available():
+        print("httpx/h2 not installed, skipping (pip install httpx[http2])")
+        return {}
+    from h2_server import H2Server
+
+    headers = {"User-Agent": USER_AGENT}
+    results = {}
+    with MockServer(latency=args.latency, icons=args.objects, icon_size=64) as server:
+        transport = Http11Transport(POOL_HOSTS, POOL_CONNECTIONS_PER_HOST, headers)
+        results["http1"] = measure(server, transport.request, args.objects, args.threads, args.rounds)
+        transport.close()
+    with H2Server(latency=args.latency, icons=args.objects, icon_size=64) as server:
+        transport = Http2Transport(POOL_HOSTS * POOL_CONNECTIONS_PER_HOST, headers, prior_knowledge=True)
+        results["http2"] = measure(server, transport.request, args.objects, args.threads, args.rounds)
+        transport.close()
+
+    print(f"{args.objects} objects, {args.threads} threads, {args.latency * 1000:.0f} ms server latency, median of {args.rounds}")
+    for name, result in results.items():
+        print(f"  {name:<6} {result['elapsed_ms']:8.1f} ms  {result['objects_per_s']:8.0f} objects/s  {result['new_connections']:3d} new connections")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Connections opened and time taken to fetch a batch of icons, bare requests.get vs the shared pool.
+
+Usage:
+    python benchmarks/bench_http_pool.py [--icons N] [--threads N] [--rounds N]
+
+"bare" is how the image downloaders used to fetch: one requests.get per
+icon, each on a fresh connection. "pooled" goes through pymcl.net's
+http_client, where every worker thread shares one keep-alive pool. Both
+fetch --icons icons from --threads threads, --rounds times, against the
+local mock server, which counts accepted TCP connections. Over loopback a
+connection is cheap; against a real CDN each one also costs a TLS
+handshake, so the connection count is the number to watch.
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from harness import isolate, median_ms
+
+isolate()
+
+import time
+
+from mock_server import MockServer
+
+
+def fetch_all(get, urls, threads):
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for response in pool.map(get, urls):
+            response.raise_for_status()
+            response.content
+
+
+def measure(server, get, urls, threads, rounds):
+    samples = []
+    start_connections = server.connections
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fetch_all(get, urls, threads)
+        samples.append(time.perf_counter() - start)
+    return median_ms(samples), server.connections - start_connections
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--icons", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    import requests
+    from pymcl.net import http_client
+
+    with MockServer(icons=args.icons, icon_size=64) as server:
+        urls = [f"{server.url}/icons/{i}.png" for i in range(args.icons)]
+        bare_ms, bare_connections = measure(server, requests.get, urls, args.threads, args.rounds)
+        pooled_ms, pooled_connections = measure(server, http_client.get, urls, args.threads, args.rounds)
+
+    results = {
+        "bare_ms": bare_ms,
+        "pooled_ms": pooled_ms,
+        "bare_connections": bare_connections,
+        "pooled_connections": pooled_connections,
+    }
+    print(f"{args.icons} icons x {args.rounds} rounds on {args.threads} threads")
+    print(f"  bare requests.get  {bare_ms:8.1f} ms  {bare_connections:5d} connections")
+    print(f"  shared pool        {pooled_ms:8.1f} ms  {pooled_connections:5d} connections")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Single-flight downloads and the failure cache of the shared image fetcher.
+
+Usage:
+    python benchmarks/bench_image_fetch.py [--callers N] [--latency S] [--negative-ttl S]
+
+--callers ImageCaches ask for the same image while its download is still
+running; the mock server, which counts requests per path, must see exactly
+one, and every caller must be told the result. Then a URL that answers
+404 is asked for again: inside the failure window it must not reach the
+server, after the window it must. The window is shortened to
+--negative-ttl seconds so the run stays quick. A failed check raises.
+"""
+import argparse
+
+from harness import isolate, qt_app, spin_until
+
+isolate()
+
+import time
+
+from mock_server import MockServer, make_png
+
+
+def check(condition, message):
+    if not condition:
+        raise RuntimeError(message)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--callers", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.1, help="mock server delay per request, seconds")
+    parser.add_argument("--negative-ttl", type=float, default=1.0, help="failure cache window, seconds")
+    args = parser.parse_args(argv)
+
+    qt_app()
+    import pymcl.image_cache as image_cache
+    from pymcl.image_cache import ImageCache
+
+    image_cache.NEGATIVE_CACHE_SECONDS = args.negative_ttl
+    # Unique per run, so an in-process suite run never finds them cached
+    run = f"{time.time_ns():x}"
+    image_path = f"/images/{run}.png"
+    missing_path = f"/missing/{run}.png"
+
+    with MockServer(latency=args.latency, files={image_path: make_png(64, (200, 60, 60))}) as server:
+        # Coalescing: every caller asks before the first download can finish
+        caches = [ImageCache() for _ in range(args.callers)]
+        answers = []
+        for cache in caches:
+            cache.image_downloaded.connect(lambda url, path: answers.append(path))
+        start = time.perf_counter()
+        for cache in caches:
+            cache.download_image(server.url + image_path)
+        spin_until(lambda: len(answers) == args.callers)
+        settle = time.perf_counter() - start
+        requests = server.hits.get(image_path, 0)
+        check(requests == 1, f"{args.callers} callers made {requests} requests for one image")
+        check(all(answers), "a caller was told the download failed")
+
+        # Failure cache: a 404 isn't retried inside the window, but is after it
+        failures = []
+        cache = caches[0]
+        cache.image_downloaded.connect(lambda url, path: failures.append(path) if url.endswith(missing_path) else None)
+
+        def request_missing():
+            expected = len(failures) + 1
+            cache.download_image(server.url + missing_path)
+            spin_until(lambda: len(failures) == expected)
+
+        request_missing()
+        request_missing()
+        within_window = server.hits.get(missing_path, 0)
+        check(within_window == 1, f"a failed URL was requested {within_window} times inside the failure window")
+        check(not any(failures), "a 404 was reported as a download")
+
+        time.sleep(args.negative_ttl)
+        request_missing()
+        after_window = server.hits.get(missing_path, 0)
+        check(after_window == 2, f"a failed URL was requested {after_window - 1} times after the window expired")
+
+        for cache in caches:
+            cache.deleteLater()
+
+    results = {
+        "callers": args.callers,
+        "requests": requests,
+        "settle_ms": settle * 1000,
+        "failed_requests_in_window": within_window,
+        "failed_requests_after_window": after_window,
+    }
+    print(f"{args.callers} callers for one image, {args.latency * 1000:.0f} ms mock latency")
+    print(f"  {'requests':<30} {requests:8d}")
+    print(f"  {'settle_ms':<30} {settle * 1000:8.1f} ms")
+    print(f"  {'404 requests, 2 asks in window':<30} {within_window:8d}")
+    print(f"  {'404 requests, after expiry':<30} {after_window:8d}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
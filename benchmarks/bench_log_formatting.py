@@ -0,0 +1,70 @@
+"""
+Microbenchmark: per-call cost of the logger on hot paths.
+
+Usage:
+    python benchmarks/bench_log_formatting.py [--calls N]
+
+"gated" is a debug() call below the logger's level (the common case for
+per-file/per-hash diagnostics); "formatted" renders every message into a
+handler that discards it.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pymcl.logger import Handler, Logger, LogLevel
+
+
+class NullHandler(Handler):
+    def emit(self, formatted_message):
+        pass
+
+    def write(self, formatted_message):
+        pass
+
+
+def per_call_ns(fn, calls):
+    start = time.perf_counter()
+    fn(calls)
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    logger = Logger("pymcl.mods", LogLevel.INFO)
+    logger.add_handler(NullHandler())
+    path, sha1 = "example-mod-1.2.3.jar", "0123456789abcdef0123456789abcdef01234567"
+
+    def gated_lazy(n):
+        debug = logger.debug
+        for _ in range(n):
+            debug("Hashed %s: %s", path, sha1)
+
+    def gated_fstring(n):
+        debug = logger.debug
+        for _ in range(n):
+            debug(f"Hashed {path}: {sha1}")
+
+    def formatted(n):
+        info = logger.info
+        for _ in range(n):
+            info("Hashed %s: %s", path, sha1)
+
+    results = {
+        "gated_lazy_ns": per_call_ns(gated_lazy, args.calls),
+        "gated_fstring_ns": per_call_ns(gated_fstring, args.calls),
+        "formatted_ns": per_call_ns(formatted, args.calls),
+    }
+    for name, value in results.items():
+        print(f"{name:18} {value:>10.1f} ns/call")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Microbenchmark: messages per second for FileHandler vs AsyncFileHandler.
+
+Usage:
+    python benchmarks/bench_log_handlers.py [--messages N] [--threads T]
+
+"caller" is the rate seen by the code doing the logging; "drained" also
+counts the time needed until every message is on disk.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pymcl.logger import AsyncFileHandler, FileHandler
+
+MESSAGE = "[2024-01-01 12:00:00.000] [INFO    ] [pymcl.mods] [MainThread] Hashed example-mod-1.2.3.jar: 0123456789abcdef0123456789abcdef01234567"
+
+
+def run_handler(handler, messages, threads):
+    per_thread = messages // threads
+
+    def work():
+        write = handler.write
+        for _ in range(per_thread):
+            write(MESSAGE)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    caller = time.perf_counter() - start
+    handler.close()
+    drained = time.perf_counter() - start
+    total = per_thread * threads
+    return {"caller_msgs_per_s": total / caller, "drained_msgs_per_s": total / drained}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50000)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        results["FileHandler"] = run_handler(FileHandler(os.path.join(tmp, "sync.log")), args.messages, args.threads)
+        results["AsyncFileHandler"] = run_handler(AsyncFileHandler(os.path.join(tmp, "async.log")), args.messages, args.threads)
+
+    for name, result in results.items():
+        print(f"{name:18} caller: {result['caller_msgs_per_s']:>12,.0f} msg/s   drained: {result['drained_msgs_per_s']:>12,.0f} msg/s")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Time to fetch a batch of files from a slow upstream vs through mirrors with one of them down.
+
+Usage:
+    python benchmarks/bench_mirrors.py [--files N] [--threads N] [--latency S] [--rounds N]
+
+"upstream" fetches --files icons straight from a local server that takes
+--latency seconds per request, standing in for the internet. "mirrored"
+fetches the same URLs through pymcl.net with two mirrors configured for
+that upstream: a dead address listed first and a fast local server, so
+the first requests have to fail over, the dead mirror gets skipped and
+the latency probe ranks the fast one ahead of the upstream. "session"
+repeats that through a plain requests.Session, the way
+minecraft_launcher_lib downloads, relying on the adapter hook. served_by
+counts the requests each server answered.
+"""
+import argparse
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+from harness import isolate, median_ms
+
+isolate()
+
+import time
+
+from mock_server import MockServer
+
+
+def unused_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+def fetch_all(get, urls, threads):
+    def fetch(url):
+        response = get(url, timeout=(2, 10))
+        response.raise_for_status()
+        return len(response.content)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return sum(pool.map(fetch, urls))
+
+
+def measure(get, urls, threads, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fetch_all(get, urls, threads)
+        samples.append(time.perf_counter() - start)
+    return median_ms(samples)
+
+
+def hits(server):
+    return sum(server.hits.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05, help="upstream time per request, seconds")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    import requests
+    from pymcl.net import http_client, mirror_registry, install_mirrors
+
+    results = {}
+    with MockServer(latency=args.latency, icons=args.files, icon_size=64) as upstream, \
+            MockServer(icons=args.files, icon_size=64) as mirror:
+        urls = [f"{upstream.url}/icons/{i}.png" for i in range(args.files)]
+        results["upstream_ms"] = measure(http_client.get, urls, args.threads, args.rounds)
+
+        mirror_registry.configure({upstream.url: [unused_url(), mirror.url]})
+        group = mirror_registry.match(urls[0])
+        before = (hits(upstream), hits(mirror))
+        results["mirrored_ms"] = measure(http_client.get, urls, args.threads, args.rounds)
+        results["mirrored_served_by"] = {
+            "upstream": hits(upstream) - before[0],
+            "mirror": hits(mirror) - before[1],
+        }
+
+        install_mirrors()
+        session = requests.Session()
+        before = (hits(upstream), hits(mirror))
+        results["session_ms"] = measure(session.get, urls, args.threads, args.rounds)
+        results["session_served_by"] = {
+            "upstream": hits(upstream) - before[0],
+            "mirror": hits(mirror) - before[1],
+        }
+        ranking = [(m.base, m.latency, m.failures) for m in group.candidates()]
+        mirror_registry.configure({})
+
+    print(f"{args.files} files x {args.rounds} rounds on {args.threads} threads, upstream latency {args.latency * 1000:.0f} ms")
+    print(f"  upstream only   {results['upstream_ms']:8.1f} ms")
+    for name in ("mirrored", "session"):
+        served = results[f"{name}_served_by"]
+        print(f"  {name:<15} {results[name + '_ms']:8.1f} ms  (mirror {served['mirror']}, upstream {served['upstream']})")
+    print("  mirror ranking:")
+    for base, latency, failures in ranking:
+        latency = "unprobed" if latency is None else f"{latency * 1000:.1f} ms"
+        print(f"    {base:<28} {latency:>10}  {failures} failures")
+    return results
+
+
+if __name__ == "__main__":
+    main()
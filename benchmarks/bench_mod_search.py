@@ -0,0 +1,74 @@
+"""
+Search-to-render latency of the mod browser against the mock Modrinth API.
+
+Usage:
+    python benchmarks/bench_mod_search.py [--searches N] [--limit N] [--latency S]
+
+"cards" is the time from starting a search until every result card is in
+the grid; "icons" runs until every card also shows its icon. The first
+search runs with an empty icon cache ("cold"), later ones reuse it.
+"""
+import argparse
+
+from harness import isolate, median_ms, qt_app, spin_until
+
+isolate()
+
+import time
+
+from mock_server import MockServer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--searches", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.02, help="mock server delay per request, seconds")
+    args = parser.parse_args(argv)
+
+    qt_app()
+    from pymcl.modrinth_client import ModrinthClient
+    from pymcl.mod_browser import ModBrowserPage
+    from pymcl.widgets import ModListItem
+
+    with MockServer(latency=args.latency) as server:
+        ModrinthClient.BASE_URL = server.modrinth_url
+        page = ModBrowserPage()
+        page.resize(1000, 700)
+        page.show()
+        page.limit_spinbox.setValue(args.limit)
+
+        def cards():
+            layout = page.results_layout
+            return [layout.itemAt(i).widget() for i in range(layout.count())
+                    if isinstance(layout.itemAt(i).widget(), ModListItem)]
+
+        def search(query):
+            page.search_input.blockSignals(True)
+            page.search_input.setText(query)
+            page.search_input.blockSignals(False)
+            start = time.perf_counter()
+            page.start_search()
+            spin_until(lambda: page.search_button.isEnabled() and len(cards()) == args.limit)
+            to_cards = time.perf_counter() - start
+            spin_until(lambda: all(c.icon_label.pixmap() is not None and not c.icon_label.pixmap().isNull() for c in cards()))
+            return to_cards, time.perf_counter() - start
+
+        cold_cards, cold_icons = search("cold")
+        warm = [search(f"query{i}") for i in range(args.searches)]
+
+    results = {
+        "cold_cards_ms": cold_cards * 1000,
+        "cold_icons_ms": cold_icons * 1000,
+        "warm_cards_ms": median_ms([w[0] for w in warm]),
+        "warm_icons_ms": median_ms([w[1] for w in warm]),
+    }
+    print(f"search -> {args.limit} cards / icons, {args.latency * 1000:.0f} ms mock latency")
+    for name, value in results.items():
+        print(f"  {name:<16} {value:8.1f} ms")
+    page.close()
+    return results
+
+
+if __name__ == "__main__":
+    main()
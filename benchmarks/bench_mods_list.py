@@ -0,0 +1,69 @@
+"""
+Time to populate the installed-mods list at increasing jar counts.
+
+Usage:
+    python benchmarks/bench_mods_list.py [--counts 10,100,1000] [--repeat N]
+
+Jars are small but valid zip files with a fabric.mod.json. "populate" is
+ModsPage.populate_mods_list(); "painted" additionally includes processing
+the events needed to show the list.
+"""
+import argparse
+import json
+import os
+import zipfile
+
+from harness import isolate, median_ms, qt_app
+
+isolate()
+
+import time
+
+
+def make_jars(directory, count):
+    for name in os.listdir(directory):
+        if name.endswith(".jar"):
+            os.remove(os.path.join(directory, name))
+    for i in range(count):
+        with zipfile.ZipFile(os.path.join(directory, f"bench-mod-{i:04d}.jar"), "w") as jar:
+            jar.writestr("fabric.mod.json", json.dumps({"id": f"bench_mod_{i}", "version": "1.0.0", "name": f"Bench Mod {i}"}))
+            jar.writestr("bench/Mod.class", os.urandom(2048))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", default="10,100,1000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    counts = [int(c) for c in args.counts.split(",")]
+
+    app = qt_app()
+    from pymcl.constants import MODS_DIR
+    from pymcl.mod_manager import ModsPage
+
+    os.makedirs(MODS_DIR, exist_ok=True)
+    page = ModsPage()
+    page.resize(900, 700)
+    page.show()
+
+    results = {}
+    for count in counts:
+        make_jars(MODS_DIR, count)
+        populate, painted = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            page.populate_mods_list()
+            populate.append(time.perf_counter() - start)
+            app.processEvents()
+            page.grab()
+            painted.append(time.perf_counter() - start)
+        results[f"populate_{count}_ms"] = median_ms(populate)
+        results[f"painted_{count}_ms"] = median_ms(painted)
+        print(f"  {count:>5} jars: populate {results[f'populate_{count}_ms']:8.1f} ms, painted {results[f'painted_{count}_ms']:8.1f} ms")
+
+    page.close()
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Internet traffic and time for a room of fresh installs, with and without a LAN peer cache.
+
+Usage:
+    python benchmarks/bench_peer_cache.py [--clients N] [--files N] [--size KIB] [--latency S] [--threads N]
+
+Each of --clients launchers needs the same --files content-addressed
+objects of --size KiB, laid out like the Mojang asset store. "internet"
+has every client download everything from a local server with --latency
+seconds per request standing in for the internet. "peers" has the first
+client do that, then serves its directory with a PeerServer. The other
+clients go through a PeerCache pointed at it and only fall back to the
+"internet" for files the peer doesn't have. Every file is checked against
+its sha1 either way. internet_mib is what crossed the "internet" link.
+"""
+import argparse
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from harness import isolate
+
+isolate()
+
+import time
+
+from mock_server import MockServer
+
+
+def make_objects(count, size):
+    objects = {}
+    for i in range(count):
+        data = os.urandom(size)
+        objects[hashlib.sha1(data).hexdigest()] = data
+    return objects
+
+
+def install(client_dir, objects, upstream, http, threads, cache=None):
+    """Fetch every object into client_dir, from cache first if given; returns files from peers."""
+    def fetch(sha1):
+        path = os.path.join(client_dir, "assets", "objects", sha1[:2], sha1)
+        if cache is not None and cache.download(sha1, path) is not None:
+            return 1
+        response = http.get(f"{upstream.url}/{sha1[:2]}/{sha1}")
+        response.raise_for_status()
+        if hashlib.sha1(response.content).hexdigest() != sha1:
+            raise ValueError(f"checksum mismatch for {sha1}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(response.content)
+        return 0
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return sum(pool.map(fetch, objects))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--size", type=int, default=64, help="KiB per file")
+    parser.add_argument("--latency", type=float, default=0.03, help="internet time per request, seconds")
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    from pymcl.net import http_client, PeerServer, PeerCache
+
+    objects = make_objects(args.files, args.size * 1024)
+    files = {f"/{sha1[:2]}/{sha1}": data for sha1, data in objects.items()}
+    root = tempfile.mkdtemp(prefix="peer-bench-")
+    results = {}
+    with MockServer(latency=args.latency, icons=1, files=files) as upstream:
+        start = time.perf_counter()
+        for i in range(args.clients):
+            install(os.path.join(root, "internet", str(i)), objects, upstream, http_client, args.threads)
+        results["internet"] = {
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+            "internet_mib": upstream.bytes_sent / (1024 * 1024),
+            "from_peers": 0,
+        }
+
+        upstream.bytes_sent = 0
+        start = time.perf_counter()
+        first = os.path.join(root, "peers", "0")
+        install(first, objects, upstream, http_client, args.threads)
+        roots = [(os.path.join(first, "assets", "objects"), None)]
+        with PeerServer(port=0, discovery_port=None, roots=roots, host="127.0.0.1") as server:
+            # Misses don't wait for the index; build it before the clients ask
+            server.index.scan()
+            cache = PeerCache(enabled=True, peers=[f"127.0.0.1:{server.port}"], discovery=False)
+            from_peers = 0
+            for i in range(1, args.clients):
+                from_peers += install(os.path.join(root, "peers", str(i)), objects, upstream, http_client, args.threads, cache)
+        results["peers"] = {
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+            "internet_mib": upstream.bytes_sent / (1024 * 1024),
+            "from_peers": from_peers,
+        }
+
+    print(f"{args.clients} clients x {args.files} files of {args.size} KiB, {args.latency * 1000:.0f} ms internet latency")
+    for name, result in results.items():
+        print(f"  {name:<9} {result['elapsed_ms']:8.1f} ms  {result['internet_mib']:7.1f} MiB from the internet  {result['from_peers']:5d} files from peers")
+    return results
+
+
+if __name__ == "__main__":
+    main()
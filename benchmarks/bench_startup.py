@@ -0,0 +1,78 @@
+"""
+Startup time to first paint, cold and warm, via `main.py --profile-startup`.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+
+Each run is a fresh interpreter on the offscreen platform with its own
+HOME. "cold" is the first start against an empty data directory; "warm"
+is the median of the following starts once settings and caches exist.
+Per-phase timings of the last warm run are included as well.
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from harness import REPO_ROOT
+from mock_server import MockServer
+
+PHASE_LINE = re.compile(r"^\s{2}(\s*)(.+?)\s+([\d.]+) ms$")
+
+
+def run_once(home):
+    env = dict(os.environ, HOME=home, QT_QPA_PLATFORM="offscreen")
+    output = subprocess.run(
+        [sys.executable, os.path.join(REPO_ROOT, "main.py"), "--profile-startup"],
+        cwd=home, env=env, capture_output=True, text=True, timeout=120,
+    ).stdout
+
+    phases = {}
+    for line in output.splitlines():
+        match = PHASE_LINE.match(line)
+        if match:
+            phases[match.group(2)] = float(match.group(3))
+    if "total (to first paint)" not in phases:
+        raise RuntimeError("no startup profile in output:\n" + output)
+    return phases
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="warm runs after the cold one")
+    args = parser.parse_args(argv)
+
+    home = tempfile.mkdtemp(prefix="pymcl-bench-startup-")
+    try:
+        # Ship a wallpaper so no run tries to download the default one
+        images_dir = os.path.join(home, ".pymcl-data", "images")
+        os.makedirs(images_dir)
+        shutil.copy(os.path.join(REPO_ROOT, "default_background.jpg"), images_dir)
+
+        with MockServer() as server:
+            # The launcher reads pymcl/config/settings.json relative to its cwd
+            os.makedirs(os.path.join(home, "pymcl", "config"))
+            with open(os.path.join(home, "pymcl", "config", "settings.json"), "w") as f:
+                json.dump({"version_manifest_url": server.manifest_url}, f)
+
+            cold = run_once(home)
+            warm_runs = [run_once(home) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+    warm_totals = sorted(run["total (to first paint)"] for run in warm_runs)
+    results = {
+        "cold_ms": cold["total (to first paint)"],
+        "warm_ms": warm_totals[len(warm_totals) // 2],
+        "warm_phases_ms": warm_runs[-1],
+    }
+    print(f"startup to first paint: cold {results['cold_ms']:.1f} ms, warm {results['warm_ms']:.1f} ms (median of {args.runs})")
+    return results
+
+
+if __name__ == "__main__":
+    main()
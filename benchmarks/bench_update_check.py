@@ -0,0 +1,80 @@
+"""
+Mod update check and jar hashing throughput.
+
+Usage:
+    python benchmarks/bench_update_check.py [--jars N] [--jar-kb N] [--hash-mb N]
+
+"update_check" runs UpdateCheckerWorker end to end (hash every jar in the
+mods folder, one bulk request to the mock Modrinth API). "hash" measures
+the raw SHA-1 throughput of the same hashing routine on one large file.
+"""
+import argparse
+import os
+
+from harness import isolate, median_ms, qt_app
+
+isolate()
+
+import time
+
+from mock_server import MockServer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jars", type=int, default=200)
+    parser.add_argument("--jar-kb", type=int, default=256)
+    parser.add_argument("--hash-mb", type=int, default=128)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    qt_app()
+    from pymcl.constants import MODS_DIR
+    from pymcl.modrinth_client import ModrinthClient
+    from pymcl.workers import UpdateCheckerWorker
+    from pymcl.net.peers import sha1_file
+
+    os.makedirs(MODS_DIR, exist_ok=True)
+    for name in os.listdir(MODS_DIR):
+        if name.endswith(".jar"):
+            os.remove(os.path.join(MODS_DIR, name))
+    for i in range(args.jars):
+        with open(os.path.join(MODS_DIR, f"update-mod-{i:04d}.jar"), "wb") as f:
+            f.write(os.urandom(args.jar_kb * 1024))
+
+    with MockServer() as server:
+        ModrinthClient.BASE_URL = server.modrinth_url
+        worker = UpdateCheckerWorker(ModrinthClient())
+        found = {}
+        worker.finished.connect(found.update)
+
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            worker.run()
+            samples.append(time.perf_counter() - start)
+
+    big_file = os.path.join(MODS_DIR, "hash-target.bin")
+    with open(big_file, "wb") as f:
+        chunk = os.urandom(1024 * 1024)
+        for _ in range(args.hash_mb):
+            f.write(chunk)
+    hash_samples = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        sha1_file(big_file)
+        hash_samples.append(time.perf_counter() - start)
+    os.remove(big_file)
+
+    results = {
+        "update_check_ms": median_ms(samples),
+        "updates_found": len(found),
+        "hash_mb_per_s": args.hash_mb / (median_ms(hash_samples) / 1000),
+    }
+    print(f"update check, {args.jars} jars x {args.jar_kb} KB: {results['update_check_ms']:.1f} ms ({results['updates_found']} updates)")
+    print(f"sha1 throughput: {results['hash_mb_per_s']:.0f} MB/s")
+    return results
+
+
+if __name__ == "__main__":
+    main()
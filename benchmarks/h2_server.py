@@ -0,0 +1,144 @@
+"""
+Minimal HTTP/2 (h2c, prior knowledge) server for the transport benchmark.
+
+Serves the same small PNG objects as MockServer at /icons/<n>.png, with an
+optional per-request latency that, unlike a blocking HTTP/1.1 handler,
+doesn't hold up other streams on the same connection. Needs the h2 package
+(pip install h2); accepted connections are counted in server.connections.
+"""
+import socket
+import threading
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.exceptions
+
+from mock_server import make_png
+
+
+class H2Server:
+    def __init__(self, latency=0.0, icons=16, icon_size=64):
+        self.latency = latency
+        self.icons = [make_png(icon_size, (40 + i * 12 % 200, 90, 160)) for i in range(icons)]
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.sock = socket.create_server(("127.0.0.1", 0))
+        self.thread = threading.Thread(target=self._accept, daemon=True)
+        self._running = False
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.sock.getsockname()[1]}"
+
+    def start(self):
+        self._running = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        self.sock.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _accept(self):
+        while self._running:
+            try:
+                client, _ = self.sock.accept()
+            except OSError:
+                return
+            with self._lock:
+                self.connections += 1
+            threading.Thread(target=_Connection(self, client).serve, daemon=True).start()
+
+    def body_for(self, path):
+        if path.startswith("/icons/"):
+            index = int(path[len("/icons/"):].split(".")[0]) % len(self.icons)
+            return 200, self.icons[index]
+        return 404, b""
+
+
+class _Connection:
+    """One client connection; responses may be sent from timer threads."""
+
+    def __init__(self, server, sock):
+        self.server = server
+        self.sock = sock
+        self.lock = threading.Lock()
+        self.conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        self.pending = {} # stream id -> body bytes not yet sent
+
+    def serve(self):
+        with self.lock:
+            self.conn.initiate_connection()
+            self._send()
+        try:
+            while True:
+                data = self.sock.recv(65536)
+                if not data:
+                    return
+                with self.lock:
+                    events = self.conn.receive_data(data)
+                    for event in events:
+                        if isinstance(event, h2.events.RequestReceived):
+                            self._schedule(event.stream_id, dict(event.headers)[":path"])
+                        elif isinstance(event, h2.events.StreamReset):
+                            self.pending.pop(event.stream_id, None)
+                        elif isinstance(event, h2.events.ConnectionTerminated):
+                            return
+                    self._flush()
+                    self._send()
+        except (OSError, h2.exceptions.ProtocolError):
+            pass
+        finally:
+            self.sock.close()
+
+    def _schedule(self, stream_id, path):
+        with self.server._lock:
+            self.server.requests += 1
+        if self.server.latency:
+            threading.Timer(self.server.latency, self._respond, (stream_id, path)).start()
+        else:
+            self._respond(stream_id, path, locked=True)
+
+    def _respond(self, stream_id, path, locked=False):
+        status, body = self.server.body_for(path)
+        headers = [(":status", str(status)), ("content-type", "image/png"), ("content-length", str(len(body)))]
+        if locked:
+            self.conn.send_headers(stream_id, headers)
+            self.pending[stream_id] = body
+            return
+        with self.lock:
+            try:
+                self.conn.send_headers(stream_id, headers)
+                self.pending[stream_id] = body
+                self._flush()
+                self._send()
+            except (OSError, h2.exceptions.ProtocolError):
+                pass
+
+    def _flush(self):
+        # Send as much of every pending body as the flow-control windows allow
+        for stream_id in list(self.pending):
+            body = self.pending[stream_id]
+            window = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+            while body and window > 0:
+                chunk, body = body[:window], body[window:]
+                self.conn.send_data(stream_id, chunk)
+                window = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+            if body:
+                self.pending[stream_id] = body
+            else:
+                self.conn.end_stream(stream_id)
+                del self.pending[stream_id]
+
+    def _send(self):
+        data = self.conn.data_to_send()
+        if data:
+            self.sock.sendall(data)
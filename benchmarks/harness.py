@@ -0,0 +1,61 @@
+"""
+Shared setup for the benchmark scripts.
+
+isolate() must run before anything from pymcl is imported: pymcl resolves
+its data directories and settings file at import time, so the benchmarks
+point HOME and the working directory at a throwaway directory to keep real
+launcher data out of reach. Qt is forced onto the offscreen platform.
+"""
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+_home = None
+_app = None
+
+
+def isolate():
+    """Point HOME/cwd at a temp dir and make the repo importable. Idempotent."""
+    global _home
+    if _home is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        _home = tempfile.mkdtemp(prefix="pymcl-bench-")
+        os.environ["HOME"] = _home
+        os.chdir(_home)
+        if REPO_ROOT not in sys.path:
+            sys.path.insert(0, REPO_ROOT)
+    return _home
+
+
+def qt_app():
+    """Return the QApplication, creating (and keeping a reference to) it once."""
+    global _app
+    if _app is None:
+        from PyQt6.QtWidgets import QApplication
+        _app = QApplication.instance() or QApplication(sys.argv[:1])
+    return _app
+
+
+def spin_until(condition, timeout=30.0):
+    """Process Qt events until condition() is true; raises TimeoutError."""
+    app = qt_app()
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("condition not met within %.0f s" % timeout)
+        app.processEvents()
+
+
+def spin(seconds):
+    app = qt_app()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+
+
+def median_ms(samples):
+    samples = sorted(samples)
+    return samples[len(samples) // 2] * 1000
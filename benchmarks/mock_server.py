@@ -0,0 +1,219 @@
+"""
+Local stand-in for the Modrinth API and the Mojang version manifest.
+
+Serves deterministic data from a background thread so the benchmarks run
+without network access and without depending on live API latency:
+
+    GET  /v2/search                      search hits with icon URLs
+    GET  /v2/project/<slug>              project with a markdown body
+    GET  /v2/project/<id>/version        one version per project
+    POST /v2/version_files/update        an update for every other hash
+    GET  /icons/<n>.png                  small PNG icons
+    GET  /mc/game/version_manifest_v2.json   manifest (ETag / If-None-Match)
+    GET  <any path in files>             the bytes given for it
+
+Every request is counted per path in server.hits and every accepted TCP
+connection in server.connections. latency adds a fixed delay per request
+to imitate a remote server. HEAD of any path answers an empty 200 after
+the same delay, without counting a hit.
+"""
+import json
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def make_png(size, rgb):
+    """Encode a solid-color RGB PNG without needing Qt or Pillow."""
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    row = b"\x00" + bytes(rgb) * size
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * size))
+        + chunk(b"IEND", b"")
+    )
+
+
+def make_manifest(versions):
+    entries = []
+    for i in range(versions):
+        kind = "release" if i % 4 == 0 else "snapshot"
+        version_id = f"1.{versions - i}" if kind == "release" else f"{i:02d}w{i % 50:02d}a"
+        entries.append({
+            "id": version_id,
+            "type": kind,
+            "url": f"https://piston-meta.mojang.com/v1/packages/{i:040x}/{version_id}.json",
+            "time": "2024-01-01T00:00:00+00:00",
+            "releaseTime": "2024-01-01T00:00:00+00:00",
+            "sha1": f"{i:040x}",
+            "complianceLevel": 1,
+        })
+    return {"latest": {"release": entries[0]["id"], "snapshot": entries[1]["id"]}, "versions": entries}
+
+
+class MockServer:
+    def __init__(self, latency=0.0, icons=16, icon_size=256, manifest_versions=800, files=None):
+        self.latency = latency
+        self.files = files or {}
+        self.bytes_sent = 0
+        self.hits = {}
+        self.connections = 0
+        self._lock = threading.Lock()
+        self.icons = [make_png(icon_size, (40 + i * 12 % 200, 90, 160)) for i in range(icons)]
+        self.manifest = json.dumps(make_manifest(manifest_versions)).encode("utf-8")
+        self.manifest_etag = '"%08x"' % zlib.crc32(self.manifest)
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                # One handler instance per connection; keep-alive requests reuse it
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+            def do_HEAD(self):
+                # Latency probes; not counted in hits
+                if server.latency:
+                    time.sleep(server.latency)
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    @property
+    def modrinth_url(self):
+        return self.url + "/v2"
+
+    @property
+    def manifest_url(self):
+        return self.url + "/mc/game/version_manifest_v2.json"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handle(self, request, method):
+        parsed = urlparse(request.path)
+        path = parsed.path
+        with self._lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        body = b""
+        if method == "POST":
+            length = int(request.headers.get("Content-Length", 0))
+            body = request.rfile.read(length)
+
+        if path == "/v2/search":
+            self._json(request, self._search(parse_qs(parsed.query)))
+        elif path == "/v2/version_files/update" and method == "POST":
+            hashes = json.loads(body or b"{}").get("hashes", [])
+            self._json(request, {h: self._version(h) for h in hashes[::2]})
+        elif path.startswith("/v2/project/") and path.endswith("/version"):
+            project_id = path.split("/")[3]
+            self._json(request, [self._version(project_id)])
+        elif path.startswith("/v2/project/"):
+            self._json(request, self._project(path.split("/")[3]))
+        elif path.startswith("/icons/"):
+            index = int(path[len("/icons/"):].split(".")[0]) % len(self.icons)
+            self._send(request, 200, self.icons[index], "image/png")
+        elif path in self.files:
+            with self._lock:
+                self.bytes_sent += len(self.files[path])
+            self._send(request, 200, self.files[path], "application/octet-stream")
+        elif path == "/mc/game/version_manifest_v2.json":
+            if request.headers.get("If-None-Match") == self.manifest_etag:
+                self._send(request, 304, b"", None, {"ETag": self.manifest_etag})
+            else:
+                self._send(request, 200, self.manifest, "application/json", {"ETag": self.manifest_etag})
+        else:
+            self._send(request, 404, b"", None)
+
+    def _search(self, query):
+        limit = int(query.get("limit", ["20"])[0])
+        term = query.get("query", [""])[0]
+        hits = []
+        for i in range(limit):
+            hits.append({
+                "project_id": f"{term}-{i}",
+                "slug": f"{term}-{i}",
+                "title": f"{term.title()} Mod {i}",
+                "description": "Benchmark fixture",
+                "downloads": 1000 * (limit - i),
+                "icon_url": f"{self.url}/icons/{i}.png",
+            })
+        return {"hits": hits, "offset": 0, "limit": limit, "total_hits": limit}
+
+    def _project(self, slug):
+        images = "\n\n".join(f"![screenshot]({self.url}/icons/{i}.png)" for i in range(6))
+        body = f"# {slug}\n\n" + "Some *markdown* text.\n\n" * 20 + images
+        return {"id": slug, "slug": slug, "title": slug, "body": body}
+
+    def _version(self, key):
+        return {
+            "id": f"v-{key[:8]}",
+            "project_id": key,
+            "version_number": "2.0.0",
+            "files": [{"url": f"{self.url}/files/{key[:8]}.jar", "filename": f"{key[:8]}.jar", "primary": True}],
+        }
+
+    def _json(self, request, payload):
+        self._send(request, 200, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _send(self, request, status, data, content_type, headers=None):
+        request.send_response(status)
+        if content_type:
+            request.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.send_header("Content-Length", str(len(data)))
+        request.end_headers()
+        if data:
+            request.wfile.write(data)
+
+
+if __name__ == "__main__":
+    with MockServer() as server:
+        print(f"Mock Modrinth API at {server.modrinth_url}")
+        print(f"Mock version manifest at {server.manifest_url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
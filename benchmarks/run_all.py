@@ -0,0 +1,136 @@
+"""
+Run the benchmark suite headless and write the results to JSON.
+
+Usage:
+    python benchmarks/run_all.py [--output results.json] [--quick]
+                                 [--only startup,mod_search,...]
+                                 [--compare previous.json] [--threshold 10]
+
+Qt runs on the offscreen platform and all network traffic goes to a local
+mock Modrinth/Mojang server, so results only depend on the machine. With
+--compare, every metric is checked against an earlier results file; timings
+(*_ms, *_ns) that grew or throughputs (*_per_s) that shrank by more than
+--threshold percent are reported as regressions and the exit status is 1.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+
+from harness import REPO_ROOT, isolate
+
+# name -> (module, full-run args, --quick args). Ordered so the benchmark that
+# builds a whole MainWindow runs last.
+BENCHMARKS = {
+    "startup": ("bench_startup", [], ["--runs", "2"]),
+    "mod_search": ("bench_mod_search", [], ["--searches", "2"]),
+    "image_fetch": ("bench_image_fetch", [], ["--callers", "20", "--negative-ttl", "0.5"]),
+    "mods_list": ("bench_mods_list", [], ["--counts", "10,100", "--repeat", "1"]),
+    "update_check": ("bench_update_check", [], ["--jars", "50", "--hash-mb", "32", "--repeat", "1"]),
+    "http_pool": ("bench_http_pool", [], ["--icons", "50", "--rounds", "1"]),
+    "http2": ("bench_http2", [], ["--objects", "100", "--rounds", "1"]),
+    "mirrors": ("bench_mirrors", [], ["--files", "50", "--rounds", "1"]),
+    "peer_cache": ("bench_peer_cache", [], ["--clients", "3", "--files", "50"]),
+    "log_formatting": ("bench_log_formatting", [], ["--calls", "50000"]),
+    "log_handlers": ("bench_log_handlers", [], ["--messages", "20000"]),
+    "background_switch": ("bench_background_switch", [], ["--switches", "3"]),
+}
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(results, prefix=""):
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + "/"))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(previous, current, threshold):
+    """Print per-metric changes; return the list of regressed metric names."""
+    old, new = flatten(previous["results"]), flatten(current["results"])
+    regressions = []
+    print(f"\nCompared with {previous.get('revision') or 'previous run'} ({previous.get('timestamp')}):")
+    for name in sorted(new):
+        if name not in old or not old[name]:
+            continue
+        change = (new[name] - old[name]) / old[name] * 100
+        if name.endswith(("_ms", "_ns")):
+            worse = change > threshold
+        elif name.endswith("_per_s"):
+            worse = change < -threshold
+        else:
+            continue
+        marker = "  REGRESSION" if worse else ""
+        print(f"  {name:<48} {old[name]:>12.2f} -> {new[name]:>12.2f} ({change:+6.1f}%){marker}")
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--quick", action="store_true", help="smaller workloads, for a fast smoke run")
+    parser.add_argument("--only", help="comma separated subset of: " + ", ".join(BENCHMARKS))
+    parser.add_argument("--compare", help="earlier results file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent change counted as a regression")
+    args = parser.parse_args(argv)
+
+    # Resolve user paths before isolate() moves the working directory
+    output = os.path.abspath(args.output)
+    previous = None
+    if args.compare:
+        with open(os.path.abspath(args.compare), "r") as f:
+            previous = json.load(f)
+
+    selected = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        parser.error("unknown benchmark(s): " + ", ".join(unknown))
+
+    isolate()
+    report = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": args.quick,
+        "results": {},
+    }
+
+    for name in selected:
+        module_name, full_args, quick_args = BENCHMARKS[name]
+        print(f"== {name}")
+        module = __import__(module_name)
+        try:
+            report["results"][name] = module.main(quick_args if args.quick else full_args)
+        except Exception as e:
+            print(f"   failed: {e}")
+            report["results"][name] = {"error": str(e)}
+
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if previous is not None and compare(previous, report, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
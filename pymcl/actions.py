@@ -30,10 +30,14 @@ class ActionHandler:
         self.nav_browse_mods_action.setShortcut(QKeySequence("Ctrl+3"))
         self.nav_browse_mods_action.triggered.connect(lambda: self.main_window.switch_page(2, self.main_window.nav_browse_mods_button))
 
+        self.nav_logs_action = QAction("Go to Logs Page", self.main_window)
+        self.nav_logs_action.setShortcut(QKeySequence("Ctrl+5"))
+        self.nav_logs_action.triggered.connect(lambda: self.main_window.switch_page(4, self.main_window.nav_logs_button))
+
         # Mod manager actions
         self.refresh_mods_action = QAction("Refresh Mods List", self.main_window)
         self.refresh_mods_action.setShortcut(QKeySequence("F5"))
-        self.refresh_mods_action.triggered.connect(self.main_window.mods_page.populate_mods_list)
+        self.refresh_mods_action.triggered.connect(lambda: self.main_window.mods_page.populate_mods_list())
 
         # Other actions
         self.quit_action = QAction("Quit", self.main_window)
@@ -52,6 +56,7 @@ class ActionHandler:
         menu.addAction(self.nav_mods_action)
         menu.addAction(self.nav_browse_mods_action)
         menu.addAction(self.nav_settings_action)
+        menu.addAction(self.nav_logs_action)
         menu.addSeparator()
         menu.addAction(self.quit_action)
         return menu
@@ -85,11 +90,12 @@ class ActionHandler:
         navigate_menu.addAction(self.nav_mods_action)
         navigate_menu.addAction(self.nav_browse_mods_action)
         navigate_menu.addAction(self.nav_settings_action)
+        navigate_menu.addAction(self.nav_logs_action)
 
         # Mods Menu
         mods_menu = menu_bar.addMenu("&Mods")
         mods_menu.addAction(self.refresh_mods_action)
-        mods_menu.addAction(QAction("Open Mods Folder", self.main_window, triggered=self.main_window.mods_page.open_mods_folder))
+        mods_menu.addAction(QAction("Open Mods Folder", self.main_window, triggered=lambda: self.main_window.mods_page.open_mods_folder()))
 
         # Tools Menu
         tools_menu = menu_bar.addMenu("&Tools")
@@ -106,6 +112,7 @@ def setup_actions_and_menus(main_window):
         handler.nav_mods_action,
         handler.nav_browse_mods_action,
         handler.nav_settings_action,
+        handler.nav_logs_action,
         handler.quit_action,
         handler.refresh_mods_action
     ])
@@ -121,10 +128,12 @@ def setup_actions_and_menus(main_window):
     main_window.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
     main_window.customContextMenuRequested.connect(show_main_context_menu)
 
-    # Mods page context menu
+
+def install_mods_context_menu(handler, mods_page):
+    """Hook up the mods list context menu; called when the mods page is first built."""
     def show_mods_context_menu(pos):
         menu = handler.create_mods_context_menu()
-        menu.exec(main_window.mods_page.mod_list_widget.mapToGlobal(pos))
+        menu.exec(mods_page.mod_list_widget.mapToGlobal(pos))
 
-    main_window.mods_page.mod_list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-    main_window.mods_page.mod_list_widget.customContextMenuRequested.connect(show_mods_context_menu)
+    mods_page.mod_list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+    mods_page.mod_list_widget.customContextMenuRequested.connect(show_mods_context_menu)
@@ -0,0 +1,146 @@
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt, QObject, QRect, QRunnable, QSize, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage, QPixmap
+
+from .logger import get_logger
+
+logger = get_logger("pymcl.ui")
+
+# Scaled frames kept around, keyed by (path, width, height, device pixel ratio)
+MAX_CACHED_FRAMES = 4
+# Wait for the window to stop resizing before rescaling
+RESIZE_DEBOUNCE_MS = 150
+
+
+class BackgroundScaleTask(QRunnable):
+    """Decode a wallpaper and scale/crop it to fill a given size off the GUI thread."""
+
+    def __init__(self, renderer, path, size, ratio):
+        super().__init__()
+        self.renderer = renderer
+        self.path = path
+        self.size = size
+        self.ratio = ratio
+
+    def run(self):
+        image = QImage(self.path)
+        if image.isNull():
+            logger.warning("Could not decode background image %s", self.path)
+            self.renderer.frame_scaled.emit(self.path, self.size, self.ratio, QImage())
+            return
+
+        width = max(1, round(self.size.width() * self.ratio))
+        height = max(1, round(self.size.height() * self.ratio))
+        image = image.scaled(
+            width, height,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        # Crop to the target, centered, like background-position: center
+        image = image.copy((image.width() - width) // 2, (image.height() - height) // 2, width, height)
+        image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(self.ratio)
+        self.renderer.frame_scaled.emit(self.path, self.size, self.ratio, image)
+
+
+class BackgroundRenderer(QObject):
+    """
+    Paints the window wallpaper without going through the stylesheet.
+
+    Each wallpaper is decoded and scaled to the window size on a worker
+    thread and cached per size and pixel ratio, so switching images or repainting
+    only blits a ready pixmap. While a new size is being prepared the last
+    frame is stretched with a fast transform.
+    """
+
+    changed = pyqtSignal()
+    frame_scaled = pyqtSignal(str, QSize, float, QImage) # emitted from worker threads
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.path = None
+        self.size = QSize()
+        self.ratio = 1.0
+        self.pixmap = None
+        self.frames = OrderedDict()
+        self.pending = set()
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.frame_scaled.connect(self._on_frame_scaled)
+
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
+        self.resize_timer.timeout.connect(self._request_current)
+
+    def set_image(self, path):
+        self.path = path
+        self._request_current()
+
+    def prepare(self, path):
+        """Scale path for the current size ahead of time, e.g. the next slideshow image."""
+        if path and self.size.isValid():
+            self._request(path, self.size)
+
+    def resize(self, size, ratio=1.0):
+        self.size = QSize(size)
+        self.ratio = ratio
+        self.resize_timer.start()
+
+    def _request_current(self):
+        if not self.path or not self.size.isValid() or self.size.isEmpty():
+            return
+        frame = self._frame(self.path, self.size, self.ratio)
+        if frame is not None:
+            self._show(frame)
+        else:
+            self._request(self.path, self.size)
+
+    def _frame(self, path, size, ratio):
+        key = (path, size.width(), size.height(), ratio)
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.frames.move_to_end(key)
+        return frame
+
+    def _request(self, path, size):
+        key = (path, size.width(), size.height(), self.ratio)
+        if key in self.frames or key in self.pending:
+            return
+        self.pending.add(key)
+        self.pool.start(BackgroundScaleTask(self, path, QSize(size), self.ratio))
+
+    @pyqtSlot(str, QSize, float, QImage)
+    def _on_frame_scaled(self, path, size, ratio, image):
+        key = (path, size.width(), size.height(), ratio)
+        self.pending.discard(key)
+        if image.isNull():
+            return
+
+        frame = QPixmap.fromImage(image)
+        self.frames[key] = frame
+        self.frames.move_to_end(key)
+        while len(self.frames) > MAX_CACHED_FRAMES:
+            self.frames.popitem(last=False)
+
+        if path == self.path and size == self.size and ratio == self.ratio:
+            self._show(frame)
+
+    def _show(self, frame):
+        self.pixmap = frame
+        self.changed.emit()
+
+    def clear(self):
+        self.frames.clear()
+        self.pixmap = None
+
+    def paint(self, painter, rect):
+        if self.pixmap is None:
+            return
+        if self.pixmap.deviceIndependentSize().toSize() == rect.size():
+            painter.drawPixmap(rect.topLeft(), self.pixmap)
+        else:
+            # Stale frame during a resize; the exact one is on its way
+            painter.drawPixmap(QRect(rect), self.pixmap)
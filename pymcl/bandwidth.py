@@ -0,0 +1,202 @@
+import time
+import threading
+from contextlib import contextmanager
+
+from .settings_store import settings_store
+from .logger import get_logger
+
+logger = get_logger("pymcl.net")
+
+# Traffic classes. Threads are foreground unless they opt into background.
+FOREGROUND, BACKGROUND = "foreground", "background"
+# Default limits in KiB/s; 0 means unlimited
+DEFAULT_LIMITS = {FOREGROUND: 0, BACKGROUND: 1024}
+SETTINGS_KEYS = {FOREGROUND: "foreground_bandwidth_kbps", BACKGROUND: "background_bandwidth_kbps"}
+# How much unused allowance a bucket may save up
+BURST_SECONDS = 0.5
+# How often held background transfers recheck for cancellation
+HOLD_POLL_SECONDS = 0.5
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at rate bytes per second, holding at most
+    BURST_SECONDS worth of tokens.
+
+    reserve() always takes the tokens and returns how long the caller has to
+    sleep to pay back any deficit, so concurrent callers queue up fairly
+    without the bucket holding a lock while they wait. A rate of 0 disables
+    limiting.
+    """
+
+    def __init__(self, rate=0):
+        self._lock = threading.Lock()
+        self.rate = 0
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+        self.set_rate(rate)
+
+    def set_rate(self, rate):
+        with self._lock:
+            self.rate = max(0, rate)
+            self.tokens = min(self.tokens, self.capacity)
+
+    @property
+    def capacity(self):
+        return self.rate * BURST_SECONDS
+
+    def reserve(self, count):
+        with self._lock:
+            if not self.rate:
+                return 0.0
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= count
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class BandwidthLimiter:
+    """
+    Per-class token buckets with foreground priority.
+
+    Every downloaded chunk goes through throttle(), which charges the bucket
+    of the calling thread's traffic class. Background transfers additionally
+    stop between chunks while any foreground_activity() is open (a launch
+    install or a mod download), so they never compete with something the
+    user is waiting for.
+    """
+
+    def __init__(self, limits=None):
+        limits = dict(DEFAULT_LIMITS, **(limits or {}))
+        self.buckets = {cls: TokenBucket(kbps * 1024) for cls, kbps in limits.items()}
+        self._local = threading.local()
+        self._cond = threading.Condition()
+        self._active = 0
+
+    def configure(self, foreground_kbps=None, background_kbps=None):
+        for cls, kbps in ((FOREGROUND, foreground_kbps), (BACKGROUND, background_kbps)):
+            if kbps is not None:
+                self.buckets[cls].set_rate(max(0, int(kbps)) * 1024)
+        logger.debug(
+            "Bandwidth limits: foreground %s KiB/s, background %s KiB/s",
+            self.limit(FOREGROUND) or "unlimited", self.limit(BACKGROUND) or "unlimited",
+        )
+
+    def limit(self, cls):
+        """Current limit of cls in KiB/s, 0 if unlimited."""
+        return self.buckets[cls].rate // 1024
+
+    def current_class(self):
+        return getattr(self._local, "cls", FOREGROUND)
+
+    @contextmanager
+    def priority(self, cls, cancel=None):
+        """
+        Run the body's transfers on this thread in traffic class cls.
+        cancel is an optional threading.Event that cuts throttling waits short.
+        """
+        previous = (self.current_class(), getattr(self._local, "cancel", None))
+        self._local.cls, self._local.cancel = cls, cancel
+        try:
+            yield
+        finally:
+            self._local.cls, self._local.cancel = previous
+
+    @contextmanager
+    def foreground_activity(self):
+        """Hold all background transfers for the duration of the body."""
+        with self._cond:
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def throttle(self, count):
+        """Account for count bytes just received on this thread, sleeping as needed."""
+        if count <= 0:
+            return
+        cls = self.current_class()
+        cancel = getattr(self._local, "cancel", None)
+        if cls == BACKGROUND:
+            with self._cond:
+                while self._active and not (cancel and cancel.is_set()):
+                    self._cond.wait(HOLD_POLL_SECONDS)
+
+        delay = self.buckets[cls].reserve(count)
+        if delay > 0:
+            if cancel is not None:
+                cancel.wait(delay)
+            else:
+                time.sleep(delay)
+
+
+def _limits_from_settings():
+    return {cls: settings_store.get(key, DEFAULT_LIMITS[cls]) for cls, key in SETTINGS_KEYS.items()}
+
+
+limiter = BandwidthLimiter(_limits_from_settings())
+
+
+def _on_setting_changed(key, value):
+    if key in SETTINGS_KEYS.values():
+        limiter.configure(**{f"{cls}_kbps": v for cls, v in _limits_from_settings().items()})
+
+
+settings_store.add_listener(_on_setting_changed)
+
+
+_install_lock = threading.Lock()
+_installed = False
+
+
+def install():
+    """
+    Route every requests download in the process through the limiter.
+
+    minecraft_launcher_lib creates its own sessions and reads response.raw
+    directly, so the hook sits on HTTPAdapter.build_response: each response
+    body is charged, chunk by chunk, to the class of the thread reading it.
+    Safe to call more than once; requests is imported on first call.
+    """
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        # Import the package first: taking requests.adapters directly from a
+        # worker while the GUI thread is still importing requests can trip
+        # the import deadlock detection and hand back a half-built module
+        import requests
+
+        HTTPAdapter = requests.adapters.HTTPAdapter
+        build_response = HTTPAdapter.build_response
+
+        def throttled_build_response(adapter, req, resp):
+            response = build_response(adapter, req, resp)
+            if response.raw is not None:
+                _throttle_raw(response.raw)
+            return response
+
+        HTTPAdapter.build_response = throttled_build_response
+        _installed = True
+
+
+def _throttle_raw(raw):
+    read = raw.read
+    read_chunked = raw.read_chunked
+
+    def throttled_read(*args, **kwargs):
+        data = read(*args, **kwargs)
+        limiter.throttle(len(data))
+        return data
+
+    def throttled_read_chunked(*args, **kwargs):
+        for chunk in read_chunked(*args, **kwargs):
+            limiter.throttle(len(chunk))
+            yield chunk
+
+    raw.read = throttled_read
+    raw.read_chunked = throttled_read_chunked
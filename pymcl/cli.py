@@ -0,0 +1,302 @@
+import os
+import sys
+import json
+import argparse
+
+from .constants import MINECRAFT_DIR, MODS_DIR
+from .settings_store import settings_store
+from .logging_config import configure_logging
+from .logger import get_logger
+
+# Nothing here may import PyQt6: this runs on machines provisioned from
+# scripts, often without a display. The services come from pymcl.core.
+
+logger = get_logger("pymcl")
+
+LATEST = {"latest": "release", "latest-snapshot": "snapshot"}
+
+
+class Reporter:
+    """Status lines and a progress percentage on stderr, so stdout stays parseable."""
+
+    def __init__(self, quiet=False, stream=sys.stderr):
+        self.quiet = quiet
+        self.stream = stream
+        self.interactive = stream.isatty()
+        self._percent = None
+
+    def status(self, text):
+        if self.quiet:
+            return
+        self._end_progress()
+        print(text, file=self.stream, flush=True)
+
+    def error(self, text):
+        self._end_progress()
+        print(f"pymcl: error: {text}", file=self.stream, flush=True)
+
+    def progress(self, value, maximum):
+        if self.quiet or not self.interactive or not maximum:
+            return
+        percent = min(100, value * 100 // maximum)
+        if percent != self._percent:
+            self._percent = percent
+            print(f"\r{percent:3d}%", end="", file=self.stream, flush=True)
+
+    def _end_progress(self):
+        if self._percent is not None:
+            print(file=self.stream)
+            self._percent = None
+
+
+def _resolve_version(version):
+    """Accept "latest" and "latest-snapshot" as well as a version id."""
+    if version not in LATEST:
+        return version
+    from .version_manifest import version_manifest
+
+    version_manifest.refresh()
+    resolved = version_manifest.latest(LATEST[version])
+    if not resolved:
+        raise ValueError(f"the version manifest has no {LATEST[version]}")
+    return resolved
+
+
+def _loader(name):
+    from .core import MOD_LOADERS
+
+    for loader in MOD_LOADERS:
+        if loader.lower() == name.lower():
+            return loader
+    raise argparse.ArgumentTypeError(f"unknown mod loader {name!r} (choose from {', '.join(MOD_LOADERS)})")
+
+
+def _modrinth():
+    from .modrinth_client import ModrinthClient
+
+    return ModrinthClient()
+
+
+def cmd_install(args, reporter):
+    from .core import install_version
+
+    version = _resolve_version(args.version)
+    version_to_launch = install_version(version, args.loader, status=reporter.status, progress=reporter.progress)
+    reporter.status(f"Installed {version_to_launch}")
+    print(version_to_launch)
+    return 0
+
+
+def cmd_verify(args, reporter):
+    from .core import verify_version, install_version
+    from .core.files import load_version_json
+
+    version = _resolve_version(args.version)
+    try:
+        result = verify_version(version, status=reporter.status)
+    except FileNotFoundError:
+        reporter.error(f"{version} is not installed")
+        return 1
+    if (result["missing"] or result["corrupt"]) and args.repair:
+        reporter.status(f"Repairing {len(result['missing']) + len(result['corrupt'])} files...")
+        # minecraft_launcher_lib downloads again whatever fails its sha1 check
+        parent = load_version_json(version).get("inheritsFrom")
+        install_version(parent or version, status=reporter.status, progress=reporter.progress)
+        result = verify_version(version, status=reporter.status)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for path in result["missing"]:
+            print(f"missing  {path}")
+        for path in result["corrupt"]:
+            print(f"corrupt  {path}")
+        reporter.status(
+            f"{result['checked']} files checked, {len(result['missing'])} missing, {len(result['corrupt'])} corrupt"
+        )
+    return 1 if result["missing"] or result["corrupt"] else 0
+
+
+def cmd_mod_search(args, reporter):
+    results = _modrinth().search(
+        args.query,
+        game_versions=[args.game_version] if args.game_version else None,
+        loader=args.loader.lower() if args.loader else None,
+        limit=args.limit,
+    )
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    for hit in results:
+        print(f"{hit.get('slug', ''):<32} {hit.get('downloads', 0):>10}  {hit.get('title', '')}")
+    if not results:
+        reporter.status("No mods found")
+    return 0
+
+
+def cmd_mod_install(args, reporter):
+    from .core import download_mod, latest_version, primary_file
+
+    os.makedirs(MODS_DIR, exist_ok=True)
+    if "://" in args.project:
+        url, sha1 = args.project, None
+    else:
+        version = latest_version(_modrinth(), args.project, args.game_version, args.loader)
+        file = primary_file(version) if version else None
+        if not file:
+            reporter.error(f"no version of {args.project} for {args.game_version or 'any version'}"
+                            f"{' with ' + args.loader if args.loader else ''}")
+            return 1
+        url, sha1 = file["url"], file.get("hashes", {}).get("sha1")
+        reporter.status(f"Installing {args.project} {version.get('version_number', '')}")
+    path = download_mod(url, sha1)
+    print(path)
+    return 0
+
+
+def cmd_update_check(args, reporter):
+    from .core import check_updates
+
+    updates = check_updates(_modrinth())
+    if args.json:
+        print(json.dumps({path: version.get("version_number") for path, version in updates.items()}, indent=2))
+    else:
+        for path, version in updates.items():
+            print(f"{os.path.basename(path)} -> {version.get('version_number', '?')}")
+        reporter.status(f"{len(updates)} updates available" if updates else "All mods are up to date")
+    return 0
+
+
+def cmd_mod_update(args, reporter):
+    from .core import check_updates, update_mod
+
+    updates = check_updates(_modrinth())
+    if not updates:
+        reporter.status("All mods are up to date")
+        return 0
+    failed = 0
+    for path, version in updates.items():
+        reporter.status(f"Updating {os.path.basename(path)} to {version.get('version_number', '?')}")
+        if args.dry_run:
+            continue
+        try:
+            print(update_mod(path, version))
+        except Exception as e:
+            failed += 1
+            reporter.error(f"updating {os.path.basename(path)} failed: {e}")
+    return 1 if failed else 0
+
+
+def cmd_launch(args, reporter):
+    from .core import prepare_launch, launch_options, run_game, current_microsoft_info
+
+    microsoft_info = None
+    username = args.username
+    if args.microsoft:
+        microsoft_info = current_microsoft_info()
+        if not microsoft_info:
+            reporter.error("no usable Microsoft login; log in once from the launcher window")
+            return 1
+    elif not username:
+        username = settings_store.get("last_username")
+        if not username:
+            reporter.error("pass --username NAME or --microsoft")
+            return 1
+
+    version = _resolve_version(args.version)
+    options = launch_options(username=username, microsoft_info=microsoft_info)
+    version_to_launch, command = prepare_launch(
+        version, options, args.loader, status=reporter.status, progress=reporter.progress
+    )
+    if args.print_command:
+        print(json.dumps(command))
+        return 0
+    reporter.status(f"Launching {version_to_launch}...")
+    if args.detach:
+        print(run_game(command, detach=True).pid)
+        return 0
+    return run_game(command)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="pymcl", description="Install, update and launch Minecraft without the launcher window.")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only print results")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log to stderr at debug level")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    def add_loader(command):
+        command.add_argument("--loader", type=_loader, default="Vanilla", help="Vanilla (default) or Fabric")
+
+    command = commands.add_parser("install", help="install a version and optionally a mod loader")
+    command.add_argument("version", help='a version id, "latest" or "latest-snapshot"')
+    add_loader(command)
+    command.set_defaults(run=cmd_install)
+
+    command = commands.add_parser("verify", help="check an installed version's files against their hashes")
+    command.add_argument("version")
+    command.add_argument("--repair", action="store_true", help="download missing and corrupt files again")
+    command.add_argument("--json", action="store_true")
+    command.set_defaults(run=cmd_verify)
+
+    command = commands.add_parser("launch", help="install if needed, then start the game")
+    command.add_argument("version")
+    add_loader(command)
+    auth = command.add_mutually_exclusive_group()
+    auth.add_argument("--username", help="play offline under this name (default: the last one used)")
+    auth.add_argument("--microsoft", action="store_true", help="use the Microsoft login saved by the launcher")
+    command.add_argument("--detach", action="store_true", help="print the game's pid and return at once")
+    command.add_argument("--print-command", action="store_true", help="print the command line as JSON instead of running it")
+    command.set_defaults(run=cmd_launch)
+
+    command = commands.add_parser("update-check", help="list installed mods with a newer version on Modrinth")
+    command.add_argument("--json", action="store_true")
+    command.set_defaults(run=cmd_update_check)
+
+    mod = commands.add_parser("mod", help="search, install and update mods").add_subparsers(
+        dest="mod_command", required=True, metavar="command"
+    )
+    command = mod.add_parser("search", help="search Modrinth")
+    command.add_argument("query")
+    command.add_argument("--game-version")
+    command.add_argument("--loader")
+    command.add_argument("--limit", type=int, default=20)
+    command.add_argument("--json", action="store_true")
+    command.set_defaults(run=cmd_mod_search)
+
+    command = mod.add_parser("install", help="install a Modrinth project's newest file, or a jar by URL")
+    command.add_argument("project", help="a Modrinth slug or id, or a download URL")
+    command.add_argument("--game-version")
+    command.add_argument("--loader")
+    command.set_defaults(run=cmd_mod_install)
+
+    command = mod.add_parser("update", help="replace every mod that has an update with its newest file")
+    command.add_argument("--dry-run", action="store_true", help="only list what would be updated")
+    command.set_defaults(run=cmd_mod_update)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    os.makedirs(MINECRAFT_DIR, exist_ok=True)
+    config = dict(settings_store.get("logging", {}))
+    if args.verbose:
+        config["console"] = True
+        config["levels"] = {**config.get("levels", {}), "pymcl": "DEBUG"}
+    configure_logging(config)
+
+    reporter = Reporter(quiet=args.quiet)
+    try:
+        return args.run(args, reporter)
+    except KeyboardInterrupt:
+        reporter.status("Interrupted")
+        return 130
+    except Exception as e:
+        logger.error("%s failed: %s", args.command, e)
+        reporter.error(e)
+        return 1
+    finally:
+        settings_store.flush()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
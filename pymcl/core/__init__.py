@@ -0,0 +1,53 @@
+from .files import version_files, verify_version, is_present
+from .prefetch import Prefetcher, PrefetchCancelled
+from .install import (
+    install_version,
+    launch_command,
+    prepare_launch,
+    LoaderInstallError,
+    VANILLA,
+    FABRIC,
+    MOD_LOADERS,
+)
+from .launch import launch_options, run_game
+from .mods import (
+    installed_mods,
+    primary_file,
+    latest_version,
+    download_mod,
+    check_updates,
+    update_mod,
+    fetch_description,
+)
+from .images import download_default_image
+from .jobs import JobPool, job_pool, background_pool
+from .accounts import current_microsoft_info
+
+__all__ = [
+    "version_files",
+    "verify_version",
+    "is_present",
+    "Prefetcher",
+    "PrefetchCancelled",
+    "install_version",
+    "launch_command",
+    "prepare_launch",
+    "LoaderInstallError",
+    "VANILLA",
+    "FABRIC",
+    "MOD_LOADERS",
+    "launch_options",
+    "run_game",
+    "installed_mods",
+    "primary_file",
+    "latest_version",
+    "download_mod",
+    "check_updates",
+    "update_mod",
+    "fetch_description",
+    "download_default_image",
+    "JobPool",
+    "job_pool",
+    "background_pool",
+    "current_microsoft_info",
+]
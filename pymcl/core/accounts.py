@@ -0,0 +1,76 @@
+import os
+import json
+import time
+from typing import Optional
+
+from ..constants import CLIENT_ID, REDIRECT_URL, MICROSOFT_INFO_PATH, MicrosoftInfo
+from ..logger import get_logger
+
+logger = get_logger("pymcl.install")
+
+
+def _info_from_login(login) -> MicrosoftInfo:
+    return {
+        "access_token": login["access_token"],
+        "refresh_token": login["refresh_token"],
+        "username": login["username"],
+        "uuid": login["uuid"],
+        "expires_in": login["expires_in"],
+        "login_time": int(time.time()),
+    }
+
+
+def save_microsoft_info(info: MicrosoftInfo, path=MICROSOFT_INFO_PATH):
+    with open(path, "w") as f:
+        json.dump(info, f)
+
+
+def load_microsoft_info(path=MICROSOFT_INFO_PATH) -> Optional[MicrosoftInfo]:
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            return json.load(f)
+    return None
+
+
+def is_token_expired(info: Optional[MicrosoftInfo]) -> bool:
+    if not info:
+        return True
+    return int(time.time()) > info["login_time"] + info["expires_in"]
+
+
+def complete_login(auth_code, path=MICROSOFT_INFO_PATH) -> MicrosoftInfo:
+    """Trade the code from the login redirect for a Minecraft token and save it."""
+    import minecraft_launcher_lib # deferred to keep it off the startup path
+
+    login = minecraft_launcher_lib.microsoft_account.complete_login(CLIENT_ID, None, REDIRECT_URL, auth_code)
+    info = _info_from_login(login)
+    save_microsoft_info(info, path)
+    return info
+
+
+def refresh_microsoft_info(path=MICROSOFT_INFO_PATH) -> Optional[MicrosoftInfo]:
+    """Refresh the saved login's token; None if there is none or the refresh failed."""
+    info = load_microsoft_info(path)
+    if not info:
+        return None
+
+    try:
+        import minecraft_launcher_lib
+
+        login = minecraft_launcher_lib.microsoft_account.refresh_access_token(
+            CLIENT_ID, None, info["refresh_token"], REDIRECT_URL
+        )
+        info = _info_from_login(login)
+        save_microsoft_info(info, path)
+        return info
+    except Exception as e:
+        logger.warning("Refreshing the Microsoft login failed: %s", e)
+        return None
+
+
+def current_microsoft_info(path=MICROSOFT_INFO_PATH) -> Optional[MicrosoftInfo]:
+    """The saved login, refreshed first if its token has expired; None if there is no usable login."""
+    info = load_microsoft_info(path)
+    if info and is_token_expired(info):
+        info = refresh_microsoft_info(path)
+    return info
@@ -0,0 +1,129 @@
+import os
+import json
+import hashlib
+
+from ..constants import MINECRAFT_DIR
+from ..logger import get_logger
+
+logger = get_logger("pymcl.install")
+
+CHUNK_SIZE = 64 * 1024
+ASSETS_URL = "https://resources.download.minecraft.net"
+LIBRARIES_URL = "https://libraries.minecraft.net"
+
+
+def version_json_path(version_id, minecraft_dir=MINECRAFT_DIR):
+    return os.path.join(minecraft_dir, "versions", version_id, f"{version_id}.json")
+
+
+def load_version_json(version_id, minecraft_dir=MINECRAFT_DIR):
+    with open(version_json_path(version_id, minecraft_dir), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def version_files(data, minecraft_dir=MINECRAFT_DIR):
+    """(url, path, sha1, size) for every file a vanilla install of data needs."""
+    from minecraft_launcher_lib._helper import parse_rule_list
+    from minecraft_launcher_lib.natives import get_natives
+
+    libraries_dir = os.path.join(minecraft_dir, "libraries")
+    for library in data.get("libraries", []):
+        if "rules" in library and not parse_rule_list(library["rules"], {}):
+            continue
+        downloads = library.get("downloads", {})
+        artifact = downloads.get("artifact")
+        if artifact and artifact.get("url") and artifact.get("path"):
+            yield artifact["url"], os.path.join(libraries_dir, artifact["path"]), artifact.get("sha1"), artifact.get("size")
+        native = get_natives(library)
+        classifier = downloads.get("classifiers", {}).get(native) if native else None
+        if classifier and classifier.get("path"):
+            yield classifier["url"], os.path.join(libraries_dir, classifier["path"]), classifier.get("sha1"), classifier.get("size")
+
+    logging_file = data.get("logging", {}).get("client", {}).get("file")
+    if logging_file:
+        path = os.path.join(minecraft_dir, "assets", "log_configs", logging_file["id"])
+        yield logging_file["url"], path, logging_file.get("sha1"), logging_file.get("size")
+
+    client = data.get("downloads", {}).get("client")
+    if client:
+        path = os.path.join(minecraft_dir, "versions", data["id"], f"{data['id']}.jar")
+        yield client["url"], path, client.get("sha1"), client.get("size")
+
+    index_path = os.path.join(minecraft_dir, "assets", "indexes", f"{data.get('assets')}.json")
+    if "assetIndex" in data and os.path.isfile(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            objects = json.load(f).get("objects", {})
+        seen = set()
+        for obj in objects.values():
+            filehash = obj["hash"]
+            if filehash in seen:
+                continue
+            seen.add(filehash)
+            path = os.path.join(minecraft_dir, "assets", "objects", filehash[:2], filehash)
+            yield f"{ASSETS_URL}/{filehash[:2]}/{filehash}", path, filehash, obj.get("size")
+
+
+def loader_files(data, minecraft_dir=MINECRAFT_DIR):
+    """
+    (url, path, sha1, size) for the libraries a mod loader profile adds,
+    which are listed by maven name rather than with download info.
+    """
+    from minecraft_launcher_lib._helper import get_library_path
+
+    for library in data.get("libraries", []):
+        if "downloads" in library or "name" not in library:
+            continue
+        path = get_library_path(library["name"], minecraft_dir)
+        relative = os.path.relpath(path, os.path.join(minecraft_dir, "libraries")).replace(os.sep, "/")
+        url = f"{library.get('url', LIBRARIES_URL).rstrip('/')}/{relative}"
+        yield url, path, library.get("sha1"), library.get("size")
+
+
+def is_present(path, size=None, sha1=None):
+    """Whether path exists with the given sha1, or else size; without either, whether it exists."""
+    try:
+        if sha1 is not None:
+            digest = hashlib.sha1()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            return digest.hexdigest() == sha1
+        return size is None or os.path.getsize(path) == size
+    except OSError:
+        return False
+
+
+def verify_version(version_id, minecraft_dir=MINECRAFT_DIR, status=None):
+    """
+    Check every file an installed version needs against its sha1.
+
+    Mod loader profiles are checked along with the version they inherit
+    from. Returns {"checked": count, "missing": [paths], "corrupt": [paths]};
+    raises FileNotFoundError if the version isn't installed at all.
+    """
+    status = status or (lambda text: None)
+    checked, missing, corrupt = 0, [], []
+    seen = set()
+    while version_id:
+        data = load_version_json(version_id, minecraft_dir)
+        status(f"Verifying {version_id}...")
+        files = list(loader_files(data, minecraft_dir))
+        if "inheritsFrom" not in data:
+            files.extend(version_files(data, minecraft_dir))
+            index = data.get("assetIndex")
+            if index:
+                index_path = os.path.join(minecraft_dir, "assets", "indexes", f"{data['assets']}.json")
+                files.append((index["url"], index_path, index.get("sha1"), index.get("size")))
+        for _url, path, sha1, size in files:
+            if path in seen:
+                continue
+            seen.add(path)
+            checked += 1
+            if not os.path.isfile(path):
+                missing.append(path)
+            elif not is_present(path, size, sha1):
+                corrupt.append(path)
+        version_id = data.get("inheritsFrom")
+
+    logger.info("Verified %d files: %d missing, %d corrupt", checked, len(missing), len(corrupt))
+    return {"checked": checked, "missing": missing, "corrupt": corrupt}
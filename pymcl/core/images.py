@@ -0,0 +1,24 @@
+import os
+
+from ..constants import DEFAULT_IMAGE_URL, DEFAULT_IMAGE_PATH
+from ..bandwidth import limiter, BACKGROUND
+from ..net import http_client
+from ..logger import get_logger
+
+logger = get_logger("pymcl.net")
+
+
+def download_default_image(http=None, url=DEFAULT_IMAGE_URL, path=DEFAULT_IMAGE_PATH):
+    """Download the default wallpaper as background traffic; returns the path it was saved to."""
+    http = http or http_client
+    logger.info("Downloading default image from %s", url)
+    with limiter.priority(BACKGROUND):
+        response = http.get(url)
+    response.raise_for_status()
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(response.content)
+
+    logger.info("Image saved to %s", path)
+    return path
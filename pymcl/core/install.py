@@ -0,0 +1,116 @@
+from ..constants import MINECRAFT_DIR
+from ..bandwidth import limiter, install as install_bandwidth_limiter
+from ..net import install_mirrors, peer_cache
+from ..logger import get_logger
+from .prefetch import Prefetcher
+
+# minecraft_launcher_lib is imported on first use, on whichever thread runs
+# the install, not at startup.
+
+logger = get_logger("pymcl.install")
+
+VANILLA = "Vanilla"
+FABRIC = "Fabric"
+MOD_LOADERS = (VANILLA, FABRIC, "Forge", "NeoForge", "Quilt")
+
+
+class LoaderInstallError(Exception):
+    """The game installed but its mod loader didn't."""
+
+
+def _callbacks(status, progress):
+    status = status or (lambda text: None)
+    progress = progress or (lambda value, maximum: None)
+
+    def set_progress(value: int, maximum: int = 100) -> None:
+        progress(value, maximum)
+
+    return status, set_progress
+
+
+def install_version(version, mod_loader=VANILLA, minecraft_dir=MINECRAFT_DIR, status=None, progress=None, peers=None):
+    """
+    Install a Minecraft version and optionally a mod loader for it, as
+    foreground traffic of the bandwidth limiter and through the configured
+    mirrors. Files LAN peers have are taken from them first.
+
+    status(text) and progress(value, maximum) report along the way, from
+    the calling thread. Returns the version id to launch, which is the
+    loader's profile when one was installed. Raises LoaderInstallError if
+    only the loader failed.
+    """
+    # Background transfers wait until the install is done
+    install_bandwidth_limiter()
+    install_mirrors()
+    with limiter.foreground_activity():
+        return _install(version, mod_loader, minecraft_dir, *_callbacks(status, progress), peers or peer_cache)
+
+
+def _install(version, mod_loader, minecraft_dir, set_status, set_progress, peers):
+    import minecraft_launcher_lib
+    import minecraft_launcher_lib.fabric
+
+    callback = {"setStatus": set_status, "setProgress": set_progress}
+
+    if peers.enabled:
+        # Whatever LAN peers have is taken from them, verified; the
+        # install below then only downloads the rest
+        set_status("Checking LAN peers for game files...")
+        fetched = Prefetcher([version], minecraft_dir, peers=peers, peers_only=True).fetch()
+        if fetched:
+            logger.info("Got %d files for %s from LAN peers", fetched, version)
+
+    set_status(f"Installing Minecraft {version}...")
+    minecraft_launcher_lib.install.install_minecraft_version(
+        version=version,
+        minecraft_directory=minecraft_dir,
+        callback=callback,
+    )
+
+    version_to_launch = version
+    if mod_loader != VANILLA:
+        set_status(f"Installing {mod_loader}...")
+        try:
+            if mod_loader == FABRIC:
+                loader_version = minecraft_launcher_lib.fabric.get_latest_loader_version()
+                set_status(f"Found Fabric Loader {loader_version}")
+                minecraft_launcher_lib.fabric.install_fabric(
+                    minecraft_version=version,
+                    minecraft_directory=minecraft_dir,
+                    loader_version=loader_version,
+                    callback=callback,
+                )
+                version_to_launch = f"fabric-loader-{loader_version}-{version}"
+            elif mod_loader in ["Forge", "NeoForge", "Quilt"]:
+                raise Exception(f"{mod_loader} installation is not supported in this version of PyMCL due to library limitations. Please update your libraries or use Fabric.")
+            else:
+                raise Exception(f"unknown mod loader {mod_loader!r}")
+        except Exception as loader_e:
+            logger.error("%s install failed: %s", mod_loader, loader_e)
+            raise LoaderInstallError(f"{mod_loader} install failed: {loader_e}") from loader_e
+
+    set_progress(1, 1)
+    return version_to_launch
+
+
+def launch_command(version, options, minecraft_dir=MINECRAFT_DIR):
+    """The command line starting an installed version with the given launch options."""
+    import minecraft_launcher_lib
+
+    # Clean up options, removing keys with None or empty values
+    # so that minecraft-launcher-lib can use its defaults.
+    cleaned_options = {k: v for k, v in options.items() if v}
+
+    return minecraft_launcher_lib.command.get_minecraft_command(
+        version=version,
+        minecraft_directory=minecraft_dir,
+        options=cleaned_options,
+    )
+
+
+def prepare_launch(version, options, mod_loader=VANILLA, minecraft_dir=MINECRAFT_DIR, status=None, progress=None, peers=None):
+    """install_version() and then launch_command(); returns (version to launch, command)."""
+    version_to_launch = install_version(version, mod_loader, minecraft_dir, status, progress, peers)
+    if status:
+        status("Getting launch command...")
+    return version_to_launch, launch_command(version_to_launch, options, minecraft_dir)
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from ..settings_store import settings_store
+from ..logger import get_logger
+
+logger = get_logger("pymcl")
+
+# Jobs are downloads, API calls and hashing, which all release the GIL
+# while they wait, so threads are enough
+MAX_WORKERS = settings_store.get("job_threads", 8)
+# Background transfers are held while an install runs (see bandwidth.py), so
+# they get their own pool rather than tying up the one searches wait on
+BACKGROUND_WORKERS = 4
+
+
+class JobPool:
+    """
+    A shared pool for the launcher's short blocking jobs, instead of a
+    thread per job. The executor is created on the first submit.
+
+    submit() returns a concurrent.futures.Future and can call
+    callback(future) when the job is done, on the pool thread; run() is the
+    same for asyncio code. Exceptions a job lets escape are logged even if
+    nobody looks at the future.
+    """
+
+    def __init__(self, max_workers=MAX_WORKERS, name="pymcl-job"):
+        self.max_workers = max_workers
+        self.name = name
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+            return self._executor
+
+    def submit(self, fn, *args, callback=None, **kwargs):
+        future = self._get_executor().submit(fn, *args, **kwargs)
+        future.add_done_callback(self._log_failure)
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
+
+    async def run(self, fn, *args, **kwargs):
+        """Await fn(*args, **kwargs) run on the pool."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def shutdown(self, wait=True):
+        """Cancel jobs that haven't started and, with wait, let running ones finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    @staticmethod
+    def _log_failure(future):
+        if future.cancelled() or future.exception() is None:
+            return
+        e = future.exception()
+        logger.error("Background job failed: %s\n%s", e, "".join(traceback.format_exception(e)).rstrip())
+
+
+job_pool = JobPool()
+background_pool = JobPool(BACKGROUND_WORKERS, name="pymcl-background")
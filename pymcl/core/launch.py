@@ -0,0 +1,54 @@
+import uuid
+import subprocess
+
+from ..settings_store import settings_store
+from ..logger import get_logger
+
+logger = get_logger("pymcl.install")
+
+
+def launch_options(settings=None, username=None, microsoft_info=None):
+    """
+    minecraft_launcher_lib launch options from the launcher settings (Java
+    executable, JVM arguments, memory, resolution) for either an offline
+    username or a Microsoft login.
+    """
+    settings = settings if settings is not None else settings_store.snapshot()
+    options = {
+        "username": "",
+        "uuid": "",
+        "token": "",
+        "executablePath": settings.get("java_executable"),
+        "jvmArguments": settings.get("jvm_arguments", "").split(),
+        "resolutionWidth": settings.get("resolution", {}).get("width"),
+        "resolutionHeight": settings.get("resolution", {}).get("height"),
+    }
+
+    memory_gb = settings.get("memory_gb", 4)
+    options["jvmArguments"].append(f"-Xmx{memory_gb}G")
+    options["jvmArguments"].append(f"-Xms{memory_gb}G")
+
+    if microsoft_info:
+        options["username"] = microsoft_info["username"]
+        options["uuid"] = microsoft_info["uuid"]
+        options["token"] = microsoft_info["access_token"]
+    elif username:
+        options["username"] = username
+        options["uuid"] = str(uuid.uuid4())
+    return options
+
+
+def run_game(command, detach=False):
+    """
+    Start the game outside Qt. Output goes to this process's stdout and the
+    exit code is returned, unless detach, which returns the Popen at once.
+    """
+    logger.info("Starting game: %s", command[0])
+    process = subprocess.Popen(command, start_new_session=detach)
+    if detach:
+        return process
+    try:
+        return process.wait()
+    except KeyboardInterrupt:
+        process.terminate()
+        return process.wait()
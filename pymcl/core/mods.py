@@ -0,0 +1,181 @@
+import os
+import glob
+import hashlib
+from urllib.parse import unquote
+
+from ..constants import MODS_DIR
+from ..bandwidth import limiter, BACKGROUND
+from ..net import http_client, peer_cache
+from ..net.peers import sha1_file
+from ..description_cache import description_cache, body_hash, render_description
+from ..logger import get_logger
+
+logger = get_logger("pymcl.mods")
+net_logger = get_logger("pymcl.net")
+
+
+def installed_mods(mods_dir=MODS_DIR):
+    return sorted(glob.glob(os.path.join(mods_dir, "*.jar")))
+
+
+def primary_file(version):
+    """The file of a Modrinth version to install: the one marked primary, else the first."""
+    files = version.get("files", [])
+    return next((f for f in files if f.get("primary")), files[0] if files else None)
+
+
+def latest_version(client, project, game_version=None, loader=None):
+    """The newest version of a Modrinth project for game_version and loader, or None."""
+    versions = client.get_versions(
+        project,
+        game_versions=[game_version] if game_version else None,
+        loader=loader.lower() if loader else None,
+    )
+    return versions[0] if versions else None
+
+
+def _filename(url, response=None):
+    """
+    The name to save a mod download under: the response's
+    Content-Disposition if there is one, else the last segment of the URL,
+    as a .jar. Raises ValueError for a name that could land outside the
+    mods directory; the server picks it, so it can't be trusted.
+    """
+    filename = ""
+    if response is not None and "content-disposition" in response.headers:
+        disp = response.headers["content-disposition"]
+        filename = disp.split("filename=")[-1].strip("'\"")
+
+    if not filename:
+        filename = unquote(url.split("?")[0].rsplit("/", 1)[-1])
+
+    if not filename.endswith(".jar"):
+        if "?" in filename:
+            filename = filename.split("?")[0]
+        if not filename.endswith(".jar"):
+            filename = f"{filename.split('.')[0]}.jar"
+
+    filename = os.path.basename(filename)
+    if (
+        not filename
+        or filename.startswith(".")
+        or ".." in filename
+        or "/" in filename
+        or "\\" in filename
+        or os.path.splitdrive(filename)[0]
+    ):
+        raise ValueError(f"unsafe file name for a mod download: {filename!r}")
+    return filename
+
+
+def download_mod(url, sha1=None, mods_dir=MODS_DIR, http=None, peers=None):
+    """
+    Download a mod jar into mods_dir as foreground traffic; returns the
+    path it was saved to. With the file's sha1 (Modrinth lists it) LAN
+    peers are asked first and the download is verified.
+    """
+    http = http or http_client
+    peers = peers or peer_cache
+    with limiter.foreground_activity():
+        if sha1:
+            path = _download_from_peers(url, sha1, mods_dir, peers)
+            if path:
+                return path
+        net_logger.info("Downloading mod from %s", url)
+        response = http.get(url)
+    response.raise_for_status()
+    if sha1 and hashlib.sha1(response.content).hexdigest() != sha1:
+        raise ValueError("checksum mismatch, the file is corrupt")
+
+    save_path = os.path.join(mods_dir, _filename(url, response))
+    with open(save_path, "wb") as f:
+        f.write(response.content)
+
+    logger.info("Mod saved to %s", save_path)
+    return save_path
+
+
+def _download_from_peers(url, sha1, mods_dir, peers):
+    try:
+        filename = _filename(url)
+    except ValueError:
+        return None
+    save_path = os.path.join(mods_dir, filename)
+    if peers.download(sha1, save_path) is None:
+        return None
+    logger.info("Mod saved to %s (from a LAN peer)", save_path)
+    return save_path
+
+
+def check_updates(client, mods_dir=MODS_DIR):
+    """{jar path: newest Modrinth version} for every installed mod that has an update."""
+    logger.info("Starting update check")
+    jar_files = installed_mods(mods_dir)
+    hashes = {} # {sha1: file_path}
+
+    logger.debug("Found %d jar files", len(jar_files))
+    for path in jar_files:
+        try:
+            sha1 = sha1_file(path)
+            hashes[sha1] = path
+            logger.debug("Hashed %s: %s", path, sha1)
+        except OSError as e:
+            logger.warning("Error hashing %s: %s", path, e)
+
+    if not hashes:
+        logger.info("No mods to check for updates")
+        return {}
+
+    logger.debug("Sending %d hashes to Modrinth for update check", len(hashes))
+    # Modrinth API allows bulk check
+    with limiter.priority(BACKGROUND):
+        updates = client.get_updates(list(hashes.keys()))
+    logger.debug("Received %d entries from Modrinth", len(updates))
+
+    # Map back to file paths: {file_path: new_version_data}
+    result = {}
+    for h, version in updates.items():
+        # Modrinth answers with the current version for mods that are up to date
+        if h in hashes and not any(f.get("hashes", {}).get("sha1") == h for f in version.get("files", [])):
+            result[hashes[h]] = version
+            logger.debug("Update available for %s", hashes[h])
+
+    logger.info("Update check finished, %d updates found", len(result))
+    return result
+
+
+def update_mod(old_path, version, mods_dir=MODS_DIR, http=None, peers=None):
+    """
+    Replace the jar at old_path with the primary file of a newer Modrinth
+    version; returns the new path. The old jar is only removed once the
+    new one is in place.
+    """
+    file = primary_file(version)
+    if not file or not file.get("url"):
+        raise ValueError("could not find a file to download for the update")
+
+    new_path = download_mod(file["url"], file.get("hashes", {}).get("sha1"), mods_dir, http, peers)
+    if os.path.abspath(new_path) != os.path.abspath(old_path):
+        try:
+            os.remove(old_path)
+        except OSError as e:
+            logger.error("Error removing old mod %s: %s", old_path, e)
+    return new_path
+
+
+def fetch_description(client, slug, known_hash=None):
+    """
+    Fetch a project and render its description. Returns the cache entry,
+    {"unchanged": True} when the body still matches known_hash, or {} when
+    the fetch failed.
+    """
+    project_data = client.get_project(slug)
+    if not project_data or "body" not in project_data:
+        return {}
+
+    new_hash = body_hash(project_data["body"])
+    if new_hash == known_hash:
+        return {"unchanged": True}
+
+    html, images = render_description(project_data["body"])
+    return description_cache.put(slug, new_hash, html, images)
@@ -0,0 +1,182 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+
+from ..constants import MINECRAFT_DIR
+from ..version_manifest import version_manifest
+from ..bandwidth import limiter, BACKGROUND
+from ..net import http_client, peer_cache
+from ..logger import get_logger
+from .files import CHUNK_SIZE, is_present, version_files, version_json_path
+
+logger = get_logger("pymcl.install")
+
+# Give up on a version after this many downloads in a row failed
+MAX_CONSECUTIVE_FAILURES = 5
+
+
+class PrefetchCancelled(Exception):
+    pass
+
+
+class Prefetcher:
+    """
+    Downloads whatever is missing for a few versions ahead of a launch.
+
+    For each version the client json, libraries (including natives for
+    this OS), the asset index and objects, the logging config and the
+    client jar are checked against the sizes in the version metadata, and
+    missing files are downloaded one at a time, verified against their
+    sha1 and moved into place atomically. minecraft_launcher_lib finds
+    them already present when the version is installed and only verifies
+    them.
+
+    Files are asked for from LAN peers by sha1 first when the peer cache
+    is enabled. With peers_only nothing else is downloaded; the install
+    service uses that through fetch() to take what the LAN has before
+    minecraft_launcher_lib fetches the rest.
+
+    run() downloads as background traffic of the bandwidth limiter and
+    fetch() in the calling thread's class. pause(), resume() and stop() may
+    be called from any thread; a paused prefetcher blocks between chunks.
+    status(text) is called as versions are worked through.
+    """
+
+    def __init__(self, versions, minecraft_dir=MINECRAFT_DIR, http=None, peers=None, peers_only=False, status=None):
+        self.versions = versions
+        self.minecraft_dir = minecraft_dir
+        self.http = http or http_client
+        self.peers = peers or peer_cache
+        self.peers_only = peers_only
+        self.status = status or (lambda text: None)
+        self.files = 0
+        self.bytes = 0
+        self._resume = threading.Event()
+        self._resume.set()
+        self._stop = threading.Event()
+
+    def pause(self):
+        self._resume.clear()
+
+    def resume(self):
+        self._resume.set()
+
+    def stop(self):
+        self._stop.set()
+        self._resume.set()
+
+    def run(self):
+        """Prefetch as background traffic until done or stopped; returns (files, bytes)."""
+        try:
+            with limiter.priority(BACKGROUND, cancel=self._stop):
+                self._prefetch_all()
+        except PrefetchCancelled:
+            logger.debug("Prefetch cancelled")
+
+        if self.files:
+            logger.info("Prefetched %d files (%.1f MiB)", self.files, self.bytes / (1024 * 1024))
+        return self.files, self.bytes
+
+    def fetch(self):
+        """Run on the calling thread, in its traffic class; returns the number of files fetched."""
+        self._prefetch_all()
+        return self.files
+
+    def _prefetch_all(self):
+        version_manifest.load()
+        for version_id in self.versions:
+            self._checkpoint()
+            try:
+                self._prefetch_version(version_id)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Prefetch of %s stopped: %s", version_id, e)
+
+    def _prefetch_version(self, version_id):
+        entry = version_manifest.get(version_id)
+        json_path = version_json_path(version_id, self.minecraft_dir)
+        if entry is None and not os.path.isfile(json_path):
+            logger.debug("Not prefetching %s, not in the version manifest", version_id)
+            return
+
+        self.status(f"Checking {version_id}...")
+        if entry is not None and not is_present(json_path, sha1=entry.get("sha1")):
+            self._download(entry["url"], json_path, entry.get("sha1"))
+        if not os.path.isfile(json_path):
+            return
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if "inheritsFrom" in data:
+            # Loader profiles are built by the loader installer at launch
+            return
+
+        # The asset index has to be on disk before its objects can be listed
+        index = data.get("assetIndex")
+        if index:
+            index_path = os.path.join(self.minecraft_dir, "assets", "indexes", f"{data['assets']}.json")
+            if not is_present(index_path, index.get("size")):
+                self._download(index["url"], index_path, index.get("sha1"))
+
+        missing = [item for item in version_files(data, self.minecraft_dir) if not is_present(item[1], item[3])]
+        if not missing:
+            logger.debug("%s is fully downloaded", version_id)
+            return
+
+        logger.info("Prefetching %d missing files for %s", len(missing), version_id)
+        failures = 0
+        for done, (url, path, sha1, _size) in enumerate(missing, 1):
+            self.status(f"Prefetching {version_id} ({done}/{len(missing)})")
+            try:
+                self._download(url, path, sha1)
+                failures = 0
+            except (OSError, ValueError) as e:
+                failures += 1
+                logger.debug("Prefetch of %s failed: %s", url, e)
+                if failures >= MAX_CONSECUTIVE_FAILURES:
+                    raise
+
+    def _download(self, url, path, sha1=None):
+        self._checkpoint()
+        if sha1:
+            size = self.peers.download(sha1, path, checkpoint=self._checkpoint)
+            if size is not None:
+                self.files += 1
+                self.bytes += size
+                return
+        if self.peers_only:
+            return
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        response = self.http.get(url, stream=True)
+        try:
+            response.raise_for_status()
+            fd, tmp_path = tempfile.mkstemp(prefix=".prefetch-", suffix=".part", dir=directory)
+            try:
+                digest = hashlib.sha1()
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        self._checkpoint()
+                        f.write(chunk)
+                        digest.update(chunk)
+                        self.bytes += len(chunk)
+                if sha1 and digest.hexdigest() != sha1:
+                    raise ValueError(f"checksum mismatch for {url}")
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+        finally:
+            response.close()
+        self.files += 1
+
+    def _checkpoint(self):
+        if not self._resume.is_set():
+            logger.debug("Prefetch paused")
+            self._resume.wait()
+            logger.debug("Prefetch resumed")
+        if self._stop.is_set():
+            raise PrefetchCancelled()
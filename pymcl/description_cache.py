@@ -0,0 +1,75 @@
+import os
+import json
+import hashlib
+import tempfile
+
+from .constants import DESCRIPTION_CACHE_DIR
+from .logger import get_logger
+
+logger = get_logger("pymcl.mods")
+
+
+def body_hash(body):
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def render_description(body):
+    """Render a Modrinth markdown body; returns (html, image_urls)."""
+    # Only needed once a detail dialog is opened, so keep them off startup
+    import markdown
+    from bs4 import BeautifulSoup
+
+    html = markdown.markdown(body)
+    soup = BeautifulSoup(html, "lxml")
+    images = []
+    for img in soup.find_all("img"):
+        src = img.get("src")
+        if src and src not in images:
+            images.append(src)
+    return html, images
+
+
+class DescriptionCache:
+    """
+    Rendered mod descriptions on disk, one JSON file per project slug.
+
+    Each entry stores the hash of the markdown body it was rendered from,
+    so a refetched project only needs rendering again when its body
+    actually changed. Images are not inlined; they are resolved through
+    the image cache by URL.
+    """
+
+    def __init__(self, directory=DESCRIPTION_CACHE_DIR):
+        self.directory = directory
+
+    def path_for(self, slug):
+        return os.path.join(self.directory, hashlib.sha1(slug.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, slug):
+        """Return the cached entry {"body_hash", "html", "images"} for slug, or None."""
+        try:
+            with open(self.path_for(slug), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable description cache for %s: %s", slug, e)
+            return None
+        if not isinstance(entry, dict) or entry.get("slug") != slug or "html" not in entry:
+            return None
+        return entry
+
+    def put(self, slug, body_hash, html, images):
+        entry = {"slug": slug, "body_hash": body_hash, "html": html, "images": images}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".desc-", suffix=".tmp", dir=self.directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self.path_for(slug))
+        except OSError as e:
+            logger.warning("Could not cache description for %s: %s", slug, e)
+        return entry
+
+
+description_cache = DescriptionCache()
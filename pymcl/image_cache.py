@@ -1,64 +1,453 @@
 import os
-import requests
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QThread
+import json
+import atexit
+import time
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal, pyqtSlot, QThreadPool, QRunnable, QBuffer, QByteArray, QIODevice
+from PyQt6.QtGui import QImage
 
 from .constants import ICON_CACHE_DIR
+from .settings_store import settings_store
+from .bandwidth import limiter, BACKGROUND
+from .net import http_client
+from .workers import PooledWorker
+from .core import background_pool
+from .logger import get_logger
+
+logger = get_logger("pymcl.net")
+
+MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+DISK_CACHE_BYTES = settings_store.get("image_cache_mb", 256) * 1024 * 1024
+INDEX_FILENAME = "index.json"
+NEGATIVE_CACHE_SECONDS = 60
+DECODE_THREADS = 4
+
+
+class DiskCache:
+    """
+    Size-capped file cache keyed by a hash of the URL.
+
+    A small JSON index tracks the size and last access time of every entry;
+    when the total exceeds max_bytes the least recently used files are
+    removed. The index is rebuilt from the directory if it goes missing
+    (e.g. after "Clear Icon Cache").
+    """
+
+    def __init__(self, directory, max_bytes=DISK_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = None
+        self._total = 0
+
+    @property
+    def index_path(self):
+        return os.path.join(self.directory, INDEX_FILENAME)
+
+    @staticmethod
+    def key_for(url, suffix=None):
+        ext = suffix or os.path.splitext(urlparse(url).path)[1].lower()
+        if not ext or len(ext) > 5:
+            ext = ".img"
+        return hashlib.sha1(url.encode("utf-8")).hexdigest() + ext
+
+    def path_for(self, url, suffix=None):
+        return os.path.join(self.directory, self.key_for(url, suffix))
+
+    def _load_index(self):
+        if self._index is not None:
+            return
+        index = {}
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            # Rebuild from whatever is on disk
+            if os.path.isdir(self.directory):
+                for entry in os.scandir(self.directory):
+                    if entry.is_file() and entry.name != INDEX_FILENAME:
+                        stat = entry.stat()
+                        index[entry.name] = {"size": stat.st_size, "atime": stat.st_mtime}
+        self._index = {k: v for k, v in index.items() if os.path.exists(os.path.join(self.directory, k))}
+        self._total = sum(v["size"] for v in self._index.values())
+
+    def _save_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def get(self, url, suffix=None):
+        """Return the cached file path for url, or None."""
+        key = self.key_for(url, suffix)
+        path = os.path.join(self.directory, key)
+        with self._lock:
+            self._load_index()
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if not os.path.exists(path):
+                self._total -= entry["size"]
+                del self._index[key]
+                return None
+            # Access times only need to be roughly right for LRU, so they
+            # are persisted with the next put() instead of on every hit.
+            entry["atime"] = time.time()
+        return path
+
+    def put(self, url, data, suffix=None):
+        """Store bytes for url and return the file path."""
+        key = self.key_for(url, suffix)
+        path = os.path.join(self.directory, key)
+        os.makedirs(self.directory, exist_ok=True)
+
+        tmp_path = f"{path}.{threading.get_ident()}.part"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._load_index()
+            old = self._index.get(key)
+            if old:
+                self._total -= old["size"]
+            self._index[key] = {"size": len(data), "atime": time.time()}
+            self._total += len(data)
+            self._evict(keep=key)
+            try:
+                self._save_index()
+            except OSError as e:
+                logger.warning("Could not save image cache index: %s", e)
+        return path
+
+    def _evict(self, keep=None):
+        if self._total <= self.max_bytes:
+            return
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]["atime"]):
+            if self._total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            try:
+                os.remove(os.path.join(self.directory, key))
+            except OSError:
+                pass
+            self._total -= entry["size"]
+            del self._index[key]
+
+    def flush(self):
+        with self._lock:
+            if self._index is not None and os.path.isdir(self.directory):
+                try:
+                    self._save_index()
+                except OSError as e:
+                    logger.warning("Could not save image cache index: %s", e)
+
+    def clear(self):
+        with self._lock:
+            if os.path.exists(self.directory):
+                shutil.rmtree(self.directory)
+            self._index = {}
+            self._total = 0
+
+
+class MemoryImageCache:
+    """LRU of decoded QImages limited by their total size in bytes."""
+
+    def __init__(self, max_bytes=MEMORY_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._images = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def put(self, key, image):
+        size = image.sizeInBytes()
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._images.pop(key, None)
+            if old is not None:
+                self._total -= old.sizeInBytes()
+            self._images[key] = image
+            self._total += size
+            while self._total > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._total -= evicted.sizeInBytes()
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._total = 0
+
+
+disk_cache = DiskCache(ICON_CACHE_DIR)
+memory_cache = MemoryImageCache()
+atexit.register(disk_cache.flush)
+
+
+def clear_image_caches():
+    memory_cache.clear()
+    disk_cache.clear()
+
+
+def thumbnail_key(url, size):
+    return f"{url}#thumb{size}"
+
+
+class ThumbnailTask(QRunnable):
+    """
+    Decode an image and downscale it to a square bounding box off the GUI thread.
+
+    Freshly generated thumbnails are written back to the disk cache as small
+    PNGs so later loads skip decoding the full-size original. The result is
+    delivered as a QImage; only QPixmap conversion is left for the GUI thread.
+    """
+
+    def __init__(self, fetcher, url, size, source_path, is_thumbnail):
+        super().__init__()
+        self.fetcher = fetcher
+        self.url = url
+        self.size = size
+        self.source_path = source_path
+        self.is_thumbnail = is_thumbnail
+
+    def run(self):
+        image = QImage(self.source_path)
+        if image.isNull():
+            self.fetcher.thumbnail_decoded.emit(self.url, self.size, QImage())
+            return
+
+        if not self.is_thumbnail:
+            if image.width() > self.size or image.height() > self.size:
+                image = image.scaled(
+                    self.size, self.size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+            try:
+                data = QByteArray()
+                buffer = QBuffer(data)
+                buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+                image.save(buffer, "PNG")
+                disk_cache.put(thumbnail_key(self.url, self.size), bytes(data), ".png")
+            except OSError as e:
+                logger.warning("Could not cache thumbnail for %s: %s", self.url, e)
+
+        image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        self.fetcher.thumbnail_decoded.emit(self.url, self.size, image)
 
-class ImageDownloader(QObject):
+
+class ImageDownloader(PooledWorker):
     finished = pyqtSignal(str, str)
+    pool = background_pool
 
-    def __init__(self, url, cache_path):
+    def __init__(self, url, http=None):
         super().__init__()
         self.url = url
-        self.cache_path = cache_path
+        self.http = http or http_client
 
     @pyqtSlot()
     def run(self):
         try:
-            response = requests.get(self.url)
+            with limiter.priority(BACKGROUND):
+                response = self.http.get(self.url)
             response.raise_for_status()
-
-            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
-
-            with open(self.cache_path, "wb") as f:
-                f.write(response.content)
-            self.finished.emit(self.url, self.cache_path)
+            path = disk_cache.put(self.url, response.content)
+            self.finished.emit(self.url, path)
         except Exception as e:
-            print(f"Error downloading image: {e}")
+            logger.warning("Error downloading image %s: %s", self.url, e)
             self.finished.emit(self.url, "")
 
+class ImageFetcher(QObject):
+    """
+    App-wide single-flight downloader for cached images.
+
+    At most one download runs per URL; every ImageCache waiting on it is
+    notified through image_downloaded when it finishes. URLs that failed
+    are not retried for NEGATIVE_CACHE_SECONDS; requests for them are
+    answered with the failure (an empty path) instead.
+    """
+
+    image_downloaded = pyqtSignal(str, str)
+    thumbnail_ready = pyqtSignal(str, int, QImage)
+    thumbnail_decoded = pyqtSignal(str, int, QImage) # emitted from decode threads
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._inflight = set()
+        self._failed = {}
+        self._thumbnails_pending = set()
+        self._thumbnails_waiting = {} # url -> sizes waiting for the download
+
+        self.decode_pool = QThreadPool(self)
+        self.decode_pool.setMaxThreadCount(DECODE_THREADS)
+        self.thumbnail_decoded.connect(self._on_thumbnail_decoded)
+
+    def fetch(self, url):
+        """Start a download unless one is running; image_downloaded always follows."""
+        if url in self._inflight:
+            return
+        self._inflight.add(url)
+
+        failed_at = self._failed.get(url)
+        if failed_at is not None:
+            if time.monotonic() - failed_at < NEGATIVE_CACHE_SECONDS:
+                # Report the cached failure once the caller has returned
+                QTimer.singleShot(0, lambda: self._finish(url, ""))
+                return
+            del self._failed[url]
+
+        downloader = ImageDownloader(url)
+        downloader.finished.connect(self.on_image_downloaded)
+        downloader.start()
+
+    def is_pending(self, url):
+        return url in self._inflight
+
+    def request_thumbnail(self, url, size):
+        """
+        Produce a size x size (bounding box) thumbnail of url; thumbnail_ready
+        fires when done, with a null QImage if it failed.
+        """
+        if (url, size) in self._thumbnails_pending:
+            return
+
+        thumb_path = disk_cache.get(thumbnail_key(url, size), ".png")
+        if thumb_path:
+            self._start_decode(url, size, thumb_path, True)
+            return
+
+        source_path = disk_cache.get(url)
+        if source_path:
+            self._start_decode(url, size, source_path, False)
+            return
+
+        self._thumbnails_pending.add((url, size))
+        self._thumbnails_waiting.setdefault(url, set()).add(size)
+        self.fetch(url)
+
+    def _start_decode(self, url, size, path, is_thumbnail):
+        self._thumbnails_pending.add((url, size))
+        self.decode_pool.start(ThumbnailTask(self, url, size, path, is_thumbnail))
+
+    @pyqtSlot(str, int, QImage)
+    def _on_thumbnail_decoded(self, url, size, image):
+        self._thumbnails_pending.discard((url, size))
+        if not image.isNull():
+            memory_cache.put(thumbnail_key(url, size), image)
+        self.thumbnail_ready.emit(url, size, image)
+
+    @pyqtSlot(str, str)
+    def on_image_downloaded(self, url, path):
+        if not path:
+            self._failed[url] = time.monotonic()
+        self._finish(url, path)
+
+    def _finish(self, url, path):
+        self._inflight.discard(url)
+        self.image_downloaded.emit(url, path)
+
+        for size in self._thumbnails_waiting.pop(url, ()):
+            if path:
+                self._start_decode(url, size, path, False)
+            else:
+                self._on_thumbnail_decoded(url, size, QImage())
+
+
+_fetcher = None
+
+
+def image_fetcher():
+    """Return the shared ImageFetcher, created on first use (GUI thread)."""
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = ImageFetcher()
+    return _fetcher
+
+
 class ImageCache(QObject):
     image_downloaded = pyqtSignal(str, str)
+    thumbnail_ready = pyqtSignal(str, QImage)
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.downloader_threads = []
+        self.requested = set()
+        self.requested_thumbnails = set()
+        image_fetcher().image_downloaded.connect(self.on_image_downloaded)
+        image_fetcher().thumbnail_ready.connect(self.on_thumbnail_ready)
 
     def get_image(self, url):
-        filename = url.split("/")[-1]
-        cache_path = os.path.join(ICON_CACHE_DIR, filename)
-
-        if os.path.exists(cache_path):
+        """Return the cached file path for url, downloading it if missing."""
+        cache_path = disk_cache.get(url)
+        if cache_path:
             return cache_path
         else:
-            self.download_image(url, cache_path)
+            self.download_image(url)
             return None
 
-    def download_image(self, url, cache_path):
-        thread = QThread()
-        downloader = ImageDownloader(url, cache_path)
-        downloader.moveToThread(thread)
+    def get_qimage(self, url):
+        """
+        Return a decoded QImage for url from memory or disk, or None.
 
-        thread.started.connect(downloader.run)
-        downloader.finished.connect(self.on_image_downloaded)
+        A miss on both tiers starts a download; image_downloaded fires once
+        the file is on disk.
+        """
+        image = memory_cache.get(url)
+        if image is not None:
+            return image
+
+        cache_path = self.get_image(url)
+        if not cache_path:
+            return None
 
-        downloader.finished.connect(thread.quit)
-        downloader.finished.connect(downloader.deleteLater)
-        thread.finished.connect(thread.deleteLater)
+        image = QImage(cache_path)
+        if image.isNull():
+            return None
+        memory_cache.put(url, image)
+        return image
+
+    def get_thumbnail(self, url, size):
+        """
+        Return a pre-sized QImage for url from memory, or None.
+
+        On a miss the thumbnail is loaded from disk, or decoded and scaled
+        from the original (downloading it first if needed), on a worker
+        pool; thumbnail_ready fires with the result, a null QImage if the
+        download or decode failed.
+        """
+        image = memory_cache.get(thumbnail_key(url, size))
+        if image is not None:
+            return image
+        self.requested_thumbnails.add((url, size))
+        image_fetcher().request_thumbnail(url, size)
+        return None
 
-        thread.start()
-        self.downloader_threads.append(thread)
+    def download_image(self, url):
+        self.requested.add(url)
+        image_fetcher().fetch(url)
 
     @pyqtSlot(str, str)
     def on_image_downloaded(self, url, path):
-        self.image_downloaded.emit(url, path)
+        # Only report downloads this cache asked for
+        if url in self.requested:
+            self.requested.discard(url)
+            self.image_downloaded.emit(url, path)
+
+    @pyqtSlot(str, int, QImage)
+    def on_thumbnail_ready(self, url, size, image):
+        if (url, size) in self.requested_thumbnails:
+            self.requested_thumbnails.discard((url, size))
+            self.thumbnail_ready.emit(url, image)
@@ -0,0 +1,297 @@
+import re
+from array import array
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, pyqtSlot
+from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QListView,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+LOG_CONSOLE_LINES = 50000
+
+# Compact level codes stored per line in the ring buffer
+DEBUG, INFO, WARN, ERROR, FATAL = range(5)
+LEVEL_CODES = {"TRACE": DEBUG, "DEBUG": DEBUG, "INFO": INFO, "WARN": WARN, "WARNING": WARN, "ERROR": ERROR, "FATAL": FATAL}
+LEVEL_COLORS = {DEBUG: "#888888", INFO: "#e0e0e0", WARN: "#ffb347", ERROR: "#ff6b6b", FATAL: "#ff3b3b"}
+
+# [12:34:56] [Render thread/INFO]: ...   (vanilla / Fabric plain-text console layout)
+LOG4J_HEADER = re.compile(r"^\[[^\]]*\] \[[^\]]*/([A-Z]+)\]")
+
+
+class Log4jLineParser:
+    """
+    Incrementally classifies game output lines by log level.
+
+    Lines without a log4j header (stack traces, wrapped messages) inherit
+    the level of the last header line, so a multi-line exception stays
+    visible under an ERROR filter.
+    """
+
+    def __init__(self):
+        self.current_level = INFO
+
+    def parse(self, line):
+        match = LOG4J_HEADER.match(line)
+        if match:
+            self.current_level = LEVEL_CODES.get(match.group(1), INFO)
+        return self.current_level
+
+    def reset(self):
+        self.current_level = INFO
+
+
+class LogRingBuffer:
+    """
+    Fixed-capacity line store.
+
+    Slots are preallocated once; level codes live in a byte array next to
+    the line slots, so memory stays flat no matter how much the game prints.
+    Lines are addressed by a monotonically increasing sequence number.
+    """
+
+    def __init__(self, capacity=LOG_CONSOLE_LINES):
+        self.capacity = capacity
+        self.lines = [None] * capacity
+        self.levels = array("b", bytes(capacity))
+        self.total = 0
+
+    @property
+    def first_seq(self):
+        return max(0, self.total - self.capacity)
+
+    def __len__(self):
+        return self.total - self.first_seq
+
+    def append(self, line, level):
+        slot = self.total % self.capacity
+        self.lines[slot] = line
+        self.levels[slot] = level
+        self.total += 1
+        return self.total - 1
+
+    def line(self, seq):
+        return self.lines[seq % self.capacity]
+
+    def level(self, seq):
+        return self.levels[seq % self.capacity]
+
+    def clear(self):
+        self.lines = [None] * self.capacity
+        self.total = 0
+
+
+class LogListModel(QAbstractListModel):
+    """
+    Virtualized view over a LogRingBuffer with level and regex filtering.
+
+    The model only keeps an array of matching sequence numbers. New lines
+    are tested against the active filter as they arrive, evicted lines are
+    trimmed from the front, and refining a plain-text search only rescans
+    the rows that already matched.
+    """
+
+    def __init__(self, buffer, parent=None):
+        super().__init__(parent)
+        self.buffer = buffer
+        self.rows = array("q")
+        self.min_level = DEBUG
+        self.search_text = ""
+        self.search_regex = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        seq = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.buffer.line(seq)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return QColor(LEVEL_COLORS[self.buffer.level(seq)])
+        return None
+
+    def _matches(self, seq):
+        if self.buffer.level(seq) < self.min_level:
+            return False
+        return self.search_regex is None or self.search_regex.search(self.buffer.line(seq)) is not None
+
+    def append_lines(self, lines, levels):
+        for line, level in zip(lines, levels):
+            self.buffer.append(line, level)
+        self._trim_evicted()
+
+        first_new = self.buffer.total - min(len(lines), self.buffer.capacity)
+        new_rows = [seq for seq in range(first_new, self.buffer.total) if self._matches(seq)]
+        if new_rows:
+            start = len(self.rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(new_rows) - 1)
+            self.rows.extend(new_rows)
+            self.endInsertRows()
+
+    def _trim_evicted(self):
+        first_seq = self.buffer.first_seq
+        count = 0
+        while count < len(self.rows) and self.rows[count] < first_seq:
+            count += 1
+        if count:
+            self.beginRemoveRows(QModelIndex(), 0, count - 1)
+            del self.rows[:count]
+            self.endRemoveRows()
+
+    def set_min_level(self, level):
+        self.min_level = level
+        self._rebuild(range(self.buffer.first_seq, self.buffer.total))
+
+    def set_search(self, text):
+        """Returns False if text is not a valid regular expression."""
+        try:
+            regex = re.compile(text, re.IGNORECASE) if text else None
+        except re.error:
+            return False
+
+        # Typing more characters of a literal search can only narrow the result
+        narrowing = (
+            self.search_text
+            and text.startswith(self.search_text)
+            and re.escape(text) == text
+            and re.escape(self.search_text) == self.search_text
+        )
+        candidates = array("q", self.rows) if narrowing else range(self.buffer.first_seq, self.buffer.total)
+
+        self.search_text = text
+        self.search_regex = regex
+        self._rebuild(candidates)
+        return True
+
+    def _rebuild(self, candidates):
+        self.beginResetModel()
+        self.rows = array("q", (seq for seq in candidates if self._matches(seq)))
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self.buffer.clear()
+        self.rows = array("q")
+        self.endResetModel()
+
+
+class LogsPage(QWidget):
+    def __init__(self, process_supervisor, parent=None):
+        super().__init__(parent)
+        self.process_supervisor = process_supervisor
+        self.parsers = {}
+
+        self.buffer = LogRingBuffer()
+        self.model = LogListModel(self.buffer, self)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(175)
+        self.search_timer.timeout.connect(self.apply_search)
+
+        self.init_ui()
+
+        self.process_supervisor.session_started.connect(self.on_session_started)
+        self.process_supervisor.output_received.connect(self.on_output_received)
+        self.process_supervisor.session_finished.connect(self.on_session_finished)
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(10)
+
+        title_label = QLabel("GAME LOG")
+        title_label.setObjectName("section_label")
+        layout.addWidget(title_label)
+
+        filter_layout = QHBoxLayout()
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search (regex)...")
+        self.search_input.textChanged.connect(self.on_search_text_changed)
+        filter_layout.addWidget(self.search_input, 1)
+
+        self.level_combo = QComboBox()
+        self.level_combo.addItem("All levels", DEBUG)
+        self.level_combo.addItem("Info and above", INFO)
+        self.level_combo.addItem("Warnings and above", WARN)
+        self.level_combo.addItem("Errors only", ERROR)
+        self.level_combo.currentIndexChanged.connect(self.on_level_changed)
+        filter_layout.addWidget(self.level_combo)
+
+        clear_button = QPushButton("Clear")
+        clear_button.setObjectName("secondary_button")
+        clear_button.clicked.connect(self.model.clear)
+        filter_layout.addWidget(clear_button)
+        layout.addLayout(filter_layout)
+
+        self.log_view = QListView()
+        self.log_view.setObjectName("log_view")
+        self.log_view.setModel(self.model)
+        self.log_view.setUniformItemSizes(True)
+        self.log_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.log_view.setBatchSize(200)
+        self.log_view.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
+        font = QFont("Consolas")
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        self.log_view.setFont(font)
+        layout.addWidget(self.log_view, 1)
+
+        self.status_label = QLabel("No game output yet.")
+        self.status_label.setObjectName("status_label")
+        layout.addWidget(self.status_label)
+
+    def append(self, session_id, lines):
+        parser = self.parsers.setdefault(session_id, Log4jLineParser())
+        levels = [parser.parse(line) for line in lines]
+
+        scrollbar = self.log_view.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        self.model.append_lines(lines, levels)
+        if at_bottom:
+            self.log_view.scrollToBottom()
+
+    def append_marker(self, text, level=INFO):
+        self.model.append_lines([text], [level])
+        self.log_view.scrollToBottom()
+
+    @pyqtSlot(int, str)
+    def on_session_started(self, session_id, label):
+        self.append_marker(f"=== Game session {session_id} ({label}) started ===")
+        self.status_label.setText(f"Streaming output from session {session_id}.")
+
+    @pyqtSlot(int, list)
+    def on_output_received(self, session_id, lines):
+        self.append(session_id, lines)
+
+    @pyqtSlot(int, int, bool)
+    def on_session_finished(self, session_id, exit_code, crashed):
+        state = "crashed" if crashed else "exited"
+        self.append_marker(f"=== Game session {session_id} {state} with code {exit_code} ===", ERROR if crashed else INFO)
+        self.parsers.pop(session_id, None)
+        self.status_label.setText(f"Session {session_id} {state} with code {exit_code}.")
+
+    @pyqtSlot(int)
+    def on_level_changed(self, index):
+        self.model.set_min_level(self.level_combo.itemData(index))
+
+    @pyqtSlot(str)
+    def on_search_text_changed(self, text):
+        if self.search_timer.isActive():
+            self.search_timer.stop()
+        self.search_timer.start()
+
+    @pyqtSlot()
+    def apply_search(self):
+        if self.model.set_search(self.search_input.text()):
+            self.search_input.setStyleSheet("")
+            self.status_label.setText(f"{self.model.rowCount()} matching lines.")
+        else:
+            self.search_input.setStyleSheet("border-color: #ff6b6b;")
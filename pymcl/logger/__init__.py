@@ -1,6 +1,17 @@
-from .logger import Logger
+from .logger import Logger, get_logger
 from .levels import LogLevel
-from .handlers import ConsoleHandler, FileHandler, Handler
+from .formatter import Formatter, JsonFormatter
+from .handlers import ConsoleHandler, FileHandler, AsyncFileHandler, Handler
 
 __version__ = "1.0.0"
-__all__ = ["Logger", "LogLevel", "ConsoleHandler", "FileHandler", "Handler"]
+__all__ = [
+    "Logger",
+    "get_logger",
+    "LogLevel",
+    "Formatter",
+    "JsonFormatter",
+    "ConsoleHandler",
+    "FileHandler",
+    "AsyncFileHandler",
+    "Handler",
+]
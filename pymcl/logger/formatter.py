@@ -1,11 +1,15 @@
+import json
+import time
 import threading
-from datetime import datetime
+from string import Formatter as _FormatParser
 from .levels import LogLevel
 
 
 class Formatter:
     """Formats log messages with consistent structure."""
 
+    FIELDS = ("timestamp", "level", "logger", "thread", "message")
+
     def __init__(self, fmt=None):
         """
         Initialize formatter.
@@ -15,6 +19,50 @@ class Formatter:
                  {timestamp}, {level}, {logger}, {thread}, {message}
         """
         self.fmt = fmt or "[{timestamp}] [{level:8}] [{logger}] [{thread}] {message}"
+        self._compile()
+
+        # (second, prefix) in one attribute so threads never see a mismatched pair
+        self._cached_timestamp = (None, "")
+
+    def _compile(self):
+        """
+        Precompile the format string into a %-template plus a field plan.
+
+        Fields are rendered positionally, level and logger names are padded
+        once and cached, and only the fields the format uses are computed.
+        """
+        template = []
+        plan = []
+        for literal, field, spec, conversion in _FormatParser().parse(self.fmt):
+            template.append(literal.replace("%", "%%"))
+            if field is None:
+                continue
+            if field not in self.FIELDS:
+                raise KeyError(field)
+            if conversion:
+                spec = f"!{conversion}:{spec}" if spec else f"!{conversion}"
+            template.append("%s")
+            plan.append((field, spec))
+
+        self._template = "".join(template)
+        self._plan = tuple(plan)
+        self._level_cache = {}
+        self._logger_cache = {}
+
+    def _format_value(self, value, spec):
+        if not spec:
+            return value
+        return ("{0" + (spec if spec.startswith("!") else ":" + spec) + "}").format(value)
+
+    def format_timestamp(self, now=None):
+        """Millisecond timestamp; the second-resolution prefix is reused."""
+        now = time.time() if now is None else now
+        second = int(now)
+        cached_second, prefix = self._cached_timestamp
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            self._cached_timestamp = (second, prefix)
+        return f"{prefix}.{int((now - second) * 1000):03d}"
 
     def format(self, logger_name, level, message):
         """
@@ -28,13 +76,37 @@ class Formatter:
         Returns:
             Formatted string
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        thread_name = threading.current_thread().name
-
-        return self.fmt.format(
-            timestamp=timestamp,
-            level=level.name,
-            logger=logger_name,
-            thread=thread_name,
-            message=message
-        )
+        values = []
+        for field, spec in self._plan:
+            if field == "message":
+                value = self._format_value(message, spec)
+            elif field == "timestamp":
+                value = self._format_value(self.format_timestamp(), spec)
+            elif field == "level":
+                value = self._level_cache.get(level)
+                if value is None:
+                    value = self._level_cache[level] = self._format_value(level.name, spec)
+            elif field == "logger":
+                value = self._logger_cache.get(logger_name)
+                if value is None:
+                    value = self._logger_cache[logger_name] = self._format_value(logger_name, spec)
+            else:
+                value = self._format_value(threading.current_thread().name, spec)
+            values.append(value)
+        return self._template % tuple(values)
+
+
+class JsonFormatter(Formatter):
+    """Formats log messages as single-line JSON objects (JSON Lines)."""
+
+    def __init__(self):
+        super().__init__()
+
+    def format(self, logger_name, level, message):
+        return json.dumps({
+            "timestamp": self.format_timestamp(),
+            "level": level.name,
+            "logger": logger_name,
+            "thread": threading.current_thread().name,
+            "message": message,
+        }, ensure_ascii=False)
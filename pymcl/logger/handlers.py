@@ -1,4 +1,9 @@
 import sys
+import gzip
+import time
+import queue
+import atexit
+import shutil
 import threading
 from pathlib import Path
 from abc import ABC, abstractmethod
@@ -9,6 +14,16 @@ class Handler(ABC):
 
     def __init__(self):
         self._lock = threading.Lock()
+        self.formatter = None
+
+    def set_formatter(self, formatter):
+        """
+        Use a formatter for this handler instead of the logger's.
+
+        Args:
+            formatter: Formatter instance (e.g. JsonFormatter), or None
+        """
+        self.formatter = formatter
 
     @abstractmethod
     def emit(self, formatted_message):
@@ -25,6 +40,10 @@ class Handler(ABC):
         with self._lock:
             self.emit(formatted_message)
 
+    def close(self):
+        """Release any resources held by the handler."""
+        pass
+
 
 class ConsoleHandler(Handler):
     """Handler that writes to console (stdout)."""
@@ -71,3 +90,191 @@ class FileHandler(Handler):
                 f.write(formatted_message + '\n')
         except Exception as e:
             print(f"ERROR: Failed to write to log file: {e}", file=sys.stderr)
+
+
+class AsyncFileHandler(Handler):
+    """
+    Queue-backed file handler.
+
+    Callers only pay for a queue put; a background writer thread keeps the
+    file open, writes messages in batches and flushes when enough data is
+    pending or the flush interval has passed. Supports size and time based
+    rotation with optional gzip of rotated files. Pending messages are
+    drained on close() and at interpreter exit.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(self, filepath, encoding='utf-8', max_bytes=0, rotate_interval=0,
+                 backup_count=5, compress=False, batch_size=512, flush_bytes=64 * 1024,
+                 flush_interval=0.5):
+        """
+        Initialize async file handler.
+
+        Args:
+            filepath: Path to log file
+            encoding: File encoding (default: 'utf-8')
+            max_bytes: Rotate once the file would exceed this size (0 disables)
+            rotate_interval: Rotate every N seconds (0 disables)
+            backup_count: Number of rotated files to keep
+            compress: Gzip rotated files
+            batch_size: Maximum number of messages written per batch
+            flush_bytes: Flush once this many bytes are buffered
+            flush_interval: Flush at least this often, in seconds
+        """
+        super().__init__()
+        self.filepath = Path(filepath)
+        self.encoding = encoding
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self.batch_size = batch_size
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._file = None
+        self._size = 0
+        self._next_rollover = 0
+        self._rotate_failed = False
+        self._open()
+
+        self._thread = threading.Thread(target=self._run, name="AsyncFileHandler", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def emit(self, formatted_message):
+        """Queue a message for the writer thread."""
+        self._queue.put(formatted_message)
+
+    def write(self, formatted_message):
+        """Queue puts are already thread-safe, so skip the handler lock."""
+        if not self._closed:
+            self._queue.put(formatted_message)
+
+    def close(self):
+        """Drain pending messages and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(self._SENTINEL)
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def _open(self):
+        self._file = open(self.filepath, 'a', encoding=self.encoding)
+        self._size = self._file.tell()
+        if self.rotate_interval:
+            self._next_rollover = time.time() + self.rotate_interval
+
+    def _run(self):
+        pending = 0
+        last_flush = time.monotonic()
+        running = True
+        while running:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                batch = []
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if any(m is self._SENTINEL for m in batch):
+                running = False
+                batch = [m for m in batch if m is not self._SENTINEL]
+
+            if batch:
+                try:
+                    pending += self._write_batch(batch)
+                except Exception as e:
+                    print(f"ERROR: Failed to write to log file: {e}", file=sys.stderr)
+
+            now = time.monotonic()
+            if pending and (pending >= self.flush_bytes or now - last_flush >= self.flush_interval or not running):
+                self._file.flush()
+                pending = 0
+                last_flush = now
+
+        self._file.close()
+
+    def _write_batch(self, batch):
+        """Write a batch with a single write() per file, rotating between messages."""
+        written = 0
+        chunk = []
+        chunk_size = 0
+        can_rotate = True
+        for message in batch:
+            line = message + '\n'
+            # max_bytes is a file size, so count encoded bytes, not characters
+            size = len(line.encode(self.encoding, errors='replace'))
+            if can_rotate and self._should_rotate(chunk_size, size):
+                if chunk:
+                    self._file.write(''.join(chunk))
+                    self._size += chunk_size
+                    written += chunk_size
+                    chunk = []
+                    chunk_size = 0
+                # Don't retry a failed rotation for every message in the batch
+                can_rotate = self._rotate()
+            chunk.append(line)
+            chunk_size += size
+
+        if chunk:
+            self._file.write(''.join(chunk))
+            self._size += chunk_size
+            written += chunk_size
+        return written
+
+    def _should_rotate(self, buffered, incoming):
+        current = self._size + buffered
+        if self.max_bytes and current and current + incoming > self.max_bytes:
+            return True
+        return bool(self.rotate_interval) and current and time.time() >= self._next_rollover
+
+    def _backup_name(self, index):
+        suffix = f".{index}.gz" if self.compress else f".{index}"
+        return self.filepath.with_name(self.filepath.name + suffix)
+
+    def _rotate(self):
+        """Roll the log file over. Returns False, still writing to the old file, if that failed."""
+        self._file.close()
+        try:
+            self._roll_files()
+        except OSError as e:
+            if not self._rotate_failed:
+                print(f"ERROR: Failed to rotate log file, still writing to it: {e}", file=sys.stderr)
+                self._rotate_failed = True
+            self._open()
+            return False
+
+        self._rotate_failed = False
+        self._open()
+        return True
+
+    def _roll_files(self):
+        if self.backup_count > 0:
+            oldest = self._backup_name(self.backup_count)
+            if oldest.exists():
+                oldest.unlink()
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self._backup_name(index)
+                if source.exists():
+                    source.replace(self._backup_name(index + 1))
+
+            if self.compress:
+                with open(self.filepath, 'rb') as src, gzip.open(self._backup_name(1), 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                self.filepath.unlink()
+            else:
+                self.filepath.replace(self._backup_name(1))
+        else:
+            self.filepath.unlink()
@@ -1,20 +1,35 @@
+import threading
+
 from .levels import LogLevel
 from .formatter import Formatter
 from .handlers import Handler, ConsoleHandler
 
+_DEBUG = LogLevel.DEBUG.value
+_INFO = LogLevel.INFO.value
+_WARNING = LogLevel.WARNING.value
+_ERROR = LogLevel.ERROR.value
+
+_loggers = {}
+_loggers_lock = threading.RLock()
+
+
 class Logger:
-     def __init__(self, name="app", min_level=LogLevel.INFO):
+    def __init__(self, name="app", min_level=LogLevel.INFO, parent=None):
         """
         Initialize logger.
 
         Args:
             name: Logger name (appears in log messages)
-            min_level: Minimum log level to display
+            min_level: Minimum log level to display, or None to inherit
+                       the level of the parent logger
+            parent: Parent logger that also receives this logger's messages
         """
         self.name = name
-        self.min_level = min_level
+        self.parent = parent
+        self.propagate = True
         self.formatter = Formatter()
         self.handlers = []
+        self.min_level = min_level
 
     def add_handler(self, handler):
         """
@@ -28,6 +43,16 @@ class Logger:
         else:
             raise TypeError("Handler must be an instance of Handler class")
 
+    def remove_handler(self, handler):
+        """
+        Remove a previously added handler.
+
+        Args:
+            handler: Handler instance
+        """
+        if handler in self.handlers:
+            self.handlers.remove(handler)
+
     def set_formatter(self, formatter):
         """
         Set custom formatter.
@@ -42,38 +67,115 @@ class Logger:
         Set minimum log level.
 
         Args:
-            level: LogLevel enum value
+            level: LogLevel enum value, or None to inherit from the parent
         """
         self.min_level = level
 
-    def _log(self, level, message):
-        """Internal logging method."""
-        if level < self.min_level:
-            return
-
-        # Format message once
-        formatted = self.formatter.format(self.name, level, message)
+    @property
+    def min_level(self):
+        return self._min_level
+
+    @min_level.setter
+    def min_level(self, level):
+        self._min_level = level
+        self._update_effective_level()
+        for child in _children_of(self):
+            child._update_effective_level()
+
+    @property
+    def effective_level(self):
+        logger = self
+        while logger is not None:
+            if logger._min_level is not None:
+                return logger._min_level
+            logger = logger.parent
+        return LogLevel.INFO
+
+    def _update_effective_level(self):
+        # Plain int so level checks on hot paths avoid LogLevel.__lt__
+        self._min_value = self.effective_level.value
+
+    def is_enabled_for(self, level):
+        """Return True if a message at level would be logged."""
+        return level.value >= self._min_value
+
+    def _log(self, level, message, args):
+        """
+        Internal logging method.
 
-        # Write to all handlers
-        for handler in self.handlers:
-            handler.write(formatted)
+        %-style args are only rendered once the level check has passed.
+        """
+        if level.value < self._min_value:
+            return
 
-    def debug(self, message):
+        if args:
+            message = message % args
+
+        # Format message once per formatter, then write to this logger's
+        # handlers and those of its ancestors
+        formatted = None
+        logger = self
+        while logger is not None:
+            for handler in logger.handlers:
+                if handler.formatter is not None:
+                    handler.write(handler.formatter.format(self.name, level, message))
+                    continue
+                if formatted is None:
+                    formatted = self.formatter.format(self.name, level, message)
+                handler.write(formatted)
+            logger = logger.parent if logger.propagate else None
+
+    def debug(self, message, *args):
         """Log debug message."""
-        self._log(LogLevel.DEBUG, message)
+        if self._min_value <= _DEBUG:
+            self._log(LogLevel.DEBUG, message, args)
 
-    def info(self, message):
+    def info(self, message, *args):
         """Log info message."""
-        self._log(LogLevel.INFO, message)
+        if self._min_value <= _INFO:
+            self._log(LogLevel.INFO, message, args)
 
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log warning message."""
-        self._log(LogLevel.WARNING, message)
+        if self._min_value <= _WARNING:
+            self._log(LogLevel.WARNING, message, args)
 
-    def error(self, message):
+    def error(self, message, *args):
         """Log error message."""
-        self._log(LogLevel.ERROR, message)
+        if self._min_value <= _ERROR:
+            self._log(LogLevel.ERROR, message, args)
 
-    def critical(self, message):
+    def critical(self, message, *args):
         """Log critical message."""
-        self._log(LogLevel.CRITICAL, message)
+        self._log(LogLevel.CRITICAL, message, args)
+
+
+def _children_of(logger):
+    prefix = logger.name + "."
+    return [l for name, l in list(_loggers.items()) if name.startswith(prefix)]
+
+
+def get_logger(name):
+    """
+    Return the shared logger for a dotted name, creating it if needed.
+
+    Loggers form a hierarchy by name: "pymcl.net" is a child of "pymcl".
+    Children inherit their parent's level until one is set explicitly and
+    pass their messages on to the parent's handlers.
+
+    Args:
+        name: Dotted logger name, e.g. "pymcl.net"
+    """
+    with _loggers_lock:
+        logger = _loggers.get(name)
+        if logger is not None:
+            return logger
+
+        parent = None
+        if "." in name:
+            parent_name = name.rsplit(".", 1)[0]
+            parent = get_logger(parent_name)
+
+        logger = Logger(name, LogLevel.INFO if parent is None else None, parent)
+        _loggers[name] = logger
+        return logger
@@ -0,0 +1,78 @@
+import os
+
+from .constants import LOGS_DIR, settings
+from .logger import (
+    AsyncFileHandler,
+    ConsoleHandler,
+    JsonFormatter,
+    LogLevel,
+    get_logger,
+)
+
+# Subsystem loggers; all of them propagate to the "pymcl" root logger
+SUBSYSTEMS = ("pymcl.net", "pymcl.mods", "pymcl.install", "pymcl.ui")
+
+DEFAULT_LOGGING = {
+    "levels": {"pymcl": "INFO"},
+    "console": False,
+    "file": True,
+    "json": False,
+}
+
+
+def configure_logging(config=None):
+    """
+    Attach handlers to the "pymcl" root logger and apply per-logger levels.
+
+    config defaults to the "logging" section of settings.json, e.g.:
+
+        "logging": {
+            "levels": {"pymcl": "INFO", "pymcl.net": "DEBUG"},
+            "console": false,
+            "file": true,
+            "json": false
+        }
+
+    "file" writes a rotated text log and "json" a JSON Lines log to LOGS_DIR,
+    both through the async handler so logging never blocks on disk I/O.
+    """
+    config = {**DEFAULT_LOGGING, **(config if config is not None else settings.get("logging", {}))}
+    root = get_logger("pymcl")
+
+    for name in SUBSYSTEMS:
+        get_logger(name)
+
+    for name, level_name in config.get("levels", {}).items():
+        try:
+            level = LogLevel[str(level_name).upper()]
+        except KeyError:
+            root.warning("Unknown log level %r for logger %s", level_name, name)
+            continue
+        get_logger(name).set_level(level)
+
+    for handler in list(root.handlers):
+        root.remove_handler(handler)
+        handler.close()
+
+    if config.get("console"):
+        root.add_handler(ConsoleHandler())
+
+    if config.get("file"):
+        root.add_handler(AsyncFileHandler(
+            os.path.join(LOGS_DIR, "launcher.log"),
+            max_bytes=5 * 1024 * 1024,
+            backup_count=3,
+            compress=True,
+        ))
+
+    if config.get("json"):
+        json_handler = AsyncFileHandler(
+            os.path.join(LOGS_DIR, "launcher.jsonl"),
+            max_bytes=5 * 1024 * 1024,
+            backup_count=3,
+            compress=True,
+        )
+        json_handler.set_formatter(JsonFormatter())
+        root.add_handler(json_handler)
+
+    return root
@@ -1,19 +1,45 @@
+from .startup_profile import profiler
+
 import sys
 import os
 import shutil
 
+from PyQt6.QtCore import QEvent, QObject, QTimer
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QApplication
 
-from .main_window import MainWindow
 from .constants import MINECRAFT_DIR, IMAGES_DIR, MODS_DIR, ICON_CACHE_DIR
+from .logging_config import configure_logging
+
+
+def _rich_excepthook(exc_type, exc, tb):
+    # rich is only imported once something actually crashes
+    try:
+        from rich.traceback import install
+
+        install(show_locals=True)
+    except Exception:
+        sys.excepthook = sys.__excepthook__ # aww the user doesnt have vim
+    sys.excepthook(exc_type, exc, tb)
+
+
+sys.excepthook = _rich_excepthook
 
-try:
-    from rich.traceback import install
 
-    install(show_locals=True)
-except Exception:
-    pass # aww the user doesnt have vim
+class _FirstPaintWatcher(QObject):
+    """Calls callback once the watched window has handled its first paint event."""
+
+    def __init__(self, window, callback):
+        super().__init__(window)
+        self.window = window
+        self.callback = callback
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            self.window.removeEventFilter(self)
+            QTimer.singleShot(0, self.callback)
+        return False
 
 
 def check_dirs() -> None:
@@ -25,8 +51,14 @@ def check_dirs() -> None:
 
 
 def main():
-    check_dirs()
-    app = QApplication(sys.argv)
+    profiler.enabled = "--profile-startup" in sys.argv
+    profiler.mark("python + base imports")
+
+    with profiler.phase("check_dirs + logging"):
+        check_dirs()
+        configure_logging()
+    with profiler.phase("QApplication"):
+        app = QApplication(sys.argv)
 
     font = QFont("Segoe UI")
     if font.family() != "Segoe UI":
@@ -34,7 +66,20 @@ def main():
     font.setStyleHint(QFont.StyleHint.SansSerif)
     app.setFont(font)
 
-    window = MainWindow()
+    with profiler.phase("import main_window"):
+        from .main_window import MainWindow
+    with profiler.phase("MainWindow()"):
+        window = MainWindow()
+
+    if profiler.enabled:
+        first_paint_start = profiler.now()
+
+        def report_and_quit():
+            profiler.mark("show -> first paint", since=first_paint_start)
+            print(profiler.report())
+            app.quit()
+        _FirstPaintWatcher(window, report_and_quit)
+
     window.show()
     sys.exit(app.exec())
 
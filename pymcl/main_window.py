@@ -1,11 +1,9 @@
 import glob
-import json
 import os
-import shutil
 from PyQt6 import sip
 import uuid
-from PyQt6.QtCore import QThread, pyqtSlot, Qt, QTimer, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup, QPoint
-from PyQt6.QtGui import QColor, QFont, QCloseEvent
+from PyQt6.QtCore import QEvent, QThread, pyqtSlot, Qt, QTimer, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup, QPoint
+from PyQt6.QtGui import QColor, QFont, QCloseEvent, QPainter
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -21,24 +19,47 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QScrollArea,
     QSlider,
+    QSpinBox,
     QStackedWidget,
     QVBoxLayout,
     QWidget,
 )
 
+from .settings_store import settings_store
 from .constants import (
     APP_NAME,
     IMAGES_DIR,
-    VERSIONS_CACHE_PATH,
     ICON_CACHE_DIR,
     MicrosoftInfo
 )
-from .mod_manager import ModsPage
 from .stylesheet import STYLESHEET
 from .workers import ImageDownloader, VersionFetcher, Worker
+from .core import launch_options, job_pool, background_pool
+from .prefetch import Prefetcher, PREFETCH_DELAY_MS
+from .bandwidth import DEFAULT_LIMITS, SETTINGS_KEYS, FOREGROUND, BACKGROUND
+from .net import update_peer_server, stop_peer_server
+from .version_manifest import version_manifest, RELEASE, SNAPSHOT, VERSION_TYPES
+from .version_picker import VersionComboBox
+from .process_supervisor import ProcessSupervisor
+from .image_cache import clear_image_caches
+from .background import BackgroundRenderer
+from .log_console import LogsPage
 from .microsoft_auth import MicrosoftAuth
-from .actions import setup_actions_and_menus
-from .mod_browser import ModBrowserPage
+from .actions import setup_actions_and_menus, install_mods_context_menu
+from .startup_profile import profiler
+from .logger import get_logger
+
+logger = get_logger("pymcl.ui")
+
+# Sent when the window moves to a screen with another scale (Qt 6.6+)
+DEVICE_PIXEL_RATIO_CHANGE = getattr(QEvent.Type, "DevicePixelRatioChange", None)
+
+# Version type filter choices: settings key -> (label, manifest types shown)
+VERSION_FILTERS = {
+    "release": ("Releases", (RELEASE,)),
+    "snapshot": ("Releases + snapshots", (RELEASE, SNAPSHOT)),
+    "all": ("All versions", VERSION_TYPES),
+}
 
 
 class LaunchPage(QWidget):
@@ -92,10 +113,20 @@ class LaunchPage(QWidget):
 
         layout.addSpacing(5)
 
-        self.version_combo = QComboBox()
+        version_layout = QHBoxLayout()
+        version_layout.setSpacing(15)
+
+        self.version_combo = VersionComboBox()
         self.version_combo.setPlaceholderText("Loading versions...")
         self.version_combo.setMinimumHeight(55)
-        layout.addWidget(self.version_combo)
+        version_layout.addWidget(self.version_combo, 1)
+
+        self.version_type_combo = QComboBox()
+        for key, (label, _types) in VERSION_FILTERS.items():
+            self.version_type_combo.addItem(label, key)
+        self.version_type_combo.setMinimumHeight(55)
+        version_layout.addWidget(self.version_type_combo)
+        layout.addLayout(version_layout)
 
         layout.addSpacing(15)
 
@@ -267,6 +298,36 @@ class SettingsPage(QWidget):
         resolution_layout.addWidget(self.height_input)
         layout.addLayout(resolution_layout)
 
+        # Background prefetch setting
+        prefetch_label = QLabel("BACKGROUND DOWNLOADS")
+        prefetch_label.setObjectName("section_label")
+        layout.addWidget(prefetch_label)
+
+        self.prefetch_checkbox = QCheckBox("Download the last played version and latest release in the background")
+        layout.addWidget(self.prefetch_checkbox)
+
+        # LAN cache settings
+        lan_cache_label = QLabel("LAN CACHE")
+        lan_cache_label.setObjectName("section_label")
+        layout.addWidget(lan_cache_label)
+
+        self.lan_cache_client_checkbox = QCheckBox("Get game files and mods from other launchers on this network first")
+        layout.addWidget(self.lan_cache_client_checkbox)
+        self.lan_cache_server_checkbox = QCheckBox("Share downloaded game files and mods with other launchers on this network")
+        layout.addWidget(self.lan_cache_server_checkbox)
+
+        # Bandwidth limit settings
+        bandwidth_label = QLabel("BANDWIDTH LIMITS")
+        bandwidth_label.setObjectName("section_label")
+        layout.addWidget(bandwidth_label)
+
+        bandwidth_layout = QHBoxLayout()
+        self.foreground_bandwidth_spinbox = self._bandwidth_spinbox("Launch & mods: ")
+        bandwidth_layout.addWidget(self.foreground_bandwidth_spinbox)
+        self.background_bandwidth_spinbox = self._bandwidth_spinbox("Background: ")
+        bandwidth_layout.addWidget(self.background_bandwidth_spinbox)
+        layout.addLayout(bandwidth_layout)
+
         layout.addStretch(1)
 
         save_button = QPushButton("Save Settings")
@@ -283,6 +344,17 @@ class SettingsPage(QWidget):
 
         self.load_settings()
 
+    @staticmethod
+    def _bandwidth_spinbox(prefix):
+        spinbox = QSpinBox()
+        spinbox.setRange(0, 1024 * 1024)
+        spinbox.setSingleStep(256)
+        spinbox.setPrefix(prefix)
+        spinbox.setSuffix(" KiB/s")
+        spinbox.setSpecialValueText(f"{prefix}unlimited")
+        spinbox.setMinimumHeight(45)
+        return spinbox
+
     def browse_file(self, line_edit):
         file, _ = QFileDialog.getOpenFileName(self, "Select File")
         if file:
@@ -297,70 +369,56 @@ class SettingsPage(QWidget):
             line_edit.setText(directory)
 
     def load_settings(self):
-        if not os.path.exists("pymcl/config/settings.json"):
-            return
-
-        try:
-            with open("pymcl/config/settings.json", "r") as f:
-                settings = json.load(f)
-                self.mods_dir_input.setText(settings.get("mods_dir", ""))
-                self.images_dir_input.setText(settings.get("images_dir", ""))
-                self.java_executable_input.setText(settings.get("java_executable", ""))
-                self.jvm_args_input.setText(settings.get("jvm_arguments", ""))
-                self.memory_slider.setValue(settings.get("memory_gb", 4))
-                self.update_memory_label(self.memory_slider.value())
-                resolution = settings.get("resolution", {})
-                self.width_input.setText(resolution.get("width", ""))
-                self.height_input.setText(resolution.get("height", ""))
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"Error loading settings: {e}")
+        self.mods_dir_input.setText(settings_store.get("mods_dir", ""))
+        self.images_dir_input.setText(settings_store.get("images_dir", ""))
+        self.java_executable_input.setText(settings_store.get("java_executable", ""))
+        self.jvm_args_input.setText(settings_store.get("jvm_arguments", ""))
+        self.memory_slider.setValue(settings_store.get("memory_gb", 4))
+        self.update_memory_label(self.memory_slider.value())
+        resolution = settings_store.get("resolution", {})
+        self.width_input.setText(resolution.get("width", ""))
+        self.height_input.setText(resolution.get("height", ""))
+        self.prefetch_checkbox.setChecked(settings_store.get("prefetch_enabled", False))
+        self.lan_cache_client_checkbox.setChecked(settings_store.get("lan_cache_client", False))
+        self.lan_cache_server_checkbox.setChecked(settings_store.get("lan_cache_server", False))
+        self.foreground_bandwidth_spinbox.setValue(settings_store.get(SETTINGS_KEYS[FOREGROUND], DEFAULT_LIMITS[FOREGROUND]))
+        self.background_bandwidth_spinbox.setValue(settings_store.get(SETTINGS_KEYS[BACKGROUND], DEFAULT_LIMITS[BACKGROUND]))
 
     def save_settings(self):
-        try:
-            with open("pymcl/config/settings.json", "r+") as f:
-                settings = json.load(f)
-                settings["mods_dir"] = self.mods_dir_input.text().strip()
-                settings["images_dir"] = self.images_dir_input.text().strip()
-                settings["java_executable"] = self.java_executable_input.text().strip()
-                settings["jvm_arguments"] = self.jvm_args_input.text().strip()
-                settings["memory_gb"] = self.memory_slider.value()
-                settings["resolution"] = {
-                    "width": self.width_input.text().strip(),
-                    "height": self.height_input.text().strip()
-                }
-                f.seek(0)
-                json.dump(settings, f, indent=4)
-                f.truncate()
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
-            os.makedirs("pymcl/config", exist_ok=True)
-            with open("pymcl/config/settings.json", "w") as f:
-                settings = {
-                    "mods_dir": self.mods_dir_input.text().strip(),
-                    "images_dir": self.images_dir_input.text().strip(),
-                    "java_executable": self.java_executable_input.text().strip(),
-                    "jvm_arguments": self.jvm_args_input.text().strip(),
-                    "memory_gb": self.memory_slider.value(),
-                    "resolution": {
-                        "width": self.width_input.text().strip(),
-                        "height": self.height_input.text().strip()
-                    }
-                }
-                json.dump(settings, f, indent=4)
+        settings_store.update({
+            "mods_dir": self.mods_dir_input.text().strip(),
+            "images_dir": self.images_dir_input.text().strip(),
+            "java_executable": self.java_executable_input.text().strip(),
+            "jvm_arguments": self.jvm_args_input.text().strip(),
+            "memory_gb": self.memory_slider.value(),
+            "resolution": {
+                "width": self.width_input.text().strip(),
+                "height": self.height_input.text().strip()
+            },
+            "prefetch_enabled": self.prefetch_checkbox.isChecked(),
+            "lan_cache_client": self.lan_cache_client_checkbox.isChecked(),
+            "lan_cache_server": self.lan_cache_server_checkbox.isChecked(),
+            SETTINGS_KEYS[FOREGROUND]: self.foreground_bandwidth_spinbox.value(),
+            SETTINGS_KEYS[BACKGROUND]: self.background_bandwidth_spinbox.value(),
+        })
+        # An explicit save should not wait for the write-behind delay
+        settings_store.flush()
         QMessageBox.information(self, "Settings Saved", "Your settings have been saved. Some changes may require a restart to take effect.")
 
 
 class MainWindow(QMainWindow):
+    LAUNCH_PAGE, MODS_PAGE, BROWSE_PAGE, SETTINGS_PAGE, LOGS_PAGE = range(5)
+
     def __init__(self):
         super().__init__()
-        self.worker_thread = None
+        self._pages = {}
         self.worker = None
-        self.version_fetch_thread = None
         self.version_fetcher = None
-        self.image_downloader_thread = None
         self.image_downloader = None
+        self.prefetch_thread = None
+        self.prefetcher = None
         self.bg_timer = None
         self.minecraft_info: MicrosoftInfo | None = None
-        self.current_background_style = ""
         self.last_version = None
 
         self.image_files = []
@@ -374,15 +432,34 @@ class MainWindow(QMainWindow):
         self.microsoft_auth.login_success.connect(self.on_login_success)
         self.microsoft_auth.login_failed.connect(self.update_status)
 
-        self.init_ui()
-        self.load_settings()
-        self.apply_styles()
-        self.add_shadow_effects()
-        self.populate_versions()
-        self.init_background_images()
-        self.load_microsoft_info()
-
-        setup_actions_and_menus(self)
+        self.process_supervisor = ProcessSupervisor(self)
+        self.process_supervisor.session_started.connect(self.update_prefetch_state)
+        self.process_supervisor.session_finished.connect(self.on_game_finished)
+        self.process_supervisor.stats_updated.connect(self.on_game_stats)
+
+        self.background = BackgroundRenderer(self)
+        self.background.changed.connect(self.update)
+
+        with profiler.phase("init_ui"):
+            self.init_ui()
+        with profiler.phase("load_settings"):
+            self.load_settings()
+        with profiler.phase("apply_styles"):
+            self.apply_styles()
+            self.add_shadow_effects()
+        with profiler.phase("populate_versions"):
+            self.populate_versions()
+        with profiler.phase("init_background_images"):
+            self.init_background_images()
+        with profiler.phase("load_microsoft_info"):
+            self.load_microsoft_info()
+        with profiler.phase("actions and menus"):
+            setup_actions_and_menus(self)
+
+        if settings_store.get("prefetch_enabled", False):
+            QTimer.singleShot(PREFETCH_DELAY_MS, self.start_prefetch)
+        # Shares game files with LAN peers if enabled; follows the setting from now on
+        update_peer_server()
 
     def show(self):
         super().show()
@@ -395,18 +472,13 @@ class MainWindow(QMainWindow):
         self.animation.start()
 
     def load_settings(self):
-        if not os.path.exists("pymcl/config/settings.json"):
-            return
-
-        try:
-            with open("pymcl/config/settings.json", "r") as f:
-                settings = json.load(f)
-                last_username = settings.get("last_username", "")
-                self.last_version = settings.get("last_version", "")
-                if last_username:
-                    self.launch_page.username_input.setText(last_username)
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"Error loading settings: {e}")
+        last_username = settings_store.get("last_username", "")
+        self.last_version = settings_store.get("last_version", "")
+        if last_username:
+            self.launch_page.username_input.setText(last_username)
+        filter_index = self.launch_page.version_type_combo.findData(settings_store.get("version_filter", "release"))
+        if filter_index != -1:
+            self.launch_page.version_type_combo.setCurrentIndex(filter_index)
 
     def init_ui(self):
         central_widget = QWidget()
@@ -460,6 +532,11 @@ class MainWindow(QMainWindow):
         self.nav_settings_button.setCursor(Qt.CursorShape.PointingHandCursor)
         left_layout.addWidget(self.nav_settings_button)
 
+        self.nav_logs_button = QPushButton("Logs")
+        self.nav_logs_button.setObjectName("nav_button")
+        self.nav_logs_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        left_layout.addWidget(self.nav_logs_button)
+
         left_layout.addStretch(1)
         main_layout.addWidget(left_widget, 2)
 
@@ -474,37 +551,80 @@ class MainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget()
         content_layout.addWidget(self.stacked_widget)
 
+        # Only the launch page is built up front. Mods, browser and settings
+        # start as empty placeholders and are built the first time they are
+        # shown; the log console is cheap and has to capture output from the
+        # first launch, so it is built eagerly too.
         self.launch_page = LaunchPage()
-        self.settings_page = SettingsPage()
-        self.mods_page = ModsPage()
-        self.mod_browser_page = ModBrowserPage()
+        self.logs_page = LogsPage(self.process_supervisor)
+        self._pages[self.LAUNCH_PAGE] = self.launch_page
+        self._pages[self.LOGS_PAGE] = self.logs_page
 
-        self.stacked_widget.addWidget(self.launch_page)
-        self.stacked_widget.addWidget(self.mods_page)
-        self.stacked_widget.addWidget(self.mod_browser_page)
-        self.stacked_widget.addWidget(self.settings_page)
+        for index in range(self.LOGS_PAGE + 1):
+            self.stacked_widget.addWidget(self._pages.get(index) or QWidget())
 
         self.nav_launch_button.clicked.connect(lambda: self.switch_page(0, self.nav_launch_button))
         self.nav_mods_button.clicked.connect(lambda: self.switch_page(1, self.nav_mods_button))
         self.nav_browse_mods_button.clicked.connect(lambda: self.switch_page(2, self.nav_browse_mods_button))
         self.nav_settings_button.clicked.connect(lambda: self.switch_page(3, self.nav_settings_button))
+        self.nav_logs_button.clicked.connect(lambda: self.switch_page(4, self.nav_logs_button))
 
         # Connect signals from launch page to main window slots
         self.launch_page.username_input.textChanged.connect(self.save_settings)
         self.launch_page.auth_method_combo.currentTextChanged.connect(self.update_auth_widgets)
+        self.launch_page.version_type_combo.currentIndexChanged.connect(self.on_version_filter_changed)
         self.launch_page.microsoft_login_button.clicked.connect(self.start_microsoft_login)
         self.launch_page.launch_button.clicked.connect(self.start_launch)
         self.launch_page.mod_manager_button.clicked.connect(self.open_mod_manager)
 
         self.update_auth_widgets()
 
+    def page(self, index):
+        """Return the page at index, building it on first use."""
+        page = self._pages.get(index)
+        if page is not None:
+            return page
+
+        with profiler.phase(f"build page {index}"):
+            if index == self.MODS_PAGE:
+                from .mod_manager import ModsPage
+                page = ModsPage()
+                install_mods_context_menu(self.action_handler, page)
+            elif index == self.BROWSE_PAGE:
+                from .mod_browser import ModBrowserPage
+                page = ModBrowserPage()
+            elif index == self.SETTINGS_PAGE:
+                page = SettingsPage()
+            else:
+                raise IndexError(f"No page at index {index}")
+
+        placeholder = self.stacked_widget.widget(index)
+        self.stacked_widget.insertWidget(index, page)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._pages[index] = page
+        return page
+
+    @property
+    def mods_page(self):
+        return self.page(self.MODS_PAGE)
+
+    @property
+    def mod_browser_page(self):
+        return self.page(self.BROWSE_PAGE)
+
+    @property
+    def settings_page(self):
+        return self.page(self.SETTINGS_PAGE)
+
     def switch_page(self, index, button):
         current_index = self.stacked_widget.currentIndex()
         if index == current_index:
             return
+        self.page(index)
 
         # Pass launch options to mod browser
-        if self.stacked_widget.widget(index) == self.mod_browser_page:
+        if index == self.BROWSE_PAGE:
             version = self.launch_page.version_combo.currentText()
             mod_loader = self.launch_page.mod_loader_combo.currentText()
             loader_param = None
@@ -515,10 +635,11 @@ class MainWindow(QMainWindow):
             self.mod_browser_page.set_launch_filters(version, loader_param)
 
         # Update nav button styles
-        for btn in [self.nav_launch_button, self.nav_mods_button, self.nav_browse_mods_button, self.nav_settings_button]:
-            btn.setObjectName("nav_button")
-        button.setObjectName("nav_button_active")
-        self.apply_styles()
+        for btn in [self.nav_launch_button, self.nav_mods_button, self.nav_browse_mods_button, self.nav_settings_button, self.nav_logs_button]:
+            name = "nav_button_active" if btn is button else "nav_button"
+            if btn.objectName() != name:
+                btn.setObjectName(name)
+                self._repolish(btn)
 
         # Animation
         self.slide_animation = self._create_slide_animation(index, current_index)
@@ -593,7 +714,33 @@ class MainWindow(QMainWindow):
                 self.update_status("Failed to refresh token. Please login again.")
 
     def apply_styles(self):
-        self.setStyleSheet(STYLESHEET + self.current_background_style)
+        # Static; applied once. The wallpaper is painted separately by
+        # BackgroundRenderer, so nothing here changes at runtime.
+        self.setStyleSheet(STYLESHEET)
+
+    @staticmethod
+    def _repolish(widget):
+        """Re-match stylesheet rules for one widget after its objectName changed."""
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        painter = QPainter(self)
+        self.background.paint(painter, self.rect())
+        painter.end()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.background.resize(self.size(), self.devicePixelRatioF())
+
+    def event(self, event):
+        # Moving to a screen with another scale doesn't always resize the window
+        if event.type() == DEVICE_PIXEL_RATIO_CHANGE:
+            self.background.resize(self.size(), self.devicePixelRatioF())
+        return super().event(event)
 
     def add_shadow_effects(self):
         shadow = QGraphicsDropShadowEffect()
@@ -609,33 +756,22 @@ class MainWindow(QMainWindow):
         self.findChild(QFrame, "title_frame").setGraphicsEffect(title_shadow)
 
     def init_background_images(self):
-        print("Initializing background images...")
+        logger.debug("Initializing background images")
         self.image_files = glob.glob(os.path.join(IMAGES_DIR, "*.png")) + glob.glob(
             os.path.join(IMAGES_DIR, "*.jpg")
         )
 
         if not self.image_files:
-            print("No images found. Downloading default image.")
-            self.image_downloader_thread = QThread()
+            logger.info("No background images found, downloading default image")
             self.image_downloader = ImageDownloader()
-            self.image_downloader.moveToThread(self.image_downloader_thread)
-
-            self.image_downloader_thread.started.connect(self.image_downloader.run)
             self.image_downloader.finished.connect(self.on_image_downloaded)
-
-            self.image_downloader.finished.connect(self.image_downloader_thread.quit)
-            self.image_downloader.finished.connect(self.image_downloader.deleteLater)
-            self.image_downloader_thread.finished.connect(
-                self.image_downloader_thread.deleteLater
-            )
-
-            self.image_downloader_thread.start()
+            self.image_downloader.start()
         else:
-            print(f"Found {len(self.image_files)} images.")
+            logger.debug("Found %d background images", len(self.image_files))
             self.update_background_image()
 
             if len(self.image_files) > 1:
-                print("Starting background image timer...")
+                logger.debug("Starting background image timer")
                 self.bg_timer = QTimer(self)
                 self.bg_timer.timeout.connect(self.update_background_image)
                 self.bg_timer.start(30000)
@@ -647,7 +783,7 @@ class MainWindow(QMainWindow):
             self.current_image_index = 0
             self.update_background_image()
         else:
-            print(f"Failed to download background image: {path}")
+            logger.warning("Failed to download background image: %s", path)
 
     @pyqtSlot()
     def update_background_image(self):
@@ -659,18 +795,12 @@ class MainWindow(QMainWindow):
             self.image_files
         )
 
-        css_path = path.replace("\\", "/")
-        print(f"Setting background to: {css_path}")
+        logger.debug("Setting background to %s", path)
+        self.background.set_image(path)
 
-        self.current_background_style = f"""
-        QMainWindow {{
-            background-image: url('{css_path}');
-            background-position: center;
-            background-repeat: no-repeat;
-            background-attachment: fixed;
-        }} """
-
-        self.apply_styles()
+        # Have the next slideshow image scaled before the timer fires
+        if len(self.image_files) > 1:
+            self.background.prepare(self.image_files[self.current_image_index])
 
     @pyqtSlot()
     def open_mod_manager(self):
@@ -680,69 +810,33 @@ class MainWindow(QMainWindow):
         self.launch_page.status_label.setText("Loading versions...")
         self.launch_page.version_combo.setEnabled(False)
 
-        cached_versions = self.load_versions_from_cache()
-        if cached_versions:
-            self.launch_page.version_combo.clear()
-            self.launch_page.version_combo.addItems(cached_versions)
-            
-            if self.last_version and self.last_version in cached_versions:
-                index = self.launch_page.version_combo.findText(self.last_version)
-                if index != -1:
-                    self.launch_page.version_combo.setCurrentIndex(index)
-            
+        if version_manifest.load():
+            self.show_versions()
             self.launch_page.version_combo.setPlaceholderText("Select a version")
             self.launch_page.status_label.setText("Ready (versions fetched from cache)")
             self.launch_page.version_combo.setEnabled(True)
+            if version_manifest.is_fresh():
+                logger.debug("Version manifest cache is within its TTL")
+                return
         else:
             self.launch_page.status_label.setText("Fetching version list...")
             self.launch_page.version_combo.setPlaceholderText("Loading...")
 
-        self.version_fetch_thread = QThread()
         self.version_fetcher = VersionFetcher()
-        self.version_fetcher.moveToThread(self.version_fetch_thread)
-
-        self.version_fetch_thread.started.connect(self.version_fetcher.run)
-        self.version_fetcher.finished.connect(self._update_version_combo)
-
-        self.version_fetcher.finished.connect(self.version_fetch_thread.quit)
-        self.version_fetcher.finished.connect(self.version_fetcher.deleteLater)
-        self.version_fetch_thread.finished.connect(
-            self.version_fetch_thread.deleteLater
-        )
-
-        self.version_fetch_thread.start()
+        self.version_fetcher.finished.connect(self.on_versions_fetched)
+        self.version_fetcher.start()
 
-    @pyqtSlot(list, bool, str)
-    def _update_version_combo(self, versions, success, message):
+    @pyqtSlot(bool, bool, str)
+    def on_versions_fetched(self, changed, success, message):
         if success:
-            current_versions = [
-                self.launch_page.version_combo.itemText(i)
-                for i in range(self.launch_page.version_combo.count())
-            ]
-
-            if current_versions != versions:
-                print("Updating version list from network...")
-                current_selection = self.launch_page.version_combo.currentText()
-                self.launch_page.version_combo.clear()
-                self.launch_page.version_combo.addItems(versions)
-
-                # Restore previous selection or load last played version
-                if current_selection and current_selection in versions:
-                     index = self.launch_page.version_combo.findText(current_selection)
-                     if index != -1:
-                         self.launch_page.version_combo.setCurrentIndex(index)
-                elif self.last_version and self.last_version in versions:
-                     index = self.launch_page.version_combo.findText(self.last_version)
-                     if index != -1:
-                         self.launch_page.version_combo.setCurrentIndex(index)
-
+            if changed:
+                logger.debug("Updating version list from network")
+                self.show_versions()
                 self.launch_page.status_label.setText("Versions updated")
             else:
-                print("Cached versions are up-to-date.")
+                logger.debug("Cached versions are up-to-date")
                 if not self.launch_page.status_label.text().startswith("Ready"):
                     self.launch_page.status_label.setText("Ready to launch")
-
-            self.save_versions_to_cache(versions)
             self.launch_page.version_combo.setPlaceholderText("Select a version")
 
         else:
@@ -752,47 +846,42 @@ class MainWindow(QMainWindow):
 
         self.launch_page.version_combo.setEnabled(True)
 
-    def load_versions_from_cache(self):
-        if not os.path.exists(VERSIONS_CACHE_PATH):
-            return None
-        try:
-            with open(VERSIONS_CACHE_PATH, "r") as f:
-                data = json.load(f)
-                versions = data.get("release_versions", [])
-                if versions:
-                    print(f"Loaded {len(versions)} versions from cache.")
-                    return versions
-        except Exception as e:
-            print(f"Error loading version cache: {e}")
-            return None
-        return None
+    def selected_version_types(self):
+        key = self.launch_page.version_type_combo.currentData()
+        return VERSION_FILTERS.get(key, VERSION_FILTERS["release"])[1]
+
+    def show_versions(self):
+        """Fill the version picker from the manifest cache using the current type filter."""
+        self._update_version_combo(version_manifest.versions(self.selected_version_types()))
+
+    @pyqtSlot(int)
+    def on_version_filter_changed(self, index):
+        settings_store.set("version_filter", self.launch_page.version_type_combo.itemData(index))
+        self.show_versions()
+
+    def _update_version_combo(self, entries):
+        # Newly released versions are prepended in place and keep the
+        # selection; only a changed filter resets the model
+        combo = self.launch_page.version_combo
+        current_selection = combo.currentText()
+        if not combo.set_versions(entries) and combo.currentIndex() != -1:
+            return
 
-    def save_versions_to_cache(self, versions):
-        try:
-            with open(VERSIONS_CACHE_PATH, "w") as f:
-                json.dump({"release_versions": versions}, f)
-            print("Saved fresh versions to cache.")
-        except Exception as e:
-            print(f"Error saving version cache: {e}")
+        # Restore previous selection or load last played version
+        for version in (current_selection, self.last_version):
+            index = combo.findText(version) if version else -1
+            if index != -1:
+                combo.setCurrentIndex(index)
+                break
 
     def save_settings(self):
-        try:
-            with open("pymcl/config/settings.json", "r+") as f:
-                settings = json.load(f)
-                settings["last_username"] = self.launch_page.username_input.text().strip()
-                settings["last_version"] = self.launch_page.version_combo.currentText()
-                f.seek(0)
-                json.dump(settings, f, indent=4)
-                f.truncate()
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
-            # Config file or directory might not exist yet, create it
-            os.makedirs("pymcl/config", exist_ok=True)
-            with open("pymcl/config/settings.json", "w") as f:
-                settings = {
-                    "last_username": self.launch_page.username_input.text().strip(),
-                    "last_version": self.launch_page.version_combo.currentText()
-                }
-                json.dump(settings, f, indent=4)
+        # Called on every keystroke in the username field; the store
+        # debounces the actual write.
+        settings_store.update({
+            "last_username": self.launch_page.username_input.text().strip(),
+            "last_version": self.launch_page.version_combo.currentText()
+        })
+
     @pyqtSlot()
     def start_launch(self):
         auth_method = self.launch_page.auth_method_combo.currentText()
@@ -803,67 +892,37 @@ class MainWindow(QMainWindow):
             self.update_status("⚠️ Please select a version")
             return
 
-        # Load settings to pass to the worker
-        settings = {}
-        if os.path.exists("pymcl/config/settings.json"):
-            try:
-                with open("pymcl/config/settings.json", "r") as f:
-                    settings = json.load(f)
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"Error loading settings for launch: {e}")
-
-        options = {
-            "username": "",
-            "uuid": "",
-            "token": "",
-            "executablePath": settings.get("java_executable"),
-            "jvmArguments": settings.get("jvm_arguments", "").split(),
-            "resolutionWidth": settings.get("resolution", {}).get("width"),
-            "resolutionHeight": settings.get("resolution", {}).get("height"),
-        }
-
-        memory_gb = settings.get("memory_gb", 4)
-        options["jvmArguments"].append(f"-Xmx{memory_gb}G")
-        options["jvmArguments"].append(f"-Xms{memory_gb}G")
-
+        username = None
         if auth_method == "Offline":
             username = self.launch_page.username_input.text().strip()
             if not username:
                 self.update_status("⚠️ Please enter a username")
                 return
-            options["username"] = username
-            options["uuid"] = str(uuid.uuid4())
             self.save_settings()
         elif auth_method == "Microsoft":
             if not self.minecraft_info:
                 self.update_status("⚠️ Please login with Microsoft")
                 return
-            options["username"] = self.minecraft_info["username"]
-            options["uuid"] = self.minecraft_info["uuid"]
-            options["token"] = self.minecraft_info["access_token"]
             self.save_settings()
 
+        options = launch_options(
+            username=username,
+            microsoft_info=self.minecraft_info if auth_method == "Microsoft" else None,
+        )
+
         self.launch_page.launch_button.setEnabled(False)
         self.launch_page.launch_button.setText("⏳ LAUNCHING...")
         self.launch_page.status_label.setText("Starting worker thread...")
         self.launch_page.progress_bar.setRange(0, 100)
         self.launch_page.progress_bar.setValue(0)
+        self.update_prefetch_state()
 
-        self.worker_thread = QThread()
         self.worker = Worker(version, options, mod_loader_type)
-        self.worker.moveToThread(self.worker_thread)
-
-        self.worker_thread.started.connect(self.worker.run)
-
         self.worker.progress.connect(self.update_progress)
         self.worker.status.connect(self.update_status)
+        self.worker.launch_ready.connect(self.on_launch_ready)
         self.worker.finished.connect(self.on_launch_finished)
-
-        self.worker.finished.connect(self.worker_thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.worker_thread.finished.connect(self.worker_thread.deleteLater)
-
-        self.worker_thread.start()
+        self.worker.start()
 
     @pyqtSlot(int, int)
     def update_progress(self, value, max_value):
@@ -887,15 +946,77 @@ class MainWindow(QMainWindow):
         self.launch_page.progress_bar.setRange(0, 1)
         self.launch_page.progress_bar.setValue(1 if success else 0)
         self.launch_page.progress_bar.setFormat("%p%")
-
-        if success and "Game closed" in message:
+        self.update_prefetch_state()
+
+    @pyqtSlot(str, list)
+    def on_launch_ready(self, version, command):
+        self.process_supervisor.launch(command, version)
+
+    @pyqtSlot(int, int, bool)
+    def on_game_finished(self, session_id, exit_code, crashed):
+        if crashed:
+            tail = self.process_supervisor.output(session_id)[-20:]
+            logger.error("Game exited with code %d. Last output:\n%s", exit_code, "\n".join(tail))
+            self.update_status(f"⚠️ Game crashed (exit code {exit_code})")
+        elif not self.process_supervisor.has_running():
             self.launch_page.progress_bar.setValue(0)
-            self.launch_page.status_label.setText("✓ Ready to launch")
+            self.update_status("✓ Ready to launch")
+        self.update_prefetch_state()
+
+    @pyqtSlot(int, float, int)
+    def on_game_stats(self, session_id, cpu_percent, rss):
+        # Don't clobber install progress for a second launch
+        if self.launch_page.launch_button.isEnabled():
+            running = len(self.process_supervisor.running_sessions())
+            label = "Game running" if running == 1 else f"{running} games running"
+            self.update_status(f"{label} · CPU {cpu_percent:.0f}% · {rss / (1024 ** 3):.1f} GB")
+
+    @pyqtSlot()
+    def start_prefetch(self):
+        if self.prefetcher is not None:
+            return
+        versions = []
+        for version in (self.last_version, version_manifest.latest(RELEASE)):
+            if version and version not in versions:
+                versions.append(version)
+        if not versions:
+            return
+
+        logger.debug("Starting background prefetch of %s", ", ".join(versions))
+        self.prefetch_thread = QThread()
+        self.prefetcher = Prefetcher(versions)
+        self.prefetcher.moveToThread(self.prefetch_thread)
+
+        self.prefetch_thread.started.connect(self.prefetcher.run)
+        self.prefetcher.finished.connect(self.on_prefetch_finished)
+
+        self.prefetcher.finished.connect(self.prefetch_thread.quit)
+        self.prefetcher.finished.connect(self.prefetcher.deleteLater)
+        self.prefetch_thread.finished.connect(self.prefetch_thread.deleteLater)
+
+        self.update_prefetch_state()
+        self.prefetch_thread.start(QThread.Priority.LowestPriority)
+
+    @pyqtSlot()
+    def update_prefetch_state(self):
+        # Launch installs and running games get the bandwidth to themselves
+        if self.prefetcher is None:
+            return
+        launching = not self.launch_page.launch_button.isEnabled()
+        if launching or self.process_supervisor.has_running():
+            self.prefetcher.pause()
+        else:
+            self.prefetcher.resume()
+
+    @pyqtSlot(int, int)
+    def on_prefetch_finished(self, files, size):
+        self.prefetcher = None
+        logger.debug("Background prefetch finished: %d files, %d bytes", files, size)
 
     def clear_cache(self):
         try:
             if os.path.exists(ICON_CACHE_DIR):
-                shutil.rmtree(ICON_CACHE_DIR)
+                clear_image_caches()
                 QMessageBox.information(self, "Cache Cleared", "The icon cache has been cleared.")
             else:
                 QMessageBox.information(self, "Cache Cleared", "No icon cache to clear.")
@@ -905,7 +1026,7 @@ class MainWindow(QMainWindow):
     def clear_cache(self):
         try:
             if os.path.exists(ICON_CACHE_DIR):
-                shutil.rmtree(ICON_CACHE_DIR)
+                clear_image_caches()
                 QMessageBox.information(self, "Cache Cleared", "The icon cache has been cleared.")
             else:
                 QMessageBox.information(self, "Cache Cleared", "No icon cache to clear.")
@@ -913,20 +1034,38 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Could not clear cache: {e}")
 
     def closeEvent(self, a0: QCloseEvent | None):
+        running = len(self.process_supervisor.running_sessions())
+        if running:
+            reply = QMessageBox.question(
+                self,
+                "Quit PyMCL",
+                "Minecraft is still running. Quitting the launcher will close it. Quit anyway?"
+                if running == 1
+                else f"{running} games are still running. Quitting the launcher will close them. Quit anyway?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No,
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                if a0 is not None:
+                    a0.ignore()
+                return
+
         if self.bg_timer:
             self.bg_timer.stop()
 
-        if hasattr(self, 'worker_thread') and self.worker_thread and not sip.isdeleted(self.worker_thread) and self.worker_thread.isRunning():
-            self.worker_thread.quit()
-            self.worker_thread.wait()
+        self.process_supervisor.shutdown()
+        settings_store.flush()
 
-        if hasattr(self, 'version_fetch_thread') and self.version_fetch_thread and not sip.isdeleted(self.version_fetch_thread) and self.version_fetch_thread.isRunning():
-            self.version_fetch_thread.quit()
-            self.version_fetch_thread.wait()
+        if self.prefetcher is not None:
+            self.prefetcher.stop()
+        if self.prefetch_thread and not sip.isdeleted(self.prefetch_thread) and self.prefetch_thread.isRunning():
+            self.prefetch_thread.quit()
+            self.prefetch_thread.wait()
 
-        if hasattr(self, 'image_downloader_thread') and self.image_downloader_thread and not sip.isdeleted(self.image_downloader_thread) and self.image_downloader_thread.isRunning():
-            self.image_downloader_thread.quit()
-            self.image_downloader_thread.wait()
+        stop_peer_server()
+        # Lets a running install or download finish; queued jobs are dropped
+        job_pool.shutdown()
+        background_pool.shutdown(wait=False)
 
         if a0 is not None:
             a0.accept()
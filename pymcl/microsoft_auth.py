@@ -1,12 +1,9 @@
-import json
-import os
-import time
 import webbrowser
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import Optional
-import minecraft_launcher_lib
 from PyQt6.QtCore import QObject, pyqtSignal, QThread
-from .constants import CLIENT_ID, REDIRECT_URL, MICROSOFT_INFO_PATH, MicrosoftInfo
+from .constants import CLIENT_ID, REDIRECT_URL, MicrosoftInfo
+from .core import accounts
 
 class AuthHandler(BaseHTTPRequestHandler):
     def __init__(self, callback, *args, **kwargs):
@@ -37,6 +34,8 @@ class MicrosoftAuth(QObject):
         self.http_server = None
 
     def start_login(self):
+        import minecraft_launcher_lib # deferred to keep it off the startup path
+
         login_url = minecraft_launcher_lib.microsoft_account.get_login_url(
             CLIENT_ID, REDIRECT_URL
         )
@@ -49,21 +48,7 @@ class MicrosoftAuth(QObject):
 
     def finish_login(self, auth_code):
         try:
-            minecraft_info = minecraft_launcher_lib.microsoft_account.complete_login(
-                CLIENT_ID,
-                None,
-                REDIRECT_URL,
-                auth_code,
-            )
-            info: MicrosoftInfo = {
-                "access_token": minecraft_info["access_token"],
-                "refresh_token": minecraft_info["refresh_token"],
-                "username": minecraft_info["username"],
-                "uuid": minecraft_info["uuid"],
-                "expires_in": minecraft_info["expires_in"],
-                "login_time": int(time.time()),
-            }
-            self.save_microsoft_info(info)
+            info = accounts.complete_login(auth_code)
             self.login_success.emit(info)
         except Exception as e:
             self.login_failed.emit(f"Login failed: {e}")
@@ -75,39 +60,13 @@ class MicrosoftAuth(QObject):
                 self.server_thread.wait()
 
     def save_microsoft_info(self, info: MicrosoftInfo):
-        with open(MICROSOFT_INFO_PATH, "w") as f:
-            json.dump(info, f)
+        accounts.save_microsoft_info(info)
 
     def load_microsoft_info(self) -> Optional[MicrosoftInfo]:
-        if os.path.exists(MICROSOFT_INFO_PATH):
-            with open(MICROSOFT_INFO_PATH, "r") as f:
-                return json.load(f)
-        return None
+        return accounts.load_microsoft_info()
 
     def refresh_token(self) -> Optional[MicrosoftInfo]:
-        info = self.load_microsoft_info()
-        if not info:
-            return None
-
-        try:
-            new_info = minecraft_launcher_lib.microsoft_account.refresh_access_token(
-                CLIENT_ID, None, info["refresh_token"], REDIRECT_URL
-            )
-            info: MicrosoftInfo = {
-                "access_token": new_info["access_token"],
-                "refresh_token": new_info["refresh_token"],
-                "username": new_info["username"],
-                "uuid": new_info["uuid"],
-                "expires_in": new_info["expires_in"],
-                "login_time": int(time.time()),
-            }
-            self.save_microsoft_info(info)
-            return info
-        except Exception:
-            return None
+        return accounts.refresh_microsoft_info()
 
     def is_token_expired(self) -> bool:
-        info = self.load_microsoft_info()
-        if not info:
-            return True
-        return int(time.time()) > info["login_time"] + info["expires_in"]
+        return accounts.is_token_expired(accounts.load_microsoft_info())
@@ -1,4 +1,5 @@
-from PyQt6.QtCore import Qt, pyqtSlot, QThread, QSize, QTimer
+from PyQt6.QtCore import Qt, pyqtSlot, QSize, QTimer
+from PyQt6.QtGui import QImage
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -10,21 +11,22 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QSpinBox,
 )
-import requests
 import json
 
-from .workers import ModDownloader, IconDownloader, ModSearchWorker
+from .workers import ModDownloader, ModSearchWorker
 from .widgets import ModListItem, ModDetailDialog
 from .modrinth_client import ModrinthClient
+from .image_cache import ImageCache
 
 class ModBrowserPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.modrinth_client = ModrinthClient()
+        self.image_cache = ImageCache(self)
+        self.image_cache.thumbnail_ready.connect(self.on_icon_ready)
         self.search_results = []
         self.game_version = None
         self.loader = None
-        self.threads = []
         self.current_search_id = 0
 
         self.search_timer = QTimer(self)
@@ -102,11 +104,8 @@ class ModBrowserPage(QWidget):
         if not query:
             return
         
-        # If a thread is already running, we don't want to spam/lag by launching another one immediately
-        # if we were strict. But the best UX is to cancel the old one (not possible easily) 
-        # or just launch this one and ignore the old result.
-        # Since 'requests' is blocking, the old thread will just finish eventually.
-        # To prevent "lag", we just ensure we are on a thread.
+        # An older search may still be running; it can't be cancelled, so it
+        # just finishes on the job pool and its result is ignored by search_id.
         
         self.search_button.setText("Searching...")
         self.search_button.setEnabled(False)
@@ -115,29 +114,16 @@ class ModBrowserPage(QWidget):
         game_versions = [self.game_version] if self.game_version else None
         limit = self.limit_spinbox.value()
 
-        thread = QThread()
         worker = ModSearchWorker(
-            self.modrinth_client, 
-            query, 
-            game_versions, 
-            self.loader, 
+            self.modrinth_client,
+            query,
+            game_versions,
+            self.loader,
             limit,
             self.current_search_id
         )
-        worker.moveToThread(thread)
-        
-        # Keep worker alive
-        thread.worker = worker
-        
-        thread.started.connect(worker.run)
         worker.finished.connect(self.on_search_finished)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-        thread.finished.connect(lambda: self.threads.remove(thread) if thread in self.threads else None)
-        
-        self.threads.append(thread)
-        thread.start()
+        worker.start()
 
     @pyqtSlot(list, int)
     def on_search_finished(self, results, search_id):
@@ -177,28 +163,19 @@ class ModBrowserPage(QWidget):
 
             icon_url = mod.get("icon_url")
             if icon_url:
-                thread = QThread()
-                downloader = IconDownloader(icon_url, mod.get("project_id"))
-                downloader.moveToThread(thread)
-                thread.started.connect(downloader.run)
-                downloader.finished.connect(self.on_icon_downloaded)
-                downloader.finished.connect(thread.quit)
-                downloader.finished.connect(downloader.deleteLater)
-                thread.finished.connect(thread.deleteLater)
-                thread.start()
-                self.threads.append(thread)
+                # Pre-sized icons come straight from memory; anything else is
+                # decoded/scaled on a worker pool and arrives in on_icon_ready
+                image = self.image_cache.get_thumbnail(icon_url, ModListItem.ICON_SIZE)
+                if image is not None:
+                    mod_card.set_icon(image)
 
     @pyqtSlot(dict)
     def show_mod_detail(self, mod_data):
         dialog = ModDetailDialog(mod_data, self.modrinth_client, self)
         dialog.exec()
-    @pyqtSlot(str, str)
-    def on_icon_downloaded(self, mod_id, icon_path):
-        if not icon_path:
-            return
-
+    @pyqtSlot(str, QImage)
+    def on_icon_ready(self, icon_url, image):
         for i in range(self.results_layout.count()):
             widget = self.results_layout.itemAt(i).widget()
-            if isinstance(widget, ModListItem) and widget.mod_data.get("project_id") == mod_id:
-                widget.set_icon(icon_path)
-                break
+            if isinstance(widget, ModListItem) and widget.mod_data.get("icon_url") == icon_url:
+                widget.set_icon(image)
@@ -1,8 +1,7 @@
 import glob
 import os
-import shutil
 
-from PyQt6.QtCore import QThread, pyqtSlot, Qt, QUrl
+from PyQt6.QtCore import pyqtSlot, Qt, QUrl
 from PyQt6.QtGui import QDesktopServices
 from PyQt6.QtWidgets import (
     QDialog,
@@ -19,16 +18,19 @@ from PyQt6.QtWidgets import (
 
 from .constants import MODS_DIR, ICON_CACHE_DIR
 from .widgets import ModListWidget, InstalledModItem
-from .workers import ModDownloader, UpdateCheckerWorker
+from .workers import ModDownloader, ModUpdater, UpdateCheckerWorker
+from .core import primary_file
 from .modrinth_client import ModrinthClient
+from .image_cache import clear_image_caches
+from .logger import get_logger
+
+logger = get_logger("pymcl.mods")
 
 class ModsPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.downloader_thread = None
         self.downloader = None
         self.modrinth_client = ModrinthClient()
-        self.update_thread = None
 
         self.init_ui()
         self.populate_mods_list()
@@ -111,22 +113,12 @@ class ModsPage(QWidget):
 
     @pyqtSlot()
     def check_updates(self):
-        print("--- Starting mod update check ---")
         self.check_updates_button.setEnabled(False)
         self.check_updates_button.setText("Checking for updates...")
         
-        self.update_thread = QThread()
         self.update_worker = UpdateCheckerWorker(self.modrinth_client)
-        self.update_worker.moveToThread(self.update_thread)
-        
-        self.update_thread.started.connect(self.update_worker.run)
         self.update_worker.finished.connect(self.on_updates_found)
-        self.update_worker.finished.connect(self.update_thread.quit)
-        self.update_worker.finished.connect(self.update_worker.deleteLater)
-        self.update_thread.finished.connect(self.update_thread.deleteLater)
-        
-        self.update_thread.start()
-        print("UpdateCheckerWorker started.")
+        self.update_worker.start()
 
     @pyqtSlot(dict)
     def on_updates_found(self, updates):
@@ -151,34 +143,24 @@ class ModsPage(QWidget):
     @pyqtSlot(str, dict)
     def on_update_mod(self, old_path, new_version_data):
         # This handles the click on "UPDATE AVAILABLE"
-        files = new_version_data.get("files", [])
-        primary_file = next((f for f in files if f.get("primary")), files[0] if files else None)
-        
-        if not primary_file:
+        if not primary_file(new_version_data):
             QMessageBox.warning(self, "Error", "Could not find file to download for update.")
             return
-            
-        url = primary_file.get("url")
-        if not url:
-            return
 
-        # Delete old file
-        try:
-            if os.path.exists(old_path):
-                os.remove(old_path)
-        except Exception as e:
-             print(f"Error removing old mod: {e}")
-             
-        # Start download of new one
-        self.url_input.setText(url)
-        self.start_mod_download()
+        self.download_button.setEnabled(False)
+        self.download_status_label.setText(f"Updating {os.path.basename(old_path)}...")
+
+        # The old jar is only removed once the new one is in place
+        self.downloader = ModUpdater(old_path, new_version_data)
+        self.downloader.finished.connect(self.on_mod_download_finished)
+        self.downloader.start()
 
 
     @pyqtSlot()
     def clear_cache(self):
         try:
             if os.path.exists(ICON_CACHE_DIR):
-                shutil.rmtree(ICON_CACHE_DIR)
+                clear_image_caches()
                 self.download_status_label.setText("Icon cache cleared.")
             else:
                 self.download_status_label.setText("No icon cache to clear.")
@@ -203,14 +185,14 @@ class ModsPage(QWidget):
                 self.mod_list_widget.setItemWidget(item, widget)
                 
         except Exception as e:
-            print(f"Error populating mods list: {e}")
+            logger.error("Error populating mods list: %s", e)
 
     @pyqtSlot()
     def open_mods_folder(self):
         try:
             QDesktopServices.openUrl(QUrl.fromLocalFile(MODS_DIR))
         except Exception as e:
-            print(f"Error opening mods folder: {e}")
+            logger.error("Error opening mods folder: %s", e)
 
     @pyqtSlot()
     def delete_selected_mod(self):
@@ -235,7 +217,7 @@ class ModsPage(QWidget):
                 os.remove(mod_path)
                 self.populate_mods_list()
             except Exception as e:
-                print(f"Error deleting mod: {e}")
+                logger.error("Error deleting mod %s: %s", mod_path, e)
                 QMessageBox.critical(self, "Error", f"Could not delete mod: {e}")
 
     @pyqtSlot()
@@ -251,18 +233,9 @@ class ModsPage(QWidget):
         self.download_button.setText("Downloading...")
         self.download_status_label.setText(f"Starting download from {url}...")
 
-        self.downloader_thread = QThread()
         self.downloader = ModDownloader(url)
-        self.downloader.moveToThread(self.downloader_thread)
-
-        self.downloader_thread.started.connect(self.downloader.run)
         self.downloader.finished.connect(self.on_mod_download_finished)
-
-        self.downloader.finished.connect(self.downloader_thread.quit)
-        self.downloader.finished.connect(self.downloader.deleteLater)
-        self.downloader_thread.finished.connect(self.downloader_thread.deleteLater)
-
-        self.downloader_thread.start()
+        self.downloader.start()
 
     @pyqtSlot(bool, str)
     def on_mod_download_finished(self, success, message):
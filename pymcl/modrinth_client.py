@@ -1,14 +1,17 @@
 import requests
 import json
 
+from .net import http_client
+from .logger import get_logger
+
+logger = get_logger("pymcl.net")
+
 class ModrinthClient:
     BASE_URL = "https://api.modrinth.com/v2"
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "PyMCL/1.0 (github.com/sonnynomnom/PyMCL)"}
-        )
+    def __init__(self, http=None):
+        # Shares the app-wide connection pool unless given another client
+        self.http = http or http_client
 
     def search(self, query, game_versions=None, loader=None, limit=20):
         params = {"query": query, "limit": limit}
@@ -23,35 +26,35 @@ class ModrinthClient:
             params["facets"] = json.dumps(facets)
 
         try:
-            response = self.session.get(f"{self.BASE_URL}/search", params=params, timeout=15)
+            response = self.http.get(f"{self.BASE_URL}/search", params=params, timeout=15)
             response.raise_for_status()
             return response.json().get("hits", [])
         except requests.RequestException as e:
-            print(f"Error searching Modrinth: {e}")
+            logger.error("Error searching Modrinth: %s", e)
             return []
 
     def get_project(self, slug):
         try:
-            response = self.session.get(f"{self.BASE_URL}/project/{slug}", timeout=15)
+            response = self.http.get(f"{self.BASE_URL}/project/{slug}", timeout=15)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
-            print(f"Error getting project from Modrinth: {e}")
+            logger.error("Error getting project %s from Modrinth: %s", slug, e)
             return {}
 
     def get_updates(self, file_hashes):
-        print(f"ModrinthClient: Attempting to get updates for {len(file_hashes)} hashes.")
+        logger.debug("Requesting updates for %d hashes", len(file_hashes))
         try:
-            response = self.session.post(
+            response = self.http.post(
                 f"{self.BASE_URL}/version_files/update",
                 json={"hashes": file_hashes, "algorithm": "sha1"},
                 timeout=15
             )
             response.raise_for_status()
-            print("ModrinthClient: Successfully received update response.")
+            logger.debug("Received update response")
             return response.json()
         except requests.RequestException as e:
-            print(f"ModrinthClient: Error getting updates: {e}")
+            logger.error("Error getting updates from Modrinth: %s", e)
             return {}
 
     def get_versions(self, mod_id, game_versions=None, loader=None):
@@ -62,9 +65,9 @@ class ModrinthClient:
             params["loaders"] = json.dumps([loader])
 
         try:
-            response = self.session.get(f"{self.BASE_URL}/project/{mod_id}/version", params=params, timeout=15)
+            response = self.http.get(f"{self.BASE_URL}/project/{mod_id}/version", params=params, timeout=15)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
-            print(f"Error getting versions from Modrinth: {e}")
+            logger.error("Error getting versions of %s from Modrinth: %s", mod_id, e)
             return []
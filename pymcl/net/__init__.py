@@ -0,0 +1,39 @@
+from .http import HttpClient, http_client, USER_AGENT, DEFAULT_TIMEOUT
+from .transports import Http11Transport, Http2Transport, create_transport, http2_available, HTTP1, HTTP2, AUTO
+from .mirrors import Mirror, MirrorGroup, MirrorRegistry, mirror_registry, UPSTREAMS, install as install_mirrors
+from .proxy import configure as configure_proxy
+from .peers import (
+    PeerServer,
+    PeerCache,
+    peer_cache,
+    discover as discover_peers,
+    update_server as update_peer_server,
+    stop_server as stop_peer_server,
+)
+
+__all__ = [
+    "HttpClient",
+    "http_client",
+    "USER_AGENT",
+    "DEFAULT_TIMEOUT",
+    "Http11Transport",
+    "Http2Transport",
+    "create_transport",
+    "http2_available",
+    "HTTP1",
+    "HTTP2",
+    "AUTO",
+    "Mirror",
+    "MirrorGroup",
+    "MirrorRegistry",
+    "mirror_registry",
+    "UPSTREAMS",
+    "install_mirrors",
+    "configure_proxy",
+    "PeerServer",
+    "PeerCache",
+    "peer_cache",
+    "discover_peers",
+    "update_peer_server",
+    "stop_peer_server",
+]
@@ -0,0 +1,107 @@
+import threading
+
+from ..settings_store import settings_store
+from ..logger import get_logger
+from .transports import create_transport, HTTP1
+from .mirrors import mirror_registry, PROBE_TIMEOUT
+from .proxy import configure as configure_proxy
+
+logger = get_logger("pymcl.net")
+
+USER_AGENT = "PyMCL/1.0 (github.com/Earth1283/PyMCL)"
+# (connect, read) seconds, used when a call doesn't pass its own timeout
+DEFAULT_TIMEOUT = (5, 30)
+# Distinct hosts kept in the HTTP/1.1 pool, and keep-alive connections per
+# host. Icon grids open up to 20 downloads at once against cdn.modrinth.com.
+POOL_HOSTS = 10
+POOL_CONNECTIONS_PER_HOST = 20
+
+
+class HttpClient:
+    """
+    App-wide HTTP client over one shared, pooled transport.
+
+    All network components go through the same transport, so keep-alive
+    connections (and their TLS sessions) are reused across workers instead
+    of every download paying for a new handshake. The transport is picked
+    by the "http_transport" setting: "http1" (the default), "http2", or
+    "auto" (HTTP/2 when httpx and h2 are installed); see transports.py.
+    Both are safe to use from any thread and return requests-style
+    responses.
+
+    Every request carries the launcher's User-Agent, advertises every
+    content encoding urllib3 can decode, and gets DEFAULT_TIMEOUT unless
+    it passes its own. URLs with mirrors configured go to the best mirror
+    with failover (see mirrors.py). Nothing is imported until the first
+    request.
+    """
+
+    def __init__(self, transport=None, pool_hosts=POOL_HOSTS, pool_size=POOL_CONNECTIONS_PER_HOST,
+                 timeout=DEFAULT_TIMEOUT, user_agent=USER_AGENT):
+        self.transport_name = transport or settings_store.get("http_transport", HTTP1)
+        self.pool_hosts = pool_hosts
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self._lock = threading.Lock()
+        self._transport = None
+
+    @property
+    def transport(self):
+        with self._lock:
+            if self._transport is None:
+                import urllib3
+
+                headers = {
+                    "User-Agent": self.user_agent,
+                    "Accept-Encoding": urllib3.util.make_headers(accept_encoding=True)["accept-encoding"],
+                }
+                self._transport = create_transport(self.transport_name, self.pool_hosts, self.pool_size, headers)
+                logger.debug("HTTP transport: %s", self._transport.name)
+            return self._transport
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        transport = self.transport
+        group = mirror_registry.match(url)
+        if group is None:
+            return transport.request(method, url, **kwargs)
+        group.probe_if_stale(lambda base: transport.request("HEAD", base, timeout=PROBE_TIMEOUT, allow_redirects=False))
+        return group.fetch(method, url, lambda mirror_url: transport.request(method, mirror_url, **kwargs))
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def close(self):
+        """Drop all pooled connections; the next request starts a new transport."""
+        with self._lock:
+            transport, self._transport = self._transport, None
+        if transport is not None:
+            transport.close()
+
+
+PROXY_SETTINGS = ("proxy", "no_proxy")
+
+
+def _configure_proxy_from_settings():
+    configure_proxy(settings_store.get("proxy"), settings_store.get("no_proxy"))
+
+
+_configure_proxy_from_settings()
+http_client = HttpClient()
+
+
+def _on_setting_changed(key, value):
+    if key in PROXY_SETTINGS:
+        _configure_proxy_from_settings()
+        # httpx reads proxies once per client; start over with new connections
+        http_client.close()
+
+
+settings_store.add_listener(_on_setting_changed)
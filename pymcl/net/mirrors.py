@@ -0,0 +1,260 @@
+import time
+import threading
+
+from ..settings_store import settings_store
+from ..logger import get_logger
+from .transports import IDEMPOTENT_METHODS
+
+logger = get_logger("pymcl.net")
+
+# Names usable instead of a URL as keys of the "mirrors" setting
+UPSTREAMS = {
+    "modrinth": "https://api.modrinth.com/v2",
+    "modrinth_cdn": "https://cdn.modrinth.com",
+    "launchermeta": "https://launchermeta.mojang.com",
+    "mojang_meta": "https://piston-meta.mojang.com",
+    "mojang_data": "https://piston-data.mojang.com",
+    "libraries": "https://libraries.minecraft.net",
+    "assets": "https://resources.download.minecraft.net",
+}
+# Answers that send a request on to the next mirror. A 404 only counts from
+# a mirror: a partial cache may simply not have the file.
+SERVER_ERRORS = (500, 502, 503, 504)
+MIRROR_MISSES = (403, 404)
+# Probes are a HEAD of each base URL, repeated at most every PROBE_INTERVAL
+PROBE_TIMEOUT = 3
+PROBE_INTERVAL = 600
+# Weight of a new probe in a mirror's smoothed latency
+LATENCY_SMOOTHING = 0.3
+# A failed mirror is skipped for FAILURE_BACKOFF seconds, doubling per
+# consecutive failure up to MAX_FAILURE_BACKOFF
+FAILURE_BACKOFF = 30
+MAX_FAILURE_BACKOFF = 600
+
+
+class Mirror:
+    """One base URL serving an upstream's files, and how well it has been doing."""
+
+    def __init__(self, base, upstream=False):
+        self.base = base.rstrip("/")
+        self.upstream = upstream
+        self.latency = None
+        self.failures = 0
+        self.down_until = 0.0
+
+    def record_latency(self, seconds):
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += LATENCY_SMOOTHING * (seconds - self.latency)
+
+    def record_success(self):
+        self.failures = 0
+        self.down_until = 0.0
+
+    def record_failure(self):
+        self.failures += 1
+        backoff = min(MAX_FAILURE_BACKOFF, FAILURE_BACKOFF * 2 ** (self.failures - 1))
+        self.down_until = time.monotonic() + backoff
+
+    def __repr__(self):
+        return f"Mirror({self.base!r}, latency={self.latency}, failures={self.failures})"
+
+
+class MirrorGroup:
+    """
+    An upstream base URL and the mirrors that can stand in for it.
+
+    A URL under upstream is fetched from each candidate in turn (the part
+    after the base is kept) until one answers: healthy mirrors come first,
+    fastest probe first with the configured order breaking ties, then the
+    ones still backing off from a failure, so a request is never refused
+    just because everything failed recently. With fallback the upstream
+    itself is the last mirror.
+    """
+
+    def __init__(self, upstream, mirrors, fallback=True):
+        self.upstream = upstream.rstrip("/")
+        self.mirrors = [Mirror(base) for base in mirrors if base.rstrip("/") != self.upstream]
+        if fallback or not self.mirrors:
+            self.mirrors.append(Mirror(self.upstream, upstream=True))
+        self._lock = threading.Lock()
+        self._probed_at = None
+
+    def matches(self, url):
+        return url.startswith(self.upstream) and url[len(self.upstream):len(self.upstream) + 1] in ("", "/", "?")
+
+    def candidates(self):
+        now = time.monotonic()
+        with self._lock:
+            healthy = [m for m in self.mirrors if m.down_until <= now]
+            down = [m for m in self.mirrors if m.down_until > now]
+        # Probed mirrors first, fastest first; sorts are stable, so before
+        # the first probe the configured order stands
+        healthy.sort(key=lambda m: (m.latency is None, m.latency or 0.0))
+        down.sort(key=lambda m: m.down_until)
+        return healthy + down
+
+    def fetch(self, method, url, send):
+        """
+        Request url through the best mirror, failing over on connection
+        errors and server errors. send(mirror_url) performs the request and
+        returns a requests-style response. Only idempotent methods fail
+        over; anything else goes to the best mirror alone.
+        """
+        import requests
+
+        path = url[len(self.upstream):]
+        candidates = self.candidates()
+        if method.upper() not in IDEMPOTENT_METHODS:
+            candidates = candidates[:1]
+        for i, mirror in enumerate(candidates):
+            last = i == len(candidates) - 1
+            try:
+                response = send(mirror.base + path)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(mirror, ok=False)
+                if last:
+                    raise
+                logger.debug("Mirror %s failed (%s), trying the next one", mirror.base, e)
+                continue
+
+            status = response.status_code
+            self._record(mirror, ok=status not in SERVER_ERRORS)
+            if not last and (status in SERVER_ERRORS or (status in MIRROR_MISSES and not mirror.upstream)):
+                logger.debug("Mirror %s answered %d for %s, trying the next one", mirror.base, status, path)
+                response.close()
+                continue
+            return response
+
+    def _record(self, mirror, ok):
+        with self._lock:
+            if ok:
+                mirror.record_success()
+            else:
+                if not mirror.failures:
+                    logger.warning("Mirror %s is not responding, skipping it for now", mirror.base)
+                mirror.record_failure()
+
+    def probe_if_stale(self, head):
+        """
+        Measure every mirror's latency in a background thread unless that
+        was done in the last PROBE_INTERVAL seconds. head(url) sends a HEAD
+        request with PROBE_TIMEOUT and returns the response.
+        """
+        if len(self.mirrors) < 2:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if self._probed_at is not None and now - self._probed_at < PROBE_INTERVAL:
+                return
+            self._probed_at = now
+        threading.Thread(target=self._probe, args=(head,), name="mirror-probe", daemon=True).start()
+
+    def _probe(self, head):
+        import requests
+
+        for mirror in self.mirrors:
+            start = time.monotonic()
+            try:
+                response = head(mirror.base)
+                response.close()
+            except requests.RequestException as e:
+                logger.debug("Probe of %s failed: %s", mirror.base, e)
+                self._record(mirror, ok=False)
+                continue
+            with self._lock:
+                mirror.record_latency(time.monotonic() - start)
+            # Anything but a server error means the host is up; the base URL
+            # itself usually isn't a file
+            self._record(mirror, ok=response.status_code not in SERVER_ERRORS)
+        logger.debug("Mirrors for %s: %s", self.upstream, self.candidates())
+
+
+class MirrorRegistry:
+    """
+    Mirror groups built from the "mirrors" setting, which maps an upstream
+    (a name from UPSTREAMS or a base URL) to a list of mirror base URLs:
+
+        "mirrors": {"libraries": ["http://cache.lan/libraries"]}
+
+    "mirror_fallback" (default true) keeps the upstream as a last resort.
+    """
+
+    def __init__(self, config=None, fallback=True):
+        self.groups = []
+        self.configure(config, fallback)
+
+    def configure(self, config, fallback=True):
+        groups = []
+        for key, bases in (config or {}).items():
+            if isinstance(bases, str):
+                bases = [bases]
+            if bases:
+                groups.append(MirrorGroup(UPSTREAMS.get(key, key), bases, fallback))
+        # The most specific upstream wins when one base is a prefix of another
+        groups.sort(key=lambda group: len(group.upstream), reverse=True)
+        self.groups = groups
+        if groups:
+            logger.info("Mirrors configured for %s", ", ".join(group.upstream for group in groups))
+
+    def match(self, url):
+        """The group serving url, or None to fetch it as is."""
+        for group in self.groups:
+            if group.matches(url):
+                return group
+        return None
+
+
+def _config_from_settings():
+    return settings_store.get("mirrors", {}), settings_store.get("mirror_fallback", True)
+
+
+mirror_registry = MirrorRegistry(*_config_from_settings())
+
+
+def _on_setting_changed(key, value):
+    if key in ("mirrors", "mirror_fallback"):
+        mirror_registry.configure(*_config_from_settings())
+
+
+settings_store.add_listener(_on_setting_changed)
+
+
+_install_lock = threading.Lock()
+_installed = False
+
+
+def install():
+    """
+    Send requests made outside HttpClient through the mirrors too.
+
+    minecraft_launcher_lib downloads with its own sessions, so the hook sits
+    on HTTPAdapter.send and fails over by resending a copy of the prepared
+    request. Adapters with a truthy "mirrored" attribute belong to a
+    transport whose HttpClient already did this and are left alone. Safe
+    to call more than once.
+    """
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        import requests
+
+        HTTPAdapter = requests.adapters.HTTPAdapter
+        send = HTTPAdapter.send
+
+        def mirrored_send(adapter, request, *args, **kwargs):
+            group = None if getattr(adapter, "mirrored", False) else mirror_registry.match(request.url)
+            if group is None:
+                return send(adapter, request, *args, **kwargs)
+
+            def send_to(url):
+                copy = request.copy()
+                copy.url = url
+                return send(adapter, copy, *args, **kwargs)
+
+            return group.fetch(request.method, request.url, send_to)
+
+        HTTPAdapter.send = mirrored_send
+        _installed = True
@@ -0,0 +1,568 @@
+import os
+import time
+import uuid
+import shutil
+import socket
+import hashlib
+import tempfile
+import ipaddress
+import threading
+from urllib.parse import urlsplit, urlunsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ..constants import MINECRAFT_DIR, MODS_DIR
+from ..settings_store import settings_store
+from ..logger import get_logger
+from .mirrors import Mirror
+from .http import USER_AGENT
+from .transports import Http11Transport
+
+logger = get_logger("pymcl.net")
+
+# HTTP port of the cache server and UDP port of its discovery responder
+PEER_PORT = 47800
+DISCOVERY_PORT = 47801
+DISCOVERY_REQUEST = b"PYMCL-PEER?"
+DISCOVERY_REPLY = b"PYMCL-PEER"
+# How long a discovery broadcast waits for answers, and how often it's redone
+DISCOVERY_TIMEOUT = 0.5
+DISCOVERY_INTERVAL = 300
+# (connect, read) seconds for peer downloads; a LAN peer answers fast or not at all
+PEER_TIMEOUT = (1, 10)
+# Hosts and keep-alive connections per host in the peer download pool
+PEER_POOL_HOSTS = 4
+PEER_POOL_CONNECTIONS_PER_HOST = 8
+# A miss rescans the shared directories at most this often
+INDEX_TTL = 60
+CHUNK_SIZE = 64 * 1024
+
+# Tells this process's own server apart in discovery replies
+INSTANCE_ID = uuid.uuid4().hex
+
+
+def sha1_file(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_networks(entries):
+    """ip_network objects for "10.0.0.0/8" or "192.168.1.20" style entries; bad ones are skipped."""
+    networks = []
+    for entry in entries:
+        try:
+            networks.append(ipaddress.ip_network(str(entry).strip(), strict=False))
+        except ValueError:
+            logger.warning("Ignoring invalid LAN cache network %r", entry)
+    return networks
+
+
+def is_allowed(address, allow=None):
+    """
+    True if a client at address may use this launcher's cache: it's in one
+    of the allow networks or, without a list, on a private network
+    (RFC 1918, link-local, loopback and their IPv6 counterparts).
+    """
+    try:
+        ip = ipaddress.ip_address(address.split("%", 1)[0])
+    except ValueError:
+        return False
+    if getattr(ip, "ipv4_mapped", None) is not None:
+        ip = ip.ipv4_mapped
+    if allow is None:
+        return ip.is_private
+    return any(ip in network for network in allow)
+
+
+def shared_roots(minecraft_dir=MINECRAFT_DIR, mods_dir=MODS_DIR):
+    """(directory, extensions or None for all files) of everything a peer shares."""
+    return [
+        (os.path.join(minecraft_dir, "libraries"), None),
+        (os.path.join(minecraft_dir, "assets", "objects"), None),
+        (os.path.join(minecraft_dir, "assets", "indexes"), (".json",)),
+        (os.path.join(minecraft_dir, "assets", "log_configs"), None),
+        (os.path.join(minecraft_dir, "versions"), (".jar", ".json")),
+        (mods_dir, (".jar",)),
+    ]
+
+
+class FileIndex:
+    """
+    sha1 -> path for every file under the shared roots.
+
+    A scan only hashes files that are new or whose size or mtime changed
+    since the last one, so rescans are cheap. lookup() checks the file is
+    still what was hashed before handing it out.
+    """
+
+    def __init__(self, roots):
+        self.roots = roots
+        self._lock = threading.Lock()
+        self._scan_lock = threading.Lock()
+        self._entries = {} # path -> (size, mtime, sha1)
+        self._paths = {} # sha1 -> path
+        self._refreshing = False
+        self.scanned_at = None
+
+    def scan(self):
+        with self._scan_lock:
+            start = time.monotonic()
+            with self._lock:
+                known = dict(self._entries)
+            entries = {}
+            for root, extensions in self.roots:
+                for directory, dirnames, filenames in os.walk(root):
+                    # Skip the launcher's own caches and half-written downloads
+                    dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+                    for filename in filenames:
+                        if filename.startswith(".") or (extensions and not filename.endswith(extensions)):
+                            continue
+                        path = os.path.join(directory, filename)
+                        try:
+                            stat = os.stat(path)
+                            entry = known.get(path)
+                            if entry is None or entry[:2] != (stat.st_size, stat.st_mtime):
+                                entry = (stat.st_size, stat.st_mtime, sha1_file(path))
+                        except OSError:
+                            continue
+                        entries[path] = entry
+            with self._lock:
+                self._entries = entries
+                self._paths = {entry[2]: path for path, entry in entries.items()}
+                self.scanned_at = time.monotonic()
+            logger.debug("Indexed %d shared files in %.1f s", len(entries), time.monotonic() - start)
+
+    def lookup(self, sha1):
+        """
+        Path of a file whose content has this sha1, or None. A miss doesn't
+        wait for a rescan, so a peer asking for unknown hashes can't hold
+        requests open on one; it only starts a background refresh().
+        """
+        path = self._current(sha1)
+        if path is None:
+            self.refresh()
+        return path
+
+    def refresh(self):
+        """Rescan on a background thread, unless one is running or the last ended under INDEX_TTL ago."""
+        with self._lock:
+            if self._refreshing or (self.scanned_at is not None and time.monotonic() - self.scanned_at <= INDEX_TTL):
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh, name="peer-index", daemon=True).start()
+
+    def _refresh(self):
+        try:
+            self.scan()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _current(self, sha1):
+        with self._lock:
+            path = self._paths.get(sha1)
+            entry = self._entries.get(path)
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if (stat.st_size, stat.st_mtime) == entry[:2]:
+            return path
+        # Changed since it was hashed; only serve it if the content still matches
+        new_entry = (stat.st_size, stat.st_mtime, sha1_file(path))
+        with self._lock:
+            self._entries[path] = new_entry
+            if new_entry[2] != sha1:
+                self._paths.pop(sha1, None)
+                self._paths[new_entry[2]] = path
+        return path if new_entry[2] == sha1 else None
+
+    def __len__(self):
+        return len(self._paths)
+
+
+class _PeerHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, handler, allowed):
+        self.allowed = allowed
+        super().__init__(address, handler)
+
+    def verify_request(self, request, client_address):
+        if self.allowed(client_address[0]):
+            return True
+        logger.debug("Refused LAN cache connection from %s", client_address[0])
+        return False
+
+
+class PeerServer:
+    """
+    Serves this machine's game files to other launchers on the LAN.
+
+    Files are only addressed by content: GET /sha1/<hash> answers with the
+    file whose sha1 is hash, or 404, so nothing outside the shared roots
+    (libraries, assets, version jars and jsons, mod jars) is reachable and
+    a client can verify whatever it gets. A UDP responder on
+    DISCOVERY_PORT answers DISCOVERY_REQUEST broadcasts with the HTTP
+    port, so clients find the server without configuration.
+
+    Only clients allowed by is_allowed() are answered, over HTTP and
+    discovery alike: by default that's private addresses, so a machine
+    with a public interface doesn't share with the internet.
+    """
+
+    def __init__(self, port=PEER_PORT, discovery_port=DISCOVERY_PORT, roots=None, host="", allow=None):
+        self.index = FileIndex(roots if roots is not None else shared_roots())
+        self.served = 0
+        self.bytes = 0
+        self.allow = allow
+        self._counter_lock = threading.Lock()
+        self.httpd = _PeerHTTPServer((host, port), self._handler(), self.allows)
+        self.discovery_port = discovery_port
+        self._udp = None
+        self._stopped = threading.Event()
+
+    @property
+    def port(self):
+        return self.httpd.server_port
+
+    def allows(self, address):
+        return is_allowed(address, self.allow)
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, name="peer-server", daemon=True).start()
+        self.index.refresh()
+        if self.discovery_port is not None:
+            try:
+                self._udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self._udp.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                # Broadcasts don't reach a socket bound to one address, so this
+                # listens everywhere and checks the sender instead
+                self._udp.bind(("", self.discovery_port))
+                # Closing doesn't wake a blocked recvfrom everywhere; poll for stop()
+                self._udp.settimeout(1.0)
+            except OSError as e:
+                logger.warning("LAN discovery unavailable on UDP port %d: %s", self.discovery_port, e)
+                self._udp = None
+            else:
+                threading.Thread(target=self._answer_discovery, name="peer-discovery", daemon=True).start()
+        logger.info("Sharing game files with LAN peers on port %d", self.port)
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._udp is not None:
+            self._udp.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _answer_discovery(self):
+        reply = b"%s %d %s" % (DISCOVERY_REPLY, self.port, INSTANCE_ID.encode())
+        while not self._stopped.is_set():
+            try:
+                data, address = self._udp.recvfrom(512)
+                if data.startswith(DISCOVERY_REQUEST) and self.allows(address[0]):
+                    self._udp.sendto(reply, address)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_HEAD(self):
+                self._respond(body=False)
+
+            def do_GET(self):
+                self._respond(body=True)
+
+            def _respond(self, body):
+                if self.path in ("/", "/ping"):
+                    self._send_status(200, b"pymcl-peer\n" if body else b"")
+                    return
+                sha1 = self.path[len("/sha1/"):] if self.path.startswith("/sha1/") else ""
+                path = server.index.lookup(sha1.lower()) if len(sha1) == 40 else None
+                if path is None:
+                    self._send_status(404, b"")
+                    return
+                try:
+                    with open(path, "rb") as f:
+                        size = os.fstat(f.fileno()).st_size
+                        self.send_response(200)
+                        self.send_header("Content-Type", "application/octet-stream")
+                        self.send_header("Content-Length", str(size))
+                        self.end_headers()
+                        if body:
+                            shutil.copyfileobj(f, self.wfile, CHUNK_SIZE)
+                except OSError:
+                    self.close_connection = True
+                    return
+                if body:
+                    with server._counter_lock:
+                        server.served += 1
+                        server.bytes += size
+
+            def _send_status(self, status, data):
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+def discover(timeout=DISCOVERY_TIMEOUT, port=DISCOVERY_PORT, address="<broadcast>"):
+    """Base URLs of the peer servers that answer a broadcast within timeout."""
+    peers = []
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.sendto(DISCOVERY_REQUEST, (address, port))
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                sock.settimeout(remaining)
+                try:
+                    data, (host, _) = sock.recvfrom(512)
+                except socket.timeout:
+                    break
+                fields = data.split()
+                if len(fields) != 3 or fields[0] != DISCOVERY_REPLY or fields[2].decode() == INSTANCE_ID:
+                    continue
+                url = f"http://{host}:{int(fields[1])}"
+                if url not in peers:
+                    peers.append(url)
+    except (OSError, ValueError) as e:
+        logger.debug("LAN discovery failed: %s", e)
+    return peers
+
+
+def peer_url(peer):
+    """
+    http://host:port for a "host", "host:port", IPv6 address or URL from
+    the settings; PEER_PORT when none is given. Raises ValueError for an
+    entry that isn't a usable address.
+    """
+    peer = peer.strip().rstrip("/")
+    if "://" not in peer:
+        try:
+            # A bare IPv6 literal: its colons aren't a port
+            ipaddress.ip_address(peer.split("%", 1)[0])
+            if ":" in peer:
+                peer = f"[{peer}]"
+        except ValueError:
+            pass
+        peer = "http://" + peer
+    parts = urlsplit(peer)
+    if not parts.hostname:
+        raise ValueError(f"no host in {peer!r}")
+    netloc = parts.netloc.replace("%25", "%").replace("%", "%25") # zone ids are escaped in URLs
+    if parts.port is None:
+        netloc = f"{netloc}:{PEER_PORT}"
+    return urlunsplit((parts.scheme, netloc, parts.path, "", ""))
+
+
+class PeerCache:
+    """
+    Fetches files by sha1 from LAN peers before anyone goes to the internet.
+
+    Peers come from the "lan_peers" setting and, with discovery on, from a
+    UDP broadcast that is repeated every DISCOVERY_INTERVAL seconds. Each
+    one is health-tracked like a mirror: a peer that errors or sends a file
+    that doesn't hash to what was asked for is skipped for a while. Files
+    are written to a temporary file and only moved into place once their
+    sha1 matches, so a peer can never put a bad file on disk.
+
+    Peers are fetched over a connection pool of their own that ignores the
+    proxy settings: a corporate proxy can't reach addresses on the LAN.
+    """
+
+    def __init__(self, enabled=False, peers=(), discovery=True, http=None):
+        self._http = http
+        self._http_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._peers = {} # base URL -> Mirror, kept so health survives reconfiguring
+        self._discovered = []
+        self._discovered_at = None
+        self.configure(enabled, peers, discovery)
+
+    def configure(self, enabled, peers=(), discovery=True):
+        self.enabled = enabled
+        self.static = []
+        for peer in peers:
+            try:
+                self.static.append(peer_url(peer))
+            except ValueError as e:
+                logger.warning("Ignoring LAN peer %r: %s", peer, e)
+        self.discovery = discovery
+
+    @property
+    def http(self):
+        with self._http_lock:
+            if self._http is None:
+                self._http = Http11Transport(
+                    PEER_POOL_HOSTS, PEER_POOL_CONNECTIONS_PER_HOST, {"User-Agent": USER_AGENT}, trust_env=False
+                )
+            return self._http
+
+    def peers(self):
+        """Peers to ask, healthy ones first; may run a discovery broadcast."""
+        if not self.enabled:
+            return []
+        with self._lock:
+            now = time.monotonic()
+            if self.discovery and (self._discovered_at is None or now - self._discovered_at > DISCOVERY_INTERVAL):
+                self._discovered = discover()
+                self._discovered_at = time.monotonic()
+                if self._discovered:
+                    logger.info("Found LAN peers: %s", ", ".join(self._discovered))
+            bases = list(dict.fromkeys(self.static + self._discovered))
+            peers = [self._peers.setdefault(base, Mirror(base)) for base in bases]
+        return sorted(peers, key=lambda peer: peer.down_until)
+
+    def download(self, sha1, path, checkpoint=None):
+        """
+        Try to fetch the file with this sha1 from a peer into path.
+        Returns the number of bytes written, or None if no peer had it.
+        checkpoint, if given, is called between chunks.
+        """
+        import requests
+
+        now = time.monotonic()
+        for peer in self.peers():
+            if peer.down_until > now:
+                continue
+            try:
+                size = self._download_from(peer, sha1, path, checkpoint)
+            except (requests.RequestException, OSError, ValueError) as e:
+                logger.debug("Peer %s failed for %s: %s", peer.base, sha1, e)
+                with self._lock:
+                    peer.record_failure()
+                continue
+            with self._lock:
+                peer.record_success()
+            if size is not None:
+                return size
+        return None
+
+    def _download_from(self, peer, sha1, path, checkpoint):
+        response = self.http.request("GET", f"{peer.base}/sha1/{sha1}", stream=True, timeout=PEER_TIMEOUT)
+        try:
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".peer-", suffix=".part", dir=directory)
+            try:
+                digest = hashlib.sha1()
+                size = 0
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        if checkpoint is not None:
+                            checkpoint()
+                        f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+                if digest.hexdigest() != sha1:
+                    logger.warning("Peer %s sent a corrupt copy of %s", peer.base, sha1)
+                    raise ValueError(f"checksum mismatch from {peer.base}")
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+        finally:
+            response.close()
+        return size
+
+
+def _client_config_from_settings():
+    return (
+        settings_store.get("lan_cache_client", False),
+        settings_store.get("lan_peers", []),
+        settings_store.get("lan_discovery", True),
+    )
+
+
+peer_cache = PeerCache(*_client_config_from_settings())
+peer_server = None
+_server_config = None
+_server_managed = False
+_server_lock = threading.Lock()
+
+
+def _server_config_from_settings():
+    allow = settings_store.get("lan_cache_allow")
+    return (
+        settings_store.get("lan_cache_port", PEER_PORT),
+        settings_store.get("lan_cache_bind", ""),
+        tuple(allow) if allow is not None else None,
+    )
+
+
+def update_server():
+    """
+    Start or stop this launcher's PeerServer to match the
+    "lan_cache_server" setting, listening as "lan_cache_port" and
+    "lan_cache_bind" say and answering the networks in "lan_cache_allow"
+    (private addresses when unset). Once called, later changes to those
+    settings are applied as they happen.
+    """
+    global peer_server, _server_config, _server_managed
+    with _server_lock:
+        _server_managed = True
+        enabled = settings_store.get("lan_cache_server", False)
+        config = _server_config_from_settings()
+        if peer_server is not None and (not enabled or config != _server_config):
+            peer_server.stop()
+            peer_server = None
+        if enabled and peer_server is None:
+            port, host, allow = config
+            try:
+                peer_server = PeerServer(
+                    port, host=host, allow=parse_networks(allow) if allow is not None else None
+                ).start()
+                _server_config = config
+            except OSError as e:
+                logger.warning("Could not start the LAN cache server on port %d: %s", port, e)
+
+
+def stop_server():
+    global peer_server, _server_managed
+    with _server_lock:
+        _server_managed = False
+        if peer_server is not None:
+            peer_server.stop()
+            peer_server = None
+
+
+def _on_setting_changed(key, value):
+    if key in ("lan_cache_client", "lan_peers", "lan_discovery"):
+        peer_cache.configure(*_client_config_from_settings())
+    elif key in ("lan_cache_server", "lan_cache_port", "lan_cache_bind", "lan_cache_allow") and _server_managed:
+        update_server()
+
+
+settings_store.add_listener(_on_setting_changed)
@@ -0,0 +1,246 @@
+import time
+import threading
+from importlib.util import find_spec
+
+from ..bandwidth import limiter, install as install_bandwidth_limiter
+from ..logger import get_logger
+
+logger = get_logger("pymcl.net")
+
+HTTP1, HTTP2, AUTO = "http1", "http2", "auto"
+# Retries for connection errors and 502/503/504 on idempotent requests
+IDEMPOTENT_METHODS = ("GET", "HEAD")
+RETRIES = 2
+RETRY_BACKOFF = 0.3
+CHUNK_SIZE = 64 * 1024
+
+
+def http2_available():
+    """True if the optional httpx and h2 packages are installed."""
+    return find_spec("httpx") is not None and find_spec("h2") is not None
+
+
+def create_transport(name, pool_hosts, pool_size, headers):
+    """
+    Build the transport called name, falling back to HTTP/1.1.
+
+    AUTO picks HTTP/2 when httpx and h2 are installed. Servers that don't
+    negotiate h2 are still spoken to over HTTP/1.1 by the HTTP/2 transport.
+    Unknown names get HTTP/1.1, so a bad setting never breaks downloads.
+    """
+    if name in (AUTO, HTTP2):
+        if http2_available():
+            return Http2Transport(pool_hosts * pool_size, headers)
+        if name == HTTP2:
+            logger.warning("HTTP/2 transport needs httpx and h2 (pip install httpx[http2]); using HTTP/1.1")
+    elif name != HTTP1:
+        logger.warning("Unknown HTTP transport %r; using HTTP/1.1", name)
+    return Http11Transport(pool_hosts, pool_size, headers)
+
+
+class Http11Transport:
+    """
+    requests over a shared urllib3 pool of keep-alive HTTP/1.1 connections.
+
+    requests.Session is not documented as thread-safe, so each thread gets
+    its own light Session mounted on one shared HTTPAdapter, whose pool is.
+    With trust_env=False the proxy environment variables are ignored.
+    """
+
+    name = HTTP1
+
+    def __init__(self, pool_hosts, pool_size, headers, trust_env=True):
+        import urllib3
+        import requests
+
+        install_bandwidth_limiter()
+        retry = urllib3.Retry(
+            total=RETRIES,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=IDEMPOTENT_METHODS,
+            raise_on_status=False,
+        )
+        self.adapter = requests.adapters.HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size, max_retries=retry)
+        # HttpClient picks mirrors itself; keep the mirrors hook off this pool
+        self.adapter.mirrored = True
+        self.headers = headers
+        self.trust_env = trust_env
+        self._local = threading.local()
+
+    @property
+    def session(self):
+        """This thread's Session, sharing the transport's connection pool."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            import requests
+
+            session = requests.Session()
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+            session.headers.update(self.headers)
+            session.trust_env = self.trust_env
+            self._local.session = session
+        return session
+
+    def request(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def close(self):
+        self.adapter.close()
+
+
+class Http2Transport:
+    """
+    httpx with HTTP/2 enabled: requests to the same host are multiplexed as
+    concurrent streams over one connection instead of queueing for a slot
+    in a per-host pool. Hosts that don't offer h2 over ALPN get HTTP/1.1.
+
+    With prior_knowledge, plain http:// URLs speak h2c directly (used by
+    the benchmarks against a local server; real CDNs negotiate over TLS).
+
+    Responses are wrapped in Http2Response, which mimics the parts of
+    requests.Response the launcher uses and raises requests' exceptions,
+    so callers don't care which transport they got.
+
+    httpcore's sync HTTP/2 connection takes a stream id before it takes the
+    write lock, so threads sharing a connection can occasionally send
+    headers out of order and have the server drop it, failing every stream
+    in flight. Idempotent requests that fail to get a response are retried
+    like the HTTP/1.1 transport's, on a fresh connection.
+    """
+
+    name = HTTP2
+
+    def __init__(self, max_connections, headers, prior_knowledge=False):
+        import httpx
+
+        self.httpx = httpx
+        options = {
+            "http1": not prior_knowledge,
+            "http2": True,
+            "limits": httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        }
+        # The client-level options apply to the transports httpx creates for
+        # proxies from the environment, which replace ours for proxied hosts
+        self.client = httpx.Client(headers=headers, transport=httpx.HTTPTransport(**options), **options)
+
+    def request(self, method, url, stream=False, timeout=None, **kwargs):
+        if isinstance(timeout, tuple):
+            timeout = self.httpx.Timeout(timeout[1], connect=timeout[0])
+        follow_redirects = kwargs.pop("allow_redirects", True)
+        retries = RETRIES if method.upper() in IDEMPOTENT_METHODS else 0
+        with _mapped_errors(self.httpx):
+            request = self.client.build_request(method, url, timeout=timeout, **kwargs)
+            for attempt in range(retries + 1):
+                try:
+                    response = self.client.send(request, stream=True, follow_redirects=follow_redirects)
+                    break
+                except self.httpx.TimeoutException:
+                    raise
+                except self.httpx.TransportError as e:
+                    if attempt == retries:
+                        raise
+                    logger.debug("Retrying %s %s after %s", method, url, e)
+                    time.sleep(RETRY_BACKOFF * 2 ** attempt)
+        response = Http2Response(response, self.httpx)
+        if not stream:
+            # Read the body now, like requests does, and hand back the connection
+            response.content
+        return response
+
+    def close(self):
+        self.client.close()
+
+
+class Http2Response:
+    """The subset of requests.Response used by the launcher, over an httpx response."""
+
+    def __init__(self, response, httpx):
+        self._response = response
+        self._httpx = httpx
+        self._content = None
+
+    @property
+    def status_code(self):
+        return self._response.status_code
+
+    @property
+    def headers(self):
+        return self._response.headers
+
+    @property
+    def url(self):
+        return str(self._response.url)
+
+    @property
+    def http_version(self):
+        return self._response.http_version
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def iter_content(self, chunk_size=CHUNK_SIZE):
+        # The requests transport is throttled by the adapter hook; do the same here
+        with _mapped_errors(self._httpx):
+            for chunk in self._response.iter_bytes(chunk_size):
+                limiter.throttle(len(chunk))
+                yield chunk
+
+    @property
+    def content(self):
+        if self._content is None:
+            try:
+                self._content = b"".join(self.iter_content())
+            finally:
+                self._response.close()
+        return self._content
+
+    @property
+    def text(self):
+        return self.content.decode(self._response.encoding or "utf-8", errors="replace")
+
+    def json(self, **kwargs):
+        import json
+        import requests
+
+        try:
+            return json.loads(self.content, **kwargs)
+        except json.JSONDecodeError as e:
+            # requests' version is also a RequestException
+            raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests
+
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.HTTPError(
+                f"{self.status_code} {kind} Error: {self._response.reason_phrase} for url: {self.url}",
+                response=self,
+            )
+
+    def close(self):
+        self._response.close()
+
+
+class _mapped_errors:
+    """Re-raise httpx errors as the matching requests exceptions."""
+
+    def __init__(self, httpx):
+        self.httpx = httpx
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None or not issubclass(exc_type, self.httpx.HTTPError):
+            return False
+        import requests
+
+        if issubclass(exc_type, self.httpx.TimeoutException):
+            raise requests.Timeout(str(exc)) from exc
+        if issubclass(exc_type, self.httpx.TransportError):
+            raise requests.ConnectionError(str(exc)) from exc
+        raise requests.RequestException(str(exc)) from exc
@@ -0,0 +1,38 @@
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from .constants import MINECRAFT_DIR
+from .core.prefetch import Prefetcher as PrefetchService
+
+# How long after startup to wait before prefetching
+PREFETCH_DELAY_MS = 15000
+
+
+class Prefetcher(QObject):
+    """
+    Runs a pymcl.core Prefetcher on a worker thread for the window's
+    background downloads; see there for what gets fetched.
+
+    pause(), resume() and stop() may be called from any thread.
+    """
+
+    status = pyqtSignal(str)
+    finished = pyqtSignal(int, int) # files downloaded, bytes downloaded
+
+    def __init__(self, versions, minecraft_dir=MINECRAFT_DIR, http=None, peers=None, peers_only=False):
+        super().__init__()
+        self.service = PrefetchService(
+            versions, minecraft_dir, http=http, peers=peers, peers_only=peers_only, status=self.status.emit
+        )
+
+    def pause(self):
+        self.service.pause()
+
+    def resume(self):
+        self.service.resume()
+
+    def stop(self):
+        self.service.stop()
+
+    @pyqtSlot()
+    def run(self):
+        self.finished.emit(*self.service.run())
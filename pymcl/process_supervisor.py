@@ -0,0 +1,192 @@
+import time
+from collections import deque
+
+from PyQt6.QtCore import QObject, QProcess, QTimer, pyqtSignal, pyqtSlot
+
+try:
+    import psutil
+except ImportError:
+    psutil = None # cpu/rss sampling is optional
+
+OUTPUT_BUFFER_LINES = 5000
+SAMPLE_INTERVAL_MS = 2000
+MAX_FINISHED_SESSIONS = 5
+SHUTDOWN_TIMEOUT_MS = 5000
+
+
+class GameSession(QObject):
+    """A single running game process and its buffered output."""
+
+    lines_received = pyqtSignal(int, list)
+    finished = pyqtSignal(int, int, bool)
+
+    def __init__(self, session_id, label, command, buffer_lines=OUTPUT_BUFFER_LINES, parent=None):
+        super().__init__(parent)
+        self.session_id = session_id
+        self.label = label
+        self.command = command
+        self.output = deque(maxlen=buffer_lines)
+        self.started_at = None
+        self.exit_code = None
+        self.crashed = False
+        self.cpu_percent = 0.0
+        self.rss = 0
+        self._partial = ""
+        self._ps_process = None
+
+        self.process = QProcess(self)
+        self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        self.process.readyReadStandardOutput.connect(self._read_output)
+        self.process.finished.connect(self._on_finished)
+        self.process.errorOccurred.connect(self._on_error)
+
+    def start(self):
+        self.started_at = time.time()
+        self.process.start(self.command[0], self.command[1:])
+
+    def pid(self):
+        return int(self.process.processId())
+
+    def is_running(self):
+        return self.process.state() != QProcess.ProcessState.NotRunning
+
+    def sample(self):
+        """Refresh cpu_percent/rss for this process. Returns False if unavailable."""
+        if psutil is None or not self.is_running():
+            return False
+        try:
+            if self._ps_process is None:
+                self._ps_process = psutil.Process(self.pid())
+                # The first cpu_percent() call only primes the counter
+                self._ps_process.cpu_percent(None)
+            self.cpu_percent = self._ps_process.cpu_percent(None)
+            self.rss = self._ps_process.memory_info().rss
+            return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+
+    @pyqtSlot()
+    def _read_output(self):
+        data = bytes(self.process.readAllStandardOutput()).decode("utf-8", errors="replace")
+        if not data:
+            return
+        chunks = (self._partial + data).split("\n")
+        self._partial = chunks.pop()
+        lines = [line.rstrip("\r") for line in chunks]
+        if lines:
+            self.output.extend(lines)
+            self.lines_received.emit(self.session_id, lines)
+
+    def _flush_partial(self):
+        if self._partial:
+            line = self._partial.rstrip("\r")
+            self._partial = ""
+            self.output.append(line)
+            self.lines_received.emit(self.session_id, [line])
+
+    @pyqtSlot(int, QProcess.ExitStatus)
+    def _on_finished(self, exit_code, exit_status):
+        self._read_output()
+        self._flush_partial()
+        self.exit_code = exit_code
+        self.crashed = exit_status == QProcess.ExitStatus.CrashExit or exit_code != 0
+        self.finished.emit(self.session_id, exit_code, self.crashed)
+
+    @pyqtSlot(QProcess.ProcessError)
+    def _on_error(self, error):
+        # finished() is not emitted when the process never started
+        if error == QProcess.ProcessError.FailedToStart:
+            self.output.append(f"Failed to start game process: {self.process.errorString()}")
+            self.exit_code = -1
+            self.crashed = True
+            self.finished.emit(self.session_id, -1, True)
+
+
+class ProcessSupervisor(QObject):
+    """
+    Runs game processes without blocking a thread per session.
+
+    Output is streamed into a bounded per-session buffer and re-emitted in
+    batches, exit codes and crashes are reported, and, when psutil is
+    installed, cpu/rss usage is sampled while any session is running.
+    """
+
+    session_started = pyqtSignal(int, str)     # session id, label
+    output_received = pyqtSignal(int, list)    # session id, lines
+    session_finished = pyqtSignal(int, int, bool) # session id, exit code, crashed
+    stats_updated = pyqtSignal(int, float, int) # session id, cpu percent, rss bytes
+
+    def __init__(self, parent=None, buffer_lines=OUTPUT_BUFFER_LINES):
+        super().__init__(parent)
+        self.buffer_lines = buffer_lines
+        self.sessions = {}
+        self._next_id = 1
+
+        self.sample_timer = QTimer(self)
+        self.sample_timer.setInterval(SAMPLE_INTERVAL_MS)
+        self.sample_timer.timeout.connect(self._sample)
+
+    def launch(self, command, label=""):
+        session_id = self._next_id
+        self._next_id += 1
+
+        session = GameSession(session_id, label, command, self.buffer_lines, self)
+        session.lines_received.connect(self.output_received)
+        session.finished.connect(self._on_session_finished)
+        self.sessions[session_id] = session
+
+        session.start()
+        self.session_started.emit(session_id, label)
+        if psutil is not None and not self.sample_timer.isActive():
+            self.sample_timer.start()
+        return session_id
+
+    def running_sessions(self):
+        return [s for s in self.sessions.values() if s.is_running()]
+
+    def has_running(self):
+        return bool(self.running_sessions())
+
+    def output(self, session_id):
+        session = self.sessions.get(session_id)
+        return list(session.output) if session else []
+
+    def kill(self, session_id):
+        session = self.sessions.get(session_id)
+        if session and session.is_running():
+            session.process.kill()
+
+    def shutdown(self, timeout_ms=SHUTDOWN_TIMEOUT_MS):
+        """
+        Stop every running game: ask it to exit, then kill whatever is still
+        running after timeout_ms. QProcess kills its child when it's
+        destroyed anyway, so this at least gives games a chance to save.
+        """
+        self.sample_timer.stop()
+        running = self.running_sessions()
+        for session in running:
+            session.process.terminate()
+        deadline = time.monotonic() + timeout_ms / 1000
+        for session in running:
+            remaining = max(0, int((deadline - time.monotonic()) * 1000))
+            if not session.process.waitForFinished(remaining):
+                session.process.kill()
+                session.process.waitForFinished(1000)
+
+    @pyqtSlot(int, int, bool)
+    def _on_session_finished(self, session_id, exit_code, crashed):
+        self.session_finished.emit(session_id, exit_code, crashed)
+
+        # Keep the output of a few finished sessions around for diagnosis
+        finished = [sid for sid, s in self.sessions.items() if not s.is_running()]
+        for sid in finished[:-MAX_FINISHED_SESSIONS]:
+            self.sessions.pop(sid).deleteLater()
+
+        if not self.has_running():
+            self.sample_timer.stop()
+
+    @pyqtSlot()
+    def _sample(self):
+        for session in self.running_sessions():
+            if session.sample():
+                self.stats_updated.emit(session.session_id, session.cpu_percent, session.rss)
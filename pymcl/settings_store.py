@@ -0,0 +1,143 @@
+import os
+import json
+import stat
+import atexit
+import tempfile
+import threading
+
+from .logger import get_logger
+
+SETTINGS_PATH = "pymcl/config/settings.json"
+SAVE_DELAY = 0.5
+
+logger = get_logger("pymcl")
+
+
+class SettingsStore:
+    """
+    In-memory copy of settings.json shared by the whole launcher.
+
+    The file is read once. Changes update the in-memory dict, notify
+    listeners and schedule a debounced write-behind; writes go to a temp
+    file in the same directory which then replaces settings.json, so a
+    crash mid-write can never leave a truncated file behind.
+    """
+
+    def __init__(self, path=SETTINGS_PATH, save_delay=SAVE_DELAY):
+        self.path = path
+        self.save_delay = save_delay
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._listeners = []
+        self._timer = None
+        self._dirty = False
+        self._data = self._load()
+        atexit.register(self.flush)
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+                return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error("Error loading settings from %s: %s", self.path, e)
+            return {}
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self._data.get(key, default)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def snapshot(self):
+        """Return a shallow copy of all settings."""
+        with self._lock:
+            return dict(self._data)
+
+    def set(self, key, value):
+        self.update({key: value})
+
+    def update(self, values):
+        """Apply several changes at once; listeners are only told about real changes."""
+        with self._lock:
+            changed = {k: v for k, v in values.items() if self._data.get(k, object()) != v}
+            if not changed:
+                return
+            self._data.update(changed)
+            self._dirty = True
+            self._schedule_save()
+            listeners = list(self._listeners)
+
+        for key, value in changed.items():
+            for listener in listeners:
+                try:
+                    listener(key, value)
+                except Exception as e:
+                    logger.error("Settings listener failed for %s: %s", key, e)
+
+    def add_listener(self, callback):
+        """Register callback(key, value), called on the thread that made the change."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def _schedule_save(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.save_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """Write pending changes to disk now."""
+        # Snapshot under the write lock, so a flush racing the debounce
+        # timer can't write an older snapshot over a newer one
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return
+                data = json.dumps(self._data, indent=4)
+                self._dirty = False
+
+            try:
+                self._atomic_write(data)
+            except OSError as e:
+                logger.error("Error saving settings to %s: %s", self.path, e)
+                with self._lock:
+                    self._dirty = True
+
+    def _atomic_write(self, data):
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".settings-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file 0600; keep whatever mode settings.json had
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(self.path).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+settings_store = SettingsStore()
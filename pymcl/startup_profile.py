@@ -0,0 +1,54 @@
+import time
+from contextlib import contextmanager
+
+# Taken as early as possible: pymcl.main imports this module first
+_START = time.perf_counter()
+
+
+class StartupProfiler:
+    """
+    Records wall time per named startup phase for --profile-startup.
+
+    Phases may nest; each is reported with its own duration and indented
+    under its parent. When disabled, phase() costs one attribute check.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.phases = [] # (depth, name, seconds)
+        self._depth = 0
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        index = len(self.phases)
+        self.phases.append((self._depth, name, 0.0))
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases[index] = (self.phases[index][0], name, time.perf_counter() - start)
+
+    @staticmethod
+    def now():
+        return time.perf_counter()
+
+    def mark(self, name, since=_START):
+        """Record a top-level phase measured from since (default: module import)."""
+        if self.enabled:
+            self.phases.append((self._depth, name, time.perf_counter() - since))
+
+    def report(self):
+        lines = ["Startup profile:"]
+        for depth, name, seconds in self.phases:
+            label = "  " * depth + name
+            lines.append(f"  {label:<40} {seconds * 1000:9.1f} ms")
+        lines.append(f"  {'total (to first paint)':<40} {(time.perf_counter() - _START) * 1000:9.1f} ms")
+        return "\n".join(lines)
+
+
+profiler = StartupProfiler()
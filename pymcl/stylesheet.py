@@ -73,6 +73,12 @@ QComboBox:focus {
 QComboBox:hover {
     border: 2px solid #505050;
 }
+QComboBox QLineEdit {
+    border: none;
+    background: transparent;
+    padding: 0;
+    min-height: 0;
+}
 QComboBox::drop-down {
     border: none;
     width: 30px;
@@ -209,6 +215,14 @@ QListWidget::item:selected {
     color: #ffffff;
 }
 
+QListView#log_view {
+    background-color: #141414;
+    border: 2px solid #3a3a3a;
+    border-radius: 8px;
+    padding: 5px;
+    font-size: 12px;
+}
+
 QWidget#main_central_widget {
     background: transparent;
 }
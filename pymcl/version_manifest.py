@@ -0,0 +1,146 @@
+import os
+import json
+import time
+import tempfile
+import threading
+
+from .constants import VERSIONS_CACHE_PATH
+from .settings_store import settings_store
+from .net import http_client
+from .logger import get_logger
+
+logger = get_logger("pymcl.install")
+
+VERSION_MANIFEST_URL = settings_store.get(
+    "version_manifest_url", "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
+)
+VERSION_MANIFEST_TTL = settings_store.get("version_manifest_ttl", 3600)
+
+# Manifest version types, newest category first
+RELEASE, SNAPSHOT, OLD_BETA, OLD_ALPHA = "release", "snapshot", "old_beta", "old_alpha"
+VERSION_TYPES = (RELEASE, SNAPSHOT, OLD_BETA, OLD_ALPHA)
+# Per-version metadata kept from the manifest
+VERSION_FIELDS = ("id", "type", "url", "time", "releaseTime", "sha1", "complianceLevel")
+
+
+class VersionManifestCache:
+    """
+    Local copy of the Mojang version manifest with full per-version metadata.
+
+    The manifest is kept in VERSIONS_CACHE_PATH together with the ETag and
+    Last-Modified validators from the last download. refresh() does nothing
+    while the copy is younger than ttl seconds and otherwise revalidates it
+    with a conditional request, so an unchanged manifest costs a 304. All
+    filtering by version type happens locally.
+    """
+
+    def __init__(self, path=VERSIONS_CACHE_PATH, url=VERSION_MANIFEST_URL, ttl=VERSION_MANIFEST_TTL, http=None):
+        self.path = path
+        self.url = url
+        self.ttl = ttl
+        self.http = http or http_client
+        self._lock = threading.Lock()
+        self._data = None
+
+    def load(self):
+        """Read the cache file once; returns False if there is no usable copy."""
+        with self._lock:
+            if self._data is not None:
+                return True
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                return False
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning("Error loading version cache: %s", e)
+                return False
+            # Older launchers stored a bare {"release_versions": [...]} here
+            if not isinstance(data, dict) or not isinstance(data.get("versions"), list):
+                return False
+            self._data = data
+            logger.debug("Loaded %d versions from cache", len(data["versions"]))
+            return True
+
+    def versions(self, types=(RELEASE,)):
+        """Version entries of the given types, newest first."""
+        with self._lock:
+            if self._data is None:
+                return []
+            return [v for v in self._data["versions"] if v.get("type") in types]
+
+    def ids(self, types=(RELEASE,)):
+        return [v["id"] for v in self.versions(types)]
+
+    def get(self, version_id):
+        with self._lock:
+            if self._data is None:
+                return None
+            return next((v for v in self._data["versions"] if v["id"] == version_id), None)
+
+    def latest(self, version_type=RELEASE):
+        with self._lock:
+            return (self._data or {}).get("latest", {}).get(version_type)
+
+    def is_fresh(self):
+        with self._lock:
+            return self._data is not None and time.time() - self._data.get("fetched_at", 0) < self.ttl
+
+    def refresh(self, force=False):
+        """
+        Bring the cache up to date. Blocking; call from a worker thread.
+
+        Returns True if the version list changed. Network and HTTP errors
+        propagate as requests.RequestException.
+        """
+        self.load()
+        if not force and self.is_fresh():
+            logger.debug("Version manifest is fresh, not refetching")
+            return False
+
+        headers = {}
+        with self._lock:
+            if self._data is not None:
+                if self._data.get("etag"):
+                    headers["If-None-Match"] = self._data["etag"]
+                if self._data.get("last_modified"):
+                    headers["If-Modified-Since"] = self._data["last_modified"]
+
+        response = self.http.get(self.url, headers=headers, timeout=15)
+        if response.status_code == 304:
+            logger.debug("Version manifest not modified")
+            with self._lock:
+                self._data["fetched_at"] = time.time()
+                data = dict(self._data)
+            self._save(data)
+            return False
+
+        response.raise_for_status()
+        manifest = response.json()
+        data = {
+            "fetched_at": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "latest": manifest.get("latest", {}),
+            "versions": [{k: v[k] for k in VERSION_FIELDS if k in v} for v in manifest.get("versions", [])],
+        }
+        with self._lock:
+            changed = self._data is None or [v["id"] for v in self._data["versions"]] != [v["id"] for v in data["versions"]]
+            self._data = data
+        self._save(data)
+        logger.info("Version manifest updated, %d versions", len(data["versions"]))
+        return changed
+
+    def _save(self, data):
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".versions-", suffix=".tmp", dir=directory)
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Error saving version cache: %s", e)
+
+
+version_manifest = VersionManifestCache()
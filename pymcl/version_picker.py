@@ -0,0 +1,133 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel, pyqtSlot
+from PyQt6.QtWidgets import QComboBox, QCompleter
+
+
+class VersionListModel(QAbstractListModel):
+    """
+    Version ids for the launch page picker, newest first.
+
+    set_versions() diffs against the current rows: versions released since
+    the last refresh are prepended with a single insert, an identical list
+    is a no-op, and only other changes (e.g. switching the type filter)
+    fall back to a model reset.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.entries = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return entry["id"]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            released = entry.get("releaseTime", "")[:10]
+            return f"{entry.get('type', '')} {released}".strip()
+        if role == Qt.ItemDataRole.UserRole:
+            return entry
+        return None
+
+    def ids(self):
+        return [entry["id"] for entry in self.entries]
+
+    def set_versions(self, entries):
+        """Apply a new version list. Returns True if the model had to be reset."""
+        old_ids = self.ids()
+        new_ids = [entry["id"] for entry in entries]
+        if new_ids == old_ids:
+            return False
+
+        added = len(new_ids) - len(old_ids)
+        if old_ids and added > 0 and new_ids[added:] == old_ids:
+            self.beginInsertRows(QModelIndex(), 0, added - 1)
+            self.entries[:0] = entries[:added]
+            self.endInsertRows()
+            return False
+
+        self.beginResetModel()
+        self.entries = list(entries)
+        self.endResetModel()
+        return True
+
+
+class VersionFilterProxy(QSortFilterProxyModel):
+    """Case-insensitive substring filter for type-ahead in the version picker."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filter_text = ""
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self.filter_text:
+            return True
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        return self.filter_text in (self.sourceModel().data(index) or "").lower()
+
+    def set_filter_text(self, text):
+        text = text.strip().lower()
+        if text != self.filter_text:
+            self.filter_text = text
+            self.invalidateFilter()
+
+
+class VersionComboBox(QComboBox):
+    """
+    Version picker backed by a VersionListModel with type-ahead.
+
+    Typing filters a popup through VersionFilterProxy (substring match, so
+    "20.4" finds "1.20.4"); text that is not a known version is reverted
+    when editing finishes, so currentText() is always a real version id.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.version_model = VersionListModel(self)
+        self.setModel(self.version_model)
+        self.setEditable(True)
+        self.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+
+        self.filter_proxy = VersionFilterProxy(self)
+        self.filter_proxy.setSourceModel(self.version_model)
+        completer = QCompleter(self.filter_proxy, self)
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setCompleter(completer)
+
+        self.last_valid_text = ""
+        self.currentIndexChanged.connect(self._remember_valid)
+        self.lineEdit().textEdited.connect(self._filter)
+        self.lineEdit().editingFinished.connect(self._revert_invalid)
+
+    def setPlaceholderText(self, text):
+        super().setPlaceholderText(text)
+        self.lineEdit().setPlaceholderText(text)
+
+    def set_versions(self, entries):
+        """Apply a new version list; see VersionListModel.set_versions."""
+        return self.version_model.set_versions(entries)
+
+    @pyqtSlot(str)
+    def _filter(self, text):
+        self.filter_proxy.set_filter_text(text)
+        if text:
+            self.completer().complete()
+
+    @pyqtSlot(int)
+    def _remember_valid(self, index):
+        if index >= 0:
+            self.last_valid_text = self.itemText(index)
+
+    @pyqtSlot()
+    def _revert_invalid(self):
+        text = self.currentText()
+        index = self.findText(text)
+        if index == -1:
+            index = self.findText(self.last_valid_text)
+        if index != self.currentIndex() or text != self.itemText(index):
+            self.setCurrentIndex(index)
+        self.filter_proxy.set_filter_text("")
@@ -3,8 +3,8 @@ import shutil
 import json
 import zipfile
 
-from PyQt6.QtCore import pyqtSignal, QSize, Qt, QThread, pyqtSlot, QPropertyAnimation, QEasingCurve, QPointF, QEvent
-from PyQt6.QtGui import QPixmap, QColor
+from PyQt6.QtCore import pyqtSignal, QSize, Qt, pyqtSlot, QPropertyAnimation, QEasingCurve, QPointF, QEvent, QTimer, QUrl
+from PyQt6.QtGui import QPixmap, QColor, QImage, QTextDocument
 from PyQt6.QtWidgets import (
     QListWidget,
     QWidget,
@@ -19,30 +19,44 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
 )
 
-import markdown
-
-from bs4 import BeautifulSoup
-
 from .constants import MODS_DIR, ICON_CACHE_DIR
 from .modrinth_client import ModrinthClient
-from .workers import ModDownloader, ProjectFetcher
+from .workers import ModDownloader, DescriptionFetcher
+from .description_cache import description_cache
 from .image_cache import ImageCache
+from .logger import get_logger
+
+logger = get_logger("pymcl.mods")
+
+# Description images are decoded off-thread and scaled to fit this box
+DESCRIPTION_IMAGE_SIZE = 760
+# Images arriving within this window are added in a single re-layout
+IMAGE_BATCH_MS = 100
 
 class ModDetailDialog(QDialog):
     def __init__(self, mod_data, modrinth_client: ModrinthClient, parent=None):
         super().__init__(parent)
         self.mod_data = mod_data
         self.modrinth_client = modrinth_client
-        self.fetcher_thread = None
         self.fetcher = None
         self.image_cache = ImageCache(self)
-        self.image_cache.image_downloaded.connect(self.on_image_downloaded)
+        self.image_cache.thumbnail_ready.connect(self.on_image_ready)
         self.html = ""
+        self.body_hash = None
+        self.image_urls = set()
+        self.image_positions = {} # url -> document positions of its <img>s
+        self.pending_images = {}
+
+        self.image_batch_timer = QTimer(self)
+        self.image_batch_timer.setSingleShot(True)
+        self.image_batch_timer.setInterval(IMAGE_BATCH_MS)
+        self.image_batch_timer.timeout.connect(self.flush_images)
 
         self.setWindowTitle(self.mod_data.get("title", "Mod Details"))
         self.setMinimumSize(800, 600)
 
         self.init_ui()
+        self.load_cached_description()
         self.fetch_description()
 
     def init_ui(self):
@@ -66,56 +80,102 @@ class ModDetailDialog(QDialog):
         close_button.clicked.connect(self.accept)
         layout.addWidget(close_button)
 
-    def fetch_description(self):
-        self.details_browser.setPlaceholderText("Loading description...")
+    def load_cached_description(self):
+        slug = self.mod_data.get("slug")
+        entry = description_cache.get(slug) if slug else None
+        if entry:
+            self.show_description(entry)
 
-        self.fetcher_thread = QThread()
-        self.fetcher = ProjectFetcher(self.modrinth_client, self.mod_data.get("slug"))
-        self.fetcher.moveToThread(self.fetcher_thread)
+    def fetch_description(self):
+        """Fetch the project in the background; a cached description stays up until it changes."""
+        if not self.html:
+            self.details_browser.setPlaceholderText("Loading description...")
 
-        self.fetcher_thread.started.connect(self.fetcher.run)
+        self.fetcher = DescriptionFetcher(self.modrinth_client, self.mod_data.get("slug"), self.body_hash)
         self.fetcher.finished.connect(self.on_description_fetched)
-
-        self.fetcher.finished.connect(self.fetcher_thread.quit)
-        self.fetcher.finished.connect(self.fetcher.deleteLater)
-        self.fetcher_thread.finished.connect(self.fetcher_thread.deleteLater)
-
-        self.fetcher_thread.start()
+        self.fetcher.start()
 
     @pyqtSlot(dict)
-    def on_description_fetched(self, project_data):
-        if project_data and "body" in project_data:
-            markdown_text = project_data["body"]
-            self.html = markdown.markdown(markdown_text)
-            self.details_browser.setHtml(self.html)
-            self.process_images()
-        else:
+    def on_description_fetched(self, entry):
+        if entry.get("unchanged"):
+            return
+        if entry:
+            self.show_description(entry)
+        elif not self.html:
             self.details_browser.setPlaceholderText("Failed to load description.")
 
-    def process_images(self):
-        soup = BeautifulSoup(self.html, "lxml")
-        for img in soup.find_all("img"):
-            url = img.get("src")
-            if url:
-                cached_path = self.image_cache.get_image(url)
-                if cached_path:
-                    self.rewrite_image_path(url, cached_path)
-
-    @pyqtSlot(str, str)
-    def on_image_downloaded(self, url, path):
-        self.rewrite_image_path(url, path)
-
-    def rewrite_image_path(self, url, path):
-        soup = BeautifulSoup(self.html, "lxml")
-        img_tags = soup.find_all('img', src=url)
-        for img in img_tags:
-            img['src'] = f"file:///{os.path.abspath(path)}"
-        self.html = str(soup)
+    def show_description(self, entry):
+        """
+        Lay out a rendered description once.
+
+        Images already in memory are registered as document resources
+        before layout; the rest get a blank placeholder and are swapped in
+        by flush_images as they arrive.
+        """
+        self.html = entry["html"]
+        self.body_hash = entry["body_hash"]
+        self.image_urls = set(entry["images"])
+        self.pending_images.clear()
+
+        placeholder = QImage(1, 1, QImage.Format.Format_ARGB32_Premultiplied)
+        placeholder.fill(Qt.GlobalColor.transparent)
+        for url in self.image_urls:
+            image = self.image_cache.get_thumbnail(url, DESCRIPTION_IMAGE_SIZE)
+            self.add_image_resource(url, image if image is not None else placeholder)
+
         self.details_browser.setHtml(self.html)
-        self.details_browser.reload()
+        self.image_positions = self.find_images()
+
+    def find_images(self):
+        """Document positions of every image, by URL, so arrivals can be re-laid out alone."""
+        positions = {}
+        block = self.details_browser.document().begin()
+        while block.isValid():
+            fragments = block.begin()
+            while not fragments.atEnd():
+                fragment = fragments.fragment()
+                char_format = fragment.charFormat()
+                if char_format.isImageFormat():
+                    url = char_format.toImageFormat().name()
+                    positions.setdefault(url, []).extend(range(fragment.position(), fragment.position() + fragment.length()))
+                fragments += 1
+            block = block.next()
+        return positions
+
+    def add_image_resource(self, url, image):
+        self.details_browser.document().addResource(
+            QTextDocument.ResourceType.ImageResource.value, QUrl(url), image
+        )
+
+    @pyqtSlot(str, QImage)
+    def on_image_ready(self, url, image):
+        if url not in self.image_urls:
+            return
+        if image.isNull():
+            # Failed; the blank placeholder stays
+            self.image_urls.discard(url)
+            return
+        self.pending_images[url] = image
+        if not self.image_batch_timer.isActive():
+            self.image_batch_timer.start()
+
+    @pyqtSlot()
+    def flush_images(self):
+        if not self.pending_images:
+            return
+        # Re-layout only the images that arrived, in place, instead of
+        # re-parsing the HTML or laying out the whole document again
+        document = self.details_browser.document()
+        for url, image in self.pending_images.items():
+            self.add_image_resource(url, image)
+            for position in self.image_positions.get(url, ()):
+                document.markContentsDirty(position, 1)
+        self.pending_images.clear()
+        self.details_browser.viewport().update()
 
 class ModListItem(QWidget):
     card_clicked = pyqtSignal(dict)
+    ICON_SIZE = 128
 
     def __init__(self, mod_data, modrinth_client: ModrinthClient, game_version: str | None, loader: str | None, parent=None):
         super().__init__(parent)
@@ -124,7 +184,6 @@ class ModListItem(QWidget):
         self.game_version = game_version
         self.loader = loader
         self.icon_path = None
-        self.downloader_thread = None
         self.downloader = None
 
         self.init_ui()
@@ -137,7 +196,7 @@ class ModListItem(QWidget):
         layout.setSpacing(10)
 
         self.icon_label = QLabel()
-        self.icon_label.setFixedSize(QSize(128, 128))
+        self.icon_label.setFixedSize(QSize(self.ICON_SIZE, self.ICON_SIZE))
         self.icon_label.setStyleSheet("background-color: #333;") # Placeholder
         layout.addWidget(self.icon_label, 0, Qt.AlignmentFlag.AlignCenter)
 
@@ -195,11 +254,27 @@ class ModListItem(QWidget):
         self.anim_offset.start()
         super().leaveEvent(event)
 
-    def set_icon(self, icon_path):
-        if icon_path:
-            self.icon_path = icon_path
-            pixmap = QPixmap(icon_path)
-            self.icon_label.setPixmap(pixmap.scaled(128, 128, aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio))
+    def set_icon(self, icon):
+        """
+        Set the card icon from a file path or a decoded QImage.
+
+        QImages from ImageCache.get_thumbnail are already scaled to
+        ICON_SIZE, so only the QPixmap conversion happens here.
+        """
+        if icon is None:
+            return
+        if isinstance(icon, QImage):
+            if icon.isNull():
+                return
+            pixmap = QPixmap.fromImage(icon)
+        else:
+            if not icon:
+                return
+            self.icon_path = icon
+            pixmap = QPixmap(icon)
+        if pixmap.width() > self.ICON_SIZE or pixmap.height() > self.ICON_SIZE:
+            pixmap = pixmap.scaled(self.ICON_SIZE, self.ICON_SIZE, aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio)
+        self.icon_label.setPixmap(pixmap)
 
     def mousePressEvent(self, event):
         if not self.download_button.underMouse():
@@ -235,18 +310,9 @@ class ModListItem(QWidget):
         self.download_button.setVisible(False)
         self.progress_bar.setVisible(True)
 
-        self.downloader_thread = QThread()
-        self.downloader = ModDownloader(url)
-        self.downloader.moveToThread(self.downloader_thread)
-
-        self.downloader_thread.started.connect(self.downloader.run)
+        self.downloader = ModDownloader(url, sha1=valid_file.get("hashes", {}).get("sha1"))
         self.downloader.finished.connect(self.on_download_finished)
-
-        self.downloader.finished.connect(self.downloader_thread.quit)
-        self.downloader.finished.connect(self.downloader.deleteLater)
-        self.downloader_thread.finished.connect(self.downloader_thread.deleteLater)
-
-        self.downloader_thread.start()
+        self.downloader.start()
 
     @pyqtSlot(bool, str)
     def on_download_finished(self, success, message):
@@ -289,10 +355,10 @@ class ModListWidget(QListWidget):
                         filename = os.path.basename(file_path)
                         dest_path = os.path.join(MODS_DIR, filename)
                         shutil.copy(file_path, dest_path)
-                        print(f"Copied mod {filename} to {MODS_DIR}")
+                        logger.info("Copied mod %s to %s", filename, MODS_DIR)
                         copied_count += 1
                     except Exception as e:
-                        print(f"Error copying mod {file_path}: {e}")
+                        logger.error("Error copying mod %s: %s", file_path, e)
 
         if copied_count > 0:
             self.mods_changed.emit()
@@ -1,164 +1,184 @@
 import os
-import subprocess
-import uuid
-import json
-from typing import cast
-import datetime
-import glob
-import hashlib
-
-import minecraft_launcher_lib
-import minecraft_launcher_lib.fabric
-import requests
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
-
-from .constants import (
-    MINECRAFT_DIR,
-    VERSIONS_CACHE_PATH,
-    DEFAULT_IMAGE_URL,
-    DEFAULT_IMAGE_PATH,
-    MODS_DIR,
-    ICON_CACHE_DIR,
+from abc import ABCMeta, abstractmethod
+
+from PyQt6.QtCore import QCoreApplication, QObject, pyqtSignal, pyqtSlot
+
+from .version_manifest import version_manifest
+from .core import (
+    job_pool,
+    background_pool,
+    prepare_launch,
+    download_mod,
+    update_mod,
+    check_updates,
+    fetch_description,
+    download_default_image,
+    LoaderInstallError,
 )
+from .logger import get_logger
+
+# Thin Qt adapters over pymcl.core: each worker runs one service call and
+# turns its callbacks and result into signals. start() runs it on the
+# shared job pool; the worker object stays on the thread that created it,
+# so its signals arrive there queued. run() can also be called directly.
+# The core services import minecraft_launcher_lib when first called, so it
+# loads on a pool thread rather than at startup; requests is loaded the same
+# way by the shared http_client.
+# Workers run as foreground traffic unless they say otherwise; see bandwidth.py.
+
+install_logger = get_logger("pymcl.install")
+net_logger = get_logger("pymcl.net")
+mods_logger = get_logger("pymcl.mods")
+
+
+class _AbstractQObjectMeta(type(QObject), ABCMeta):
+    pass
+
+
+class PooledWorker(QObject, metaclass=_AbstractQObjectMeta):
+    """
+    Base for workers run on a JobPool instead of a QThread of their own.
+
+    start() hands the worker to the application object, which keeps it
+    alive while the job runs; it is deleted on its own thread once run()
+    returns, so callers don't have to hold on to it. Subclasses implement
+    run(); one that doesn't can't be instantiated.
+    """
+    _job_done = pyqtSignal()
+    # Workers that mostly move background traffic use background_pool
+    pool = job_pool
+
+    def start(self, pool=None):
+        """Queue run() on pool (the worker's default pool if None); returns its Future."""
+        app = QCoreApplication.instance()
+        if app is not None and self.parent() is None:
+            self.setParent(app)
+        self._job_done.connect(self.deleteLater)
+        return (pool or self.pool).submit(self._run_job)
+
+    def _run_job(self):
+        try:
+            self.run()
+        finally:
+            self._job_done.emit()
 
+    @abstractmethod
+    def run(self):
+        """Do the job, reporting through the subclass's signals."""
 
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, datetime.datetime):
-            return o.isoformat()
-        return super().default(o)
 
+class VersionFetcher(PooledWorker):
+    finished = pyqtSignal(bool, bool, str) # list changed, success, message
 
-class VersionFetcher(QObject):
-    finished = pyqtSignal(list, bool, str)
+    def __init__(self, force=False):
+        super().__init__()
+        self.force = force
 
     @pyqtSlot()
     def run(self):
         try:
-            versions = minecraft_launcher_lib.utils.get_version_list()
-
-            try:
-                with open(VERSIONS_CACHE_PATH, "w") as f:
-                    json.dump(versions, f, cls=DateTimeEncoder)
-                print(f"Version list cached to {VERSIONS_CACHE_PATH}")
-            except Exception as e:
-                print(f"Failed to save version cache: {e}")
-
-            release_versions = [v["id"] for v in versions if v["type"] == "release"]
-            self.finished.emit(release_versions, True, "Versions loaded successfully.")
+            changed = version_manifest.refresh(force=self.force)
+            self.finished.emit(changed, True, "Versions loaded successfully.")
         except Exception as e:
             error_msg = f"Error fetching versions: {str(e)}"
-            print(error_msg)
-            self.finished.emit([], False, error_msg)
+            install_logger.error(error_msg)
+            self.finished.emit(False, False, error_msg)
 
 
-class ImageDownloader(QObject):
+class ImageDownloader(PooledWorker):
     finished = pyqtSignal(bool, str)
+    pool = background_pool
+
+    def __init__(self, http=None):
+        super().__init__()
+        self.http = http
 
     @pyqtSlot()
     def run(self):
         try:
-            print(f"Downloading default image from {DEFAULT_IMAGE_URL}...")
-            response = requests.get(DEFAULT_IMAGE_URL)
-            response.raise_for_status()
-
-            with open(DEFAULT_IMAGE_PATH, "wb") as f:
-                f.write(response.content)
-
-            print(f"Image saved to {DEFAULT_IMAGE_PATH}")
-            self.finished.emit(True, DEFAULT_IMAGE_PATH)
+            self.finished.emit(True, download_default_image(self.http))
         except Exception as e:
             error_msg = f"Error downloading image: {str(e)}"
-            print(error_msg)
+            net_logger.error(error_msg)
             self.finished.emit(False, error_msg)
 
 
-class ModDownloader(QObject):
+class ModDownloader(PooledWorker):
+    """
+    Downloads a mod jar into MODS_DIR. With the file's sha1 (Modrinth
+    lists it) LAN peers are asked first and the download is verified.
+    """
     finished = pyqtSignal(bool, str)
 
-    def __init__(self, url):
+    def __init__(self, url, sha1=None, http=None, peers=None):
         super().__init__()
         self.url = url
+        self.sha1 = sha1
+        self.http = http
+        self.peers = peers
 
     @pyqtSlot()
     def run(self):
         try:
-            print(f"Downloading mod from {self.url}...")
-            response = requests.get(self.url)
-            response.raise_for_status()
-
-            filename = ""
-            if "content-disposition" in response.headers:
-                disp = response.headers["content-disposition"]
-                filename = disp.split("filename=")[-1].strip("'")
-
-            if not filename:
-                filename = self.url.split("/")[-1]
-
-            if not filename.endswith(".jar"):
-                if "?" in filename:
-                    filename = filename.split("?")[0]
-                if not filename.endswith(".jar"):
-                    filename = f"{filename.split('.')[0]}.jar"
-
-            save_path = os.path.join(MODS_DIR, filename)
-
-            with open(save_path, "wb") as f:
-                f.write(response.content)
-
-            print(f"Mod saved to {save_path}")
-            self.finished.emit(True, f"Downloaded '{filename}'")
+            path = download_mod(self.url, self.sha1, http=self.http, peers=self.peers)
+            self.finished.emit(True, f"Downloaded '{os.path.basename(path)}'")
         except Exception as e:
             error_msg = f"Error downloading mod: {str(e)}"
-            print(error_msg)
+            net_logger.error(error_msg)
             self.finished.emit(False, error_msg)
 
 
-class IconDownloader(QObject):
-    finished = pyqtSignal(str, str)
+class ModUpdater(PooledWorker):
+    """Replaces an installed jar with the primary file of a newer Modrinth version."""
+    finished = pyqtSignal(bool, str)
 
-    def __init__(self, url, mod_id):
+    def __init__(self, old_path, version, http=None, peers=None):
         super().__init__()
-        self.url = url
-        self.mod_id = mod_id
+        self.old_path = old_path
+        self.version = version
+        self.http = http
+        self.peers = peers
 
     @pyqtSlot()
     def run(self):
         try:
-            response = requests.get(self.url)
-            response.raise_for_status()
-
-            # Create a unique filename for the icon
-            filename = f"{self.mod_id}.png"
-            save_path = os.path.join(ICON_CACHE_DIR, filename)
-
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-
-            with open(save_path, "wb") as f:
-                f.write(response.content)
-            self.finished.emit(self.mod_id, save_path)
+            path = update_mod(self.old_path, self.version, http=self.http, peers=self.peers)
+            self.finished.emit(True, f"Updated to '{os.path.basename(path)}'")
         except Exception as e:
-            print(f"Error downloading icon: {e}")
-            self.finished.emit(self.mod_id, "")
+            error_msg = f"Error updating mod: {str(e)}"
+            mods_logger.error(error_msg)
+            self.finished.emit(False, error_msg)
 
 
-class ProjectFetcher(QObject):
+class DescriptionFetcher(PooledWorker):
+    """
+    Fetches a project and renders its description off the GUI thread.
+
+    finished carries the cache entry, {"unchanged": True} when the body
+    still matches known_hash, or {} when the fetch failed.
+    """
     finished = pyqtSignal(dict)
 
-    def __init__(self, modrinth_client, slug):
+    def __init__(self, modrinth_client, slug, known_hash=None):
         super().__init__()
         self.modrinth_client = modrinth_client
         self.slug = slug
+        self.known_hash = known_hash
 
     @pyqtSlot()
     def run(self):
-        project_data = self.modrinth_client.get_project(self.slug)
-        self.finished.emit(project_data)
+        try:
+            entry = fetch_description(self.modrinth_client, self.slug, self.known_hash)
+        except Exception as e:
+            mods_logger.warning("Error rendering the description of %s: %s", self.slug, e)
+            entry = {}
+        self.finished.emit(entry)
 
 
-class Worker(QObject):
+class Worker(PooledWorker):
     progress = pyqtSignal(int, int)
     status = pyqtSignal(str)
+    launch_ready = pyqtSignal(str, list) # version, command
     finished = pyqtSignal(bool, str)
 
     def __init__(self, version, options, mod_loader_type):
@@ -170,73 +190,31 @@ class Worker(QObject):
     @pyqtSlot()
     def run(self):
         try:
-            def set_status(text: str) -> None:
-                self.status.emit(text)
-
-            def set_progress(value: int, maximum: int = 100) -> None:
-                self.progress.emit(value, maximum)
-
-            self.version_to_launch = self.version
-
-            set_status(f"Installing Minecraft {self.version}...")
-            minecraft_launcher_lib.install.install_minecraft_version(
-                version=self.version,
-                minecraft_directory=MINECRAFT_DIR,
-                callback={"setStatus": set_status, "setProgress": set_progress},
-            )
-
-            if self.mod_loader_type != "Vanilla":
-                set_status(f"Installing {self.mod_loader_type}...")
-                try:
-                    if self.mod_loader_type == "Fabric":
-                        loader_version = minecraft_launcher_lib.fabric.get_latest_loader_version()
-                        set_status(f"Found Fabric Loader {loader_version}")
-                        minecraft_launcher_lib.fabric.install_fabric(
-                            minecraft_version=self.version,
-                            minecraft_directory=MINECRAFT_DIR,
-                            loader_version=loader_version,
-                            callback={"setStatus": set_status, "setProgress": set_progress},
-                        )
-                        self.version_to_launch = f"fabric-loader-{loader_version}-{self.version}"
-                    elif self.mod_loader_type in ["Forge", "NeoForge", "Quilt"]:
-                        raise Exception(f"{self.mod_loader_type} installation is not supported in this version of PyMCL due to library limitations. Please update your libraries or use Fabric.")
-
-                except Exception as loader_e:
-                    print(f"{self.mod_loader_type} install failed: {loader_e}")
-                    self.status.emit(f"{self.mod_loader_type} install failed: {loader_e}")
-                    self.finished.emit(False, f"{self.mod_loader_type} install failed: {loader_e}")
-                    return
-
-            set_progress(1, 1)
-
-            set_status("Getting launch command...")
-
-            # Clean up options, removing keys with None or empty values
-            # so that minecraft-launcher-lib can use its defaults.
-            cleaned_options = {k: v for k, v in self.options.items() if v}
-
-            command = minecraft_launcher_lib.command.get_minecraft_command(
-                version=self.version_to_launch,
-                minecraft_directory=MINECRAFT_DIR,
-                options=cleaned_options,
+            self.version_to_launch, command = prepare_launch(
+                self.version,
+                self.options,
+                self.mod_loader_type,
+                status=self.status.emit,
+                progress=self.progress.emit,
             )
 
-            set_status("Launching game...")
-            self.progress.emit(0, 0)
-            process = subprocess.Popen(command)
-            process.wait()
-
-            set_status("Game closed.")
-            self.finished.emit(True, "Game closed.")
+            # The process itself is owned by the ProcessSupervisor on the GUI
+            # thread, so this worker thread is released as soon as we hand off.
+            self.status.emit("Launching game...")
+            self.launch_ready.emit(self.version_to_launch, command)
+            self.finished.emit(True, "Game launched.")
 
+        except LoaderInstallError as e:
+            self.status.emit(str(e))
+            self.finished.emit(False, str(e))
         except Exception as e:
             error_msg = f"An error occurred: {str(e)}"
-            print(error_msg)
+            install_logger.error(error_msg)
             self.status.emit(error_msg)
             self.finished.emit(False, error_msg)
 
 
-class ModSearchWorker(QObject):
+class ModSearchWorker(PooledWorker):
     finished = pyqtSignal(list, int)
 
     def __init__(self, modrinth_client, query, game_versions, loader, limit, search_id):
@@ -259,11 +237,12 @@ class ModSearchWorker(QObject):
             )
             self.finished.emit(results, self.search_id)
         except Exception as e:
-            print(f"Search error: {e}")
+            net_logger.error("Search error: %s", e)
             self.finished.emit([], self.search_id)
 
-class UpdateCheckerWorker(QObject):
+class UpdateCheckerWorker(PooledWorker):
     finished = pyqtSignal(dict) # {file_path: new_version_obj}
+    pool = background_pool
 
     def __init__(self, modrinth_client):
         super().__init__()
@@ -271,45 +250,9 @@ class UpdateCheckerWorker(QObject):
 
     @pyqtSlot()
     def run(self):
-        print("UpdateCheckerWorker: Starting update check.")
-        jar_files = glob.glob(os.path.join(MODS_DIR, "*.jar"))
-        hashes = {} # {sha1: file_path}
-        
-        print(f"UpdateCheckerWorker: Found {len(jar_files)} jar files.")
-        for path in jar_files:
-            try:
-                sha1 = self._calculate_sha1(path)
-                hashes[sha1] = path
-                print(f"UpdateCheckerWorker: Hashed {os.path.basename(path)}: {sha1}")
-            except Exception as e:
-                print(f"UpdateCheckerWorker: Error hashing {path}: {e}")
-        
-        if not hashes:
-            print("UpdateCheckerWorker: No mods to check for updates.")
-            self.finished.emit({})
-            return
-
-        print(f"UpdateCheckerWorker: Sending {len(hashes)} hashes to Modrinth for update check.")
-        # Modrinth API allows bulk check
-        updates = self.client.get_updates(list(hashes.keys()))
-        print(f"UpdateCheckerWorker: Received update response from Modrinth. Found {len(updates)} updates.")
-        
-        # Map back to file paths: {file_path: new_version_data}
-        result = {}
-        for h, version in updates.items():
-             if h in hashes:
-                 result[hashes[h]] = version
-                 print(f"UpdateCheckerWorker: Update available for {os.path.basename(hashes[h])}")
-        
-        print(f"UpdateCheckerWorker: Update check finished. Total updates found: {len(result)}")
+        try:
+            result = check_updates(self.client)
+        except Exception as e:
+            mods_logger.error("Update check failed: %s", e)
+            result = {}
         self.finished.emit(result)
-
-    def _calculate_sha1(self, file_path):
-        sha1 = hashlib.sha1()
-        with open(file_path, 'rb') as f:
-            while True:
-                data = f.read(65536)
-                if not data:
-                    break
-                sha1.update(data)
-        return sha1.hexdigest()